@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+
+
+class AccountsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "accounts"
+
+    def ready(self):
+        from django.conf import settings
+        from django.db.models.signals import post_save
+        from backend.reference_cache import invalidate_on_change
+        from .etags import stamp_user_accounts
+        from .models import AccountType, Currency
+
+        invalidate_on_change(AccountType, "account_types")
+        invalidate_on_change(Currency, "currencies")
+        post_save.connect(stamp_user_accounts, sender=settings.AUTH_USER_MODEL, dispatch_uid="stamp_user_accounts")
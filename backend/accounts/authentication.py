@@ -1,9 +1,14 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework.authentication import CSRFCheck
 from rest_framework import exceptions
 from django.conf import settings
+from django.db import router
 from drf_spectacular.extensions import OpenApiAuthenticationExtension
 
+from users.auth_cache import get_auth_state
+from users.serializers import USER_CLAIMS
+
 class CookieJWTAuthentication(JWTAuthentication):
     def authenticate(self, request):
         access_token = request.COOKIES.get('access_token')
@@ -18,6 +23,37 @@ class CookieJWTAuthentication(JWTAuthentication):
         validated_token = self.get_validated_token(access_token)
         return self.get_user(validated_token), validated_token
 
+    def get_user(self, validated_token):
+        """
+        Build the user from the token claims when JWT_STATELESS_AUTH is on,
+        checking only the cached token version and active flag. Tokens
+        without the claims fall back to loading the user row.
+
+        The built user has the pk, username, is_staff, is_superuser and
+        is_active loaded, which covers the permission checks. Any other
+        field (email, names, groups and permissions for non-superusers)
+        costs a query on first access.
+        """
+        if not settings.JWT_STATELESS_AUTH or any(claim not in validated_token for claim in USER_CLAIMS):
+            return super().get_user(validated_token)
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        state = get_auth_state(user_id)
+        if state is None:
+            raise exceptions.AuthenticationFailed('User not found', code='user_not_found')
+        if state.token_version != validated_token['token_version']:
+            raise exceptions.AuthenticationFailed('Token has been revoked', code='token_revoked')
+        if not state.is_active:
+            raise exceptions.AuthenticationFailed('User is inactive', code='user_inactive')
+
+        # from_db() expects the values in model field order; fields missing
+        # from the claims are deferred and load on first access
+        claims = {claim: validated_token[claim] for claim in USER_CLAIMS}
+        claims[self.user_model._meta.pk.attname] = self.user_model._meta.pk.to_python(user_id)
+        field_names = [field.attname for field in self.user_model._meta.concrete_fields if field.attname in claims]
+        values = [claims[name] for name in field_names]
+        return self.user_model.from_db(router.db_for_read(self.user_model), field_names, values)
+
 class CookieJWTScheme(OpenApiAuthenticationExtension):
     target_class = 'accounts.authentication.CookieJWTAuthentication'
     name = 'jwtCookieAuth'
@@ -0,0 +1,77 @@
+"""
+Account deletion in the background.
+
+Deleting an account in the request would remove its whole transaction
+history in one statement, holding locks and the request for as long as
+that takes. schedule_deletion() only marks the account, which every
+per-user query filters out, and keeps its owner so the account can still
+be traced or restored until it is purged.
+purge_pending_accounts() then deletes the rows in small batches, each in
+its own database transaction, from the purge_deleted_accounts command.
+"""
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from transactions.models import DailyAccountCategoryTotal, Transaction
+from .models import Account, new_version
+
+# Account rows that can grow without bound, deleted in batches before the
+# account itself; the rest go with the account
+BATCHED_MODELS = (Transaction, DailyAccountCategoryTotal)
+
+
+def schedule_deletion(account):
+    Account.objects.filter(pk=account.pk).update(
+        deleted_at=timezone.now(),
+        version=new_version(),
+    )
+
+
+def purge_batch(batch_size):
+    """
+    Claim the oldest pending account no other worker holds and delete up
+    to batch_size of its batched rows, or the account itself once they are
+    gone. Returns (account_id, rows deleted), with account_id None when
+    nothing is pending.
+    """
+    with db_transaction.atomic():
+        account = (
+            Account.objects.select_for_update(skip_locked=True)
+            .filter(deleted_at__isnull=False)
+            .order_by('deleted_at', 'id')
+            .first()
+        )
+        if account is None:
+            return None, 0
+
+        for model in BATCHED_MODELS:
+            pks = list(
+                model.objects.filter(account_id=account.pk)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if pks:
+                # Nothing references these rows, so this is a plain DELETE;
+                # the account is going away, so the ledger is not told
+                model.objects.filter(pk__in=pks).delete()
+                return account.pk, len(pks)
+
+        # Budgets, goals and pending budget checks are few
+        deleted, _ = account.delete()
+        return account.pk, deleted
+
+
+def purge_pending_accounts(batch_size=1000):
+    """
+    Purge every account scheduled for deletion. Safe to run from several
+    workers at once. Returns (accounts, rows) counts.
+    """
+    accounts = set()
+    rows = 0
+    while True:
+        account_id, deleted = purge_batch(batch_size)
+        if account_id is None:
+            break
+        accounts.add(account_id)
+        rows += deleted
+    return len(accounts), rows
@@ -0,0 +1,94 @@
+"""
+ETags for the per-user account and transaction lists, computed from the
+account change stamps so a poll with a matching If-None-Match costs one
+indexed lookup instead of the list query and serialization.
+
+The stamps of the reference data nested in the responses are read in the
+same query. All stamps live in the database, so every worker process
+computes the same ETag.
+"""
+from django.db.models import BigIntegerField, Count, Max, Subquery, Sum
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from backend.reference_cache import reference_version
+from .models import Account, new_version
+from .serializers import UserBasicSerializer
+
+
+def _accounts_stamps():
+    return {
+        'count': Count('id'),
+        'total': Sum('version'),
+        # A scalar subquery; Max only lets it into the aggregate
+        'reference': Max(Subquery(
+            reference_version('currencies', 'account_types'), output_field=BigIntegerField()
+        )),
+    }
+
+
+def _format_accounts_etag(user, stamps):
+    return f'"accounts-{user.pk}-{stamps["count"]}-{stamps["total"] or 0}-{stamps["reference"] or 0}"'
+
+
+def accounts_etag(user):
+    stamps = Account.objects.filter(user=user, deleted_at__isnull=True).aggregate(**_accounts_stamps())
+    return _format_accounts_etag(user, stamps)
+
+
+async def aaccounts_etag(user):
+    stamps = await Account.objects.filter(user=user, deleted_at__isnull=True).aaggregate(**_accounts_stamps())
+    return _format_accounts_etag(user, stamps)
+
+
+def _account_version(user, account_id):
+    return (
+        Account.objects.filter(pk=account_id, user=user, deleted_at__isnull=True)
+        .annotate(reference=Subquery(reference_version('categories'), output_field=BigIntegerField()))
+        .values_list('version', 'reference')
+    )
+
+
+def _format_transactions_etag(account_id, stamps):
+    if stamps is None:
+        return None
+    version, reference = stamps
+    return f'"transactions-{account_id}-{version}-{reference or 0}"'
+
+
+def account_transactions_etag(user, account_id):
+    """
+    Return the ETag of an account's transaction list, or None when the user
+    has no such account.
+    """
+    return _format_transactions_etag(account_id, _account_version(user, account_id).first())
+
+
+async def aaccount_transactions_etag(user, account_id):
+    return _format_transactions_etag(account_id, await _account_version(user, account_id).afirst())
+
+
+def not_modified(request, etag):
+    """
+    Return a 304 response if the request's If-None-Match matches the ETag.
+    """
+    return get_conditional_response(request, etag=etag)
+
+
+def set_etag(response, etag):
+    response['ETag'] = etag
+    # Clients must revalidate before reusing their copy
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def stamp_user_accounts(sender, instance, created=False, update_fields=None, **kwargs):
+    """
+    Restamp a user's accounts when the user changes, since the account
+    list nests the owner's profile. Saves limited to other fields, such as
+    the last_login update on every login, leave the stamps alone.
+    """
+    if created:
+        return
+    if update_fields is not None and not update_fields & set(UserBasicSerializer.Meta.fields):
+        return
+    Account.objects.filter(user=instance).update(version=new_version())
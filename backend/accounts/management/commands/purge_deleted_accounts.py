@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from accounts.deletion import purge_pending_accounts
+
+
+class Command(BaseCommand):
+    help = 'Deletes the accounts scheduled for deletion together with their transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows to delete per database transaction',
+        )
+
+    def handle(self, *args, **options):
+        accounts, rows = purge_pending_accounts(options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Purged {accounts} accounts ({rows} rows)'
+        ))
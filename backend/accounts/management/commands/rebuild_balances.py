@@ -0,0 +1,53 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from accounts.models import Account, new_version
+from transactions.models import Transaction
+
+
+class Command(BaseCommand):
+    help = 'Recomputes every account balance from its opening balance and transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of accounts to recompute per aggregate query',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        account_ids = list(Account.objects.order_by('pk').values_list('pk', flat=True))
+        updated_count = 0
+
+        for start in range(0, len(account_ids), batch_size):
+            batch = account_ids[start:start + batch_size]
+            updated_count += self._rebuild_batch(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt balances for {updated_count} accounts'))
+
+    def _rebuild_batch(self, account_ids):
+        # Use transaction to keep writers out while the batch is recomputed
+        with transaction.atomic():
+            accounts = list(
+                Account.objects.select_for_update()
+                .filter(pk__in=account_ids)
+                .order_by('pk')
+                .only('pk', 'balance', 'opening_balance', 'version')
+            )
+            totals = dict(
+                Transaction.objects.filter(account_id__in=account_ids)
+                .values('account_id')
+                .annotate(total=Sum('amount'))
+                .values_list('account_id', 'total')
+            )
+            version = new_version()
+            for account in accounts:
+                account.balance = account.opening_balance + totals.get(account.pk, Decimal('0'))
+                account.version = version
+            Account.objects.bulk_update(accounts, ['balance', 'version'])
+        return len(accounts)
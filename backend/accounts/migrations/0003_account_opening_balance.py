@@ -0,0 +1,44 @@
+# Generated by Django 5.1.7 on 2026-10-17 16:40
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def materialize_balances(apps, schema_editor):
+    # Balances entered so far were never touched by transactions, so they
+    # become the opening balance that transactions are applied on top of
+    Account = apps.get_model("accounts", "Account")
+    Transaction = apps.get_model("transactions", "Transaction")
+
+    totals = (
+        Transaction.objects.filter(account=OuterRef("pk"))
+        .order_by()
+        .values("account")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    Account.objects.update(opening_balance=F("balance"))
+    Account.objects.update(
+        balance=F("opening_balance")
+        + Coalesce(
+            Subquery(totals, output_field=DecimalField(max_digits=12, decimal_places=2)),
+            Value(0, output_field=DecimalField(max_digits=12, decimal_places=2)),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_initial"),
+        ("transactions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="account",
+            name="opening_balance",
+            field=models.DecimalField(decimal_places=2, default=0.0, max_digits=12),
+        ),
+        migrations.RunPython(materialize_balances, migrations.RunPython.noop),
+    ]
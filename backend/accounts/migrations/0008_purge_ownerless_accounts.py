@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:40
+
+from django.db import migrations
+
+
+def purge_ownerless_accounts(apps, schema_editor):
+    # Accounts scheduled for deletion while the user column was cleared
+    # have no owner to restore, so finish their purge before the column
+    # becomes required again
+    Account = apps.get_model("accounts", "Account")
+    Account.objects.filter(user__isnull=True).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0007_reference_data_version"),
+        ("budgets", "0002_budget_indexes"),
+        ("notifications", "0005_pending_budget_check_version"),
+        ("transactions", "0006_transaction_description_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(purge_ownerless_accounts, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,30 @@
+import time
+
 from django.db import models
 from users.models import User
 
 
+def new_version():
+    """
+    Return a change stamp for Account.version: the current time in
+    microseconds, so stamps keep increasing across accounts and processes.
+    """
+    return time.time_ns() // 1000
+
+
+class ReferenceDataVersion(models.Model):
+    """
+    Change stamp of one kind of reference data (categories, currencies,
+    account types), bumped with every write to it. Kept in the database so
+    every worker process sees the same stamp (see backend.reference_cache).
+    """
+    namespace = models.CharField(max_length=50, unique=True)
+    version = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.namespace}: {self.version}"
+
+
 class Currency(models.Model):
     code = models.CharField(max_length=3, unique=True)
     name = models.CharField(max_length=50)
@@ -20,16 +43,47 @@ class AccountType(models.Model):
 
 
 class Account(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="accounts", db_index=True)
+    # User lookups use account_user_version_idx
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="accounts", db_index=False)
     account_type = models.ForeignKey(
         AccountType, on_delete=models.SET_NULL, null=True, related_name="accounts"
     )
     name = models.CharField(max_length=100)
+    # Maintained incrementally by transaction writes (see transactions.ledger)
     balance = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
+    opening_balance = models.DecimalField(max_digits=12, decimal_places=2, default=0.00)
     currency = models.ForeignKey(
         Currency, on_delete=models.SET_NULL, null=True, related_name="accounts"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Stamped on every write to the account or its transactions; backs the
+    # ETags of the account and transaction lists (see accounts.etags)
+    version = models.BigIntegerField(default=0)
+    # Set while the account waits for its rows to be purged (see
+    # accounts.deletion); per-user queries leave such accounts out
+    deleted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Covers the per-user change stamp lookup of the accounts list ETag
+            models.Index(fields=["user", "version"], name="account_user_version_idx"),
+            # Lets the purge find pending deletions; live accounts are left out
+            models.Index(
+                fields=["deleted_at", "id"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="account_pending_deletion_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The balance given on creation is the starting point for transactions
+        if self._state.adding and not self.opening_balance:
+            self.opening_balance = self.balance
+        self.version = new_version()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name} ({self.user.username})"
@@ -1,5 +1,8 @@
 from rest_framework import serializers
-from .models import Account, AccountType, Currency
+from backend.projections import ValuesSerializer, decimal_field
+from django.db import transaction
+from django.db.models import F
+from .models import Account, AccountType, Currency, new_version
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -22,6 +25,18 @@ class UserSerializer(serializers.ModelSerializer):
             'password': {'write_only': True}
         }
 
+class AdminUserSerializer(UserSerializer):
+    """
+    UserSerializer with the per-user account figures of the admin user list,
+    which the view attaches to each user of the page.
+    """
+    account_count = serializers.IntegerField(read_only=True)
+    transaction_count = serializers.IntegerField(read_only=True)
+    total_balance = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['account_count', 'transaction_count', 'total_balance']
+
 class UserBasicSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -36,5 +51,74 @@ class AccountSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Account
-        fields = ['id', 'name', 'balance', 'currency', 'account_type', 'user', 'currency_id', 'account_type_id']
-        read_only_fields = ['user']
+        fields = [
+            'id', 'name', 'balance', 'opening_balance', 'currency', 'account_type', 'user',
+            'currency_id', 'account_type_id',
+        ]
+        # balance is the opening balance plus every transaction; the opening
+        # balance moves only with manual balance edits
+        read_only_fields = ['user', 'opening_balance']
+
+    def update(self, instance, validated_data):
+        balance = validated_data.pop('balance', None)
+        with transaction.atomic():
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            if validated_data:
+                # Never write the balance column from a possibly stale instance
+                instance.save(update_fields=list(validated_data))
+
+            if balance is not None:
+                # A manual balance edit corrects the opening balance, so the
+                # transaction history stays reflected in the new figure
+                current = (
+                    Account.objects.select_for_update()
+                    .values_list('balance', flat=True)
+                    .get(pk=instance.pk)
+                )
+                difference = balance - current
+                Account.objects.filter(pk=instance.pk).update(
+                    balance=F('balance') + difference,
+                    opening_balance=F('opening_balance') + difference,
+                    version=new_version(),
+                )
+                instance.refresh_from_db(fields=['balance', 'opening_balance', 'version'])
+        return instance
+
+
+class AccountReadSerializer(ValuesSerializer):
+    """
+    AccountSerializer's output built from a values_list() projection.
+    """
+    lookups = (
+        'id', 'name', 'balance', 'opening_balance',
+        'currency_id', 'currency__code', 'currency__name', 'currency__symbol',
+        'account_type_id', 'account_type__name',
+        'user_id', 'user__username', 'user__email', 'user__first_name', 'user__last_name',
+    )
+    balance_field = decimal_field(Account, 'balance')
+
+    def to_representation(self, row):
+        return {
+            'id': row.id,
+            'name': row.name,
+            'balance': self.balance_field.to_representation(row.balance),
+            'opening_balance': self.balance_field.to_representation(row.opening_balance),
+            'currency': {
+                'id': row.currency_id,
+                'code': row.currency__code,
+                'name': row.currency__name,
+                'symbol': row.currency__symbol,
+            } if row.currency_id is not None else None,
+            'account_type': {
+                'id': row.account_type_id,
+                'name': row.account_type__name,
+            } if row.account_type_id is not None else None,
+            'user': {
+                'id': row.user_id,
+                'username': row.user__username,
+                'email': row.user__email,
+                'first_name': row.user__first_name,
+                'last_name': row.user__last_name,
+            },
+        }
@@ -1,11 +1,28 @@
+import json
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
+from datetime import date, datetime
 from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from backend.testing import QueryBudgetMixin
+from budgets.models import Budget, Goal
+from categories.models import Category
+from notifications.budget_alerts import process_pending_checks
+from notifications.models import Notification, PendingBudgetCheck
+from transactions.models import DailyAccountCategoryTotal, Transaction
+from transactions.recurring import materialize_due
+from .deletion import purge_pending_accounts
 from .models import Account, AccountType, Currency
+from .serializers import AccountReadSerializer, AccountSerializer
 
 User = get_user_model()
 
@@ -156,8 +173,414 @@ class AccountAPITest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_update_balance_adjusts_opening_balance(self):
+        token = self.get_user_token(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        # Simulate transactions having moved the balance since creation
+        Account.objects.filter(pk=self.account.pk).update(balance=Decimal('900.00'))
+
+        url = reverse('account-detail', args=[self.account.id])
+        response = self.client.patch(url, {'name': 'Renamed', 'balance': '1500.00'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.name, 'Renamed')
+        self.assertEqual(self.account.balance, Decimal('1500.00'))
+        self.assertEqual(self.account.opening_balance, Decimal('1600.00'))
+
+    def test_balance_includes_transactions_on_top_of_opening_balance(self):
+        token = self.get_user_token(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        for amount in ('-50.00', '20.00'):
+            Transaction.objects.create(
+                account=self.account, amount=Decimal(amount), transaction_date=datetime(2025, 1, 1, 12)
+            )
+
+        detail = self.client.get(reverse('account-detail', args=[self.account.id])).data
+        listed = self.client.get(reverse('account-list-create')).data[0]
+
+        for data in (detail, listed):
+            self.assertEqual(data['balance'], '970.00')
+            self.assertEqual(data['opening_balance'], '1000.00')
+
+        # The opening balance is not writable directly
+        self.client.patch(reverse('account-detail', args=[self.account.id]), {'opening_balance': '5.00'})
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.opening_balance, Decimal('1000.00'))
+
     def test_unauthorized_access(self):
         url = reverse('account-list-create')
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+class AccountQueryCountTest(QueryBudgetMixin, APITestCase):
+    # One query to load the authenticated user, one for the accounts
+    LIST_QUERY_BUDGET = 2
+    # Plus the change stamps behind the ETag of the user's own list
+    OWN_LIST_QUERY_BUDGET = 3
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.admin_user = User.objects.create_user(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123',
+            is_staff=True
+        )
+
+    def authenticate(self, user):
+        refresh = RefreshToken.for_user(user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def create_accounts(self, user, count):
+        # Each account gets its own currency and type so a per-row lookup would show up
+        for i in range(count):
+            number = Account.objects.count()
+            Account.objects.create(
+                user=user,
+                name=f'Account {number}',
+                currency=Currency.objects.create(code=f'C{number:02d}', name='Currency', symbol='$'),
+                account_type=AccountType.objects.create(name=f'Type {number}')
+            )
+
+    def test_account_list_query_count_is_constant(self):
+        self.authenticate(self.user)
+        url = reverse('account-list-create')
+        self.create_accounts(self.user, 1)
+        self.assertQueryBudget(self.OWN_LIST_QUERY_BUDGET, url)
+
+        self.create_accounts(self.user, 3)
+        response = self.assertQueryBudget(self.OWN_LIST_QUERY_BUDGET, url)
+        self.assertEqual(len(response.data), 4)
+
+    def test_admin_account_list_query_count_is_constant(self):
+        self.authenticate(self.admin_user)
+        url = reverse('admin-accounts')
+        self.create_accounts(self.user, 1)
+        self.assertQueryBudget(self.LIST_QUERY_BUDGET, url)
+
+        for i in range(5):
+            owner = User.objects.create_user(username=f'owner{i}', password='ownerpass123')
+            self.create_accounts(owner, 2)
+        response = self.assertQueryBudget(self.LIST_QUERY_BUDGET, url)
+        self.assertEqual(len(response.data['results']), 11)
+
+class ReferenceDataCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        Currency.objects.create(code='USD', name='US Dollar', symbol='$')
+        AccountType.objects.create(name='Checking')
+
+    def test_cached_currency_list_skips_list_query(self):
+        self.client.get(reverse('currencies'))
+        # Only the version stamp lookup runs
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('currencies'))
+        self.assertEqual(response.data[0]['code'], 'USD')
+
+    def test_etag_is_shared_by_processes(self):
+        etag = self.client.get(reverse('currencies'))['ETag']
+        # Another worker process starts with an empty local cache
+        cache.clear()
+
+        response = self.client.get(reverse('currencies'), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_changes_only_invalidate_their_own_list(self):
+        currencies_etag = self.client.get(reverse('currencies'))['ETag']
+        types_etag = self.client.get(reverse('account-types'))['ETag']
+
+        AccountType.objects.create(name='Savings')
+
+        response = self.client.get(reverse('currencies'), HTTP_IF_NONE_MATCH=currencies_etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(reverse('account-types'), HTTP_IF_NONE_MATCH=types_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+class AccountListConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=self.user, name='Test Account')
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.url = reverse('account-list-create')
+
+    def test_unchanged_accounts_return_not_modified_without_list_query(self):
+        etag = self.client.get(self.url)['ETag']
+
+        # The user lookup of the authentication and the change stamps
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etags_do_not_depend_on_process_cache(self):
+        accounts_etag = self.client.get(self.url)['ETag']
+        transactions_url = reverse('transaction-by-account')
+        transactions_etag = self.client.get(transactions_url, {'account_id': self.account.id})['ETag']
+        # A poll answered by another worker process, whose cache is empty
+        cache.clear()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=accounts_etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(
+            transactions_url, {'account_id': self.account.id}, HTTP_IF_NONE_MATCH=transactions_etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_reference_data_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        Currency.objects.create(code='EUR', name='Euro', symbol='€')
+        self.assertNotEqual(self.client.get(self.url)['ETag'], etag)
+
+    def test_account_writes_change_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(reverse('account-detail', args=[self.account.id]), {'name': 'Renamed'})
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['name'], 'Renamed')
+
+        etag = response['ETag']
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+    def test_balance_edit_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.client.patch(reverse('account-detail', args=[self.account.id]), {'balance': '50.00'})
+        self.assertNotEqual(self.client.get(self.url)['ETag'], etag)
+
+    def test_owner_profile_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        self.user.email = 'new@example.com'
+        self.user.save()
+        self.assertNotEqual(self.client.get(self.url)['ETag'], etag)
+
+    def test_login_keeps_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        update_last_login(None, self.user)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class AccountReadSerializerTest(TestCase):
+    def test_matches_model_serializer(self):
+        user = User.objects.create_user(username='testuser', password='testpass123', first_name='Test')
+        Account.objects.create(
+            user=user,
+            name='Checking',
+            balance=Decimal('10.5'),
+            currency=Currency.objects.create(code='EUR', name='Euro', symbol='€'),
+            account_type=AccountType.objects.create(name='Checking'),
+        )
+        # Without a currency or type the nested objects are null
+        Account.objects.create(user=user, name='Cash')
+        queryset = Account.objects.select_related('user', 'currency', 'account_type').order_by('id')
+
+        self.assertEqual(
+            AccountReadSerializer(AccountReadSerializer.project(queryset)).data,
+            json.loads(json.dumps(AccountSerializer(queryset, many=True).data)),
+        )
+
+
+class AccountDeletionTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.admin_user = User.objects.create_user(username='admin', password='adminpass123', is_staff=True)
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.kept = Account.objects.create(user=self.user, name='Savings')
+        self.category = Category.objects.create(name='Food', is_income=False)
+        self.budget = Budget.objects.create(
+            account=self.account, category=self.category, amount=Decimal('100.00'),
+            start_date=date(2025, 1, 1), end_date=date(2025, 1, 31),
+        )
+        Goal.objects.create(account=self.account, name='Trip', target_amount=Decimal('500.00'), due_date=date(2025, 6, 1))
+        self.notification = Notification.objects.create(user=self.user, message='Alert', budget=self.budget)
+        for account in (self.account, self.kept):
+            self.add_transactions(account, 5)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}')
+
+    def add_transactions(self, account, count):
+        for day in range(1, count + 1):
+            Transaction.objects.create(
+                account=account, category=self.category, amount=Decimal('-10.00'),
+                transaction_date=datetime(2025, 1, day, 12),
+            )
+
+    def test_delete_hides_account_at_once(self):
+        response = self.client.delete(reverse('account-detail', args=[self.account.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual([row['id'] for row in self.client.get(reverse('account-list-create')).data], [self.kept.id])
+        self.assertEqual(
+            self.client.get(reverse('account-detail', args=[self.account.id])).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        transactions = self.client.get(reverse('transaction-list')).data['results']
+        self.assertEqual({row['account'] for row in transactions}, {self.kept.id})
+        self.assertEqual(Transaction.objects.filter(account=self.account).count(), 5)
+
+    def test_delete_keeps_owner_and_hides_related_lists(self):
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.user_id, self.user.pk)
+        self.assertIsNotNone(self.account.deleted_at)
+        self.assertEqual(self.client.get(reverse('budget-list')).data, [])
+        self.assertEqual(self.client.get(reverse('goal-list')).data, [])
+        summary = self.client.get(reverse('transaction-summary')).data
+        self.assertEqual(summary['totals']['expenses'], '-50.00')
+        response = self.client.post(reverse('transaction-bulk-update'), {
+            'ids': [Transaction.objects.filter(account=self.kept).first().pk],
+            'changes': {'account': self.account.pk},
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_recurring_skips_pending_accounts(self):
+        for account in (self.account, self.kept):
+            Transaction.objects.create(
+                account=account, amount=Decimal('-5.00'), transaction_date=datetime(2025, 1, 1, 12),
+                frequency='monthly', next_due_date=date(2025, 2, 1),
+            )
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+
+        self.assertEqual(materialize_due(date(2025, 2, 1)), (1, 1))
+        self.assertEqual(Transaction.objects.filter(account=self.account).count(), 6)
+
+    def test_delete_cost_does_not_grow_with_history(self):
+        other = Account.objects.create(user=self.user, name='Other')
+        self.add_transactions(other, 25)
+        # The user lookup of the authentication, the account and one UPDATE
+        with self.assertNumQueries(3):
+            self.client.delete(reverse('account-detail', args=[self.account.id]))
+        with self.assertNumQueries(3):
+            self.client.delete(reverse('account-detail', args=[other.id]))
+
+    def test_admin_delete_schedules_deletion(self):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.admin_user).access_token}'
+        )
+        response = self.client.delete(reverse('admin-account-detail', args=[self.account.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual([row['id'] for row in self.client.get(reverse('admin-accounts')).data['results']], [self.kept.id])
+
+    def test_purge_deletes_rows_in_batches(self):
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+
+        accounts, rows = purge_pending_accounts(batch_size=2)
+
+        self.assertEqual(accounts, 1)
+        self.assertFalse(Account.objects.filter(pk=self.account.pk).exists())
+        for model in (Transaction, DailyAccountCategoryTotal, Budget, Goal, PendingBudgetCheck):
+            self.assertFalse(model.objects.filter(account_id=self.account.pk).exists(), model.__name__)
+        self.notification.refresh_from_db()
+        self.assertIsNone(self.notification.budget_id)
+        self.assertEqual(Transaction.objects.filter(account=self.kept).count(), 5)
+        self.assertEqual(purge_pending_accounts(), (0, 0))
+
+    def test_purge_command(self):
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+        out = StringIO()
+        call_command('purge_deleted_accounts', stdout=out)
+        self.assertIn('Purged 1 accounts', out.getvalue())
+        self.assertEqual(list(Account.objects.values_list('pk', flat=True)), [self.kept.pk])
+
+    def test_budget_alerts_skip_pending_accounts(self):
+        self.client.delete(reverse('account-detail', args=[self.account.id]))
+        Notification.objects.all().delete()
+        self.add_transactions(self.account, 10)
+
+        process_pending_checks()
+
+        self.assertFalse(Notification.objects.exists())
+
+
+class AdminListTest(APITestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username='admin', email='admin@example.com', password='adminpass123', is_staff=True
+        )
+        self.alice = User.objects.create_user(username='alice', email='alice@example.com', password='pass12345')
+        self.bob = User.objects.create_user(username='Bob', email='robert@example.org', password='pass12345')
+        category = Category.objects.create(name='Food', is_income=False)
+        for name, balance, transactions in (('Main', '100.00', 3), ('Savings', '250.50', 2)):
+            account = Account.objects.create(user=self.alice, name=name, balance=Decimal(balance))
+            for day in range(1, transactions + 1):
+                Transaction.objects.create(
+                    account=account, category=category, amount=Decimal('-1.00'),
+                    transaction_date=datetime(2025, 1, day, 12),
+                )
+        self.bob_account = Account.objects.create(user=self.bob, name='Wallet')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.admin_user).access_token}')
+
+    def test_user_list_includes_account_figures(self):
+        response = self.client.get(reverse('admin-users'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = {row['username']: row for row in response.data['results']}
+        self.assertEqual(
+            (rows['alice']['account_count'], rows['alice']['transaction_count'], rows['alice']['total_balance']),
+            (2, 5, '345.50'),
+        )
+        self.assertEqual(
+            (rows['Bob']['account_count'], rows['Bob']['transaction_count'], rows['Bob']['total_balance']),
+            (1, 0, '0.00'),
+        )
+        self.assertEqual(rows['admin']['account_count'], 0)
+
+    def test_user_list_query_count_does_not_grow_with_users(self):
+        url = reverse('admin-users')
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        for i in range(10):
+            owner = User.objects.create_user(username=f'owner{i}', password='pass12345')
+            Account.objects.create(user=owner, name='Main')
+        with self.assertNumQueries(len(context.captured_queries)):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data['results']), 13)
+
+    def test_user_list_pages_newest_first(self):
+        response = self.client.get(reverse('admin-users'), {'page_size': 2})
+
+        self.assertEqual([row['username'] for row in response.data['results']], ['Bob', 'alice'])
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual([row['username'] for row in next_page.data['results']], ['admin'])
+        self.assertIsNone(next_page.data['next'])
+
+    def test_search_matches_username_or_email_prefix(self):
+        url = reverse('admin-users')
+        self.assertEqual(
+            [row['username'] for row in self.client.get(url, {'search': 'bo'}).data['results']], ['Bob']
+        )
+        self.assertEqual(
+            [row['username'] for row in self.client.get(url, {'search': 'ROBERT@'}).data['results']], ['Bob']
+        )
+        self.assertEqual(self.client.get(url, {'search': 'lice'}).data['results'], [])
+
+        accounts = self.client.get(reverse('admin-accounts'), {'search': 'bob'}).data['results']
+        self.assertEqual([row['id'] for row in accounts], [self.bob_account.id])
+
+    def test_account_list_pages_by_id(self):
+        response = self.client.get(reverse('admin-accounts'), {'page_size': 2})
+
+        self.assertEqual(len(response.data['results']), 2)
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual([row['name'] for row in next_page.data['results']], ['Wallet'])
+
+    def test_created_user_is_returned_without_list_figures(self):
+        response = self.client.post(reverse('admin-users'), {
+            'username': 'carol', 'email': 'carol@example.com', 'password': 'pass12345',
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['username'], 'carol')
+        self.assertNotIn('account_count', response.data)
@@ -1,9 +1,18 @@
+from django.conf import settings
 from django.urls import path
-from .views import AccountListCreateView, AccountDetailView, AccountTypeListView, CurrencyListView
+from .views import (
+    AccountListCreateView,
+    AccountDetailView,
+    AccountTypeListView,
+    AsyncAccountListCreateView,
+    CurrencyListView,
+)
 from . import views
 
+list_create_view = AsyncAccountListCreateView if settings.ASYNC_VIEWS else AccountListCreateView
+
 urlpatterns = [
-    path('', AccountListCreateView.as_view(), name='account-list-create'),
+    path('', list_create_view.as_view(), name='account-list-create'),
     path('<int:pk>/', AccountDetailView.as_view(), name='account-detail'),
     path('types/', AccountTypeListView.as_view(), name='account-types'),
     path('currencies/', CurrencyListView.as_view(), name='currencies'),
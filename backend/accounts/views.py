@@ -1,18 +1,96 @@
+from decimal import Decimal
+
 from rest_framework import generics, permissions, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from .models import Account, AccountType, Currency
-from .serializers import AccountSerializer, AccountTypeSerializer, CurrencySerializer
+from .deletion import schedule_deletion
+from .serializers import AccountReadSerializer, AccountSerializer, AccountTypeSerializer, CurrencySerializer
 from .authentication import CookieJWTAuthentication
+from asgiref.sync import sync_to_async
+from backend.async_views import AsyncAPIView
+from backend.reference_cache import ReferenceCacheMixin
+from .etags import aaccounts_etag, accounts_etag, not_modified, set_etag
 from rest_framework.permissions import IsAdminUser
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
-from .serializers import UserSerializer
+from .serializers import AdminUserSerializer, UserSerializer
+from transactions.models import DailyAccountCategoryTotal
 from . import views
 
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from drf_spectacular.types import OpenApiTypes
 
 User = get_user_model()
 
+SEARCH_PARAMETER = OpenApiParameter(
+    name="search",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    description="Case-insensitive prefix of the username or email",
+    required=False
+)
+
+
+class AdminUserPagination(CursorPagination):
+    ordering = ('-date_joined', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class AdminAccountPagination(CursorPagination):
+    ordering = 'id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+def search_users(queryset, params, prefix=''):
+    """
+    Limit a queryset to users whose username or email starts with the
+    search parameter; prefix is the lookup path to the user.
+    On PostgreSQL both lookups use the users' prefix indexes.
+    """
+    search = params.get('search', '').strip()
+    if search:
+        queryset = queryset.filter(
+            Q(**{f'{prefix}username__istartswith': search})
+            | Q(**{f'{prefix}email__istartswith': search})
+        )
+    return queryset
+
+
+def user_account_stats(user_ids):
+    """
+    Return one row per given user that has accounts, with user_id,
+    account_count, transaction_count and total_balance, from one grouped
+    query over their accounts. Transaction counts come from the daily
+    totals, so they cost one index lookup per account rather than a scan
+    of its transactions.
+    """
+    transaction_counts = (
+        DailyAccountCategoryTotal.objects.filter(account=OuterRef('pk'))
+        .values('account')
+        .annotate(total=Sum('count'))
+        .values('total')
+    )
+    return (
+        Account.objects.filter(user_id__in=user_ids, deleted_at__isnull=True)
+        .annotate(
+            account_transactions=Coalesce(Subquery(transaction_counts, output_field=IntegerField()), Value(0))
+        )
+        .values('user_id')
+        .annotate(
+            account_count=Count('id'),
+            transaction_count=Sum('account_transactions'),
+            total_balance=Sum('balance'),
+        )
+        .order_by()
+    )
+
 @extend_schema(
     summary="List or create accounts",
     description="Get user's accounts or create new account (max 4 per user)",
@@ -34,11 +112,22 @@ class AccountListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         # Filter accounts by the authenticated user
-        return Account.objects.filter(user=self.request.user)
+        return Account.objects.filter(user=self.request.user, deleted_at__isnull=True).select_related(
+            'user', 'currency', 'account_type'
+        )
+
+    def list(self, request, *args, **kwargs):
+        # Answer unchanged polls before running the list query
+        etag = accounts_etag(request.user)
+        response = not_modified(request, etag)
+        if response is None:
+            rows = AccountReadSerializer.project(self.get_queryset())
+            response = Response(AccountReadSerializer(rows).data)
+        return set_etag(response, etag)
     
     def perform_create(self, serializer):
         # Check if user has reached account limit
-        user_account_count = Account.objects.filter(user=self.request.user).count()
+        user_account_count = Account.objects.filter(user=self.request.user, deleted_at__isnull=True).count()
         if user_account_count >= 4:
             from rest_framework.exceptions import PermissionDenied
             raise PermissionDenied(detail="You have reached the maximum limit of 4 accounts.")
@@ -46,11 +135,29 @@ class AccountListCreateView(generics.ListCreateAPIView):
         # Set the user to the authenticated user
         serializer.save(user=self.request.user)
 
+class AsyncAccountListCreateView(AsyncAPIView, AccountListCreateView):
+    """
+    AccountListCreateView with the list served through the async ORM.
+    Creation is rare and stays synchronous.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        etag = await aaccounts_etag(request.user)
+        response = not_modified(request, etag)
+        if response is None:
+            rows = [row async for row in AccountReadSerializer.project(self.get_queryset())]
+            response = Response(AccountReadSerializer(rows).data)
+        return set_etag(response, etag)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(self.create)(request, *args, **kwargs)
+
 @extend_schema(
     summary="Manage account",
     description="Get, update or delete specific account",
     responses={
         200: AccountSerializer,
+        202: OpenApiResponse(description="Account scheduled for deletion"),
         401: OpenApiResponse(description="Authentication required"),
         404: OpenApiResponse(description="Account not found"),
         400: OpenApiResponse(description="Validation errors")
@@ -66,45 +173,58 @@ class AccountDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_queryset(self):
         # Filter accounts by the authenticated user
-        return Account.objects.filter(user=self.request.user)
+        return Account.objects.filter(user=self.request.user, deleted_at__isnull=True).select_related(
+            'user', 'currency', 'account_type'
+        )
     
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
-        return Response({"message": "Account successfully deleted"}, status=status.HTTP_200_OK)
+        return Response({"message": "Account scheduled for deletion"}, status=status.HTTP_202_ACCEPTED)
+
+    def perform_destroy(self, instance):
+        # The account disappears now; purge_deleted_accounts removes its rows
+        schedule_deletion(instance)
 
 @extend_schema(
     summary="List account types",
     description="Get all available account types",
     responses={200: AccountTypeSerializer(many=True)}
 )
-class AccountTypeListView(generics.ListAPIView):
+class AccountTypeListView(ReferenceCacheMixin, generics.ListAPIView):
     """
     List all account types available in the system.
     """
     queryset = AccountType.objects.all()
     serializer_class = AccountTypeSerializer
     permission_classes = [permissions.AllowAny]
+    cache_namespace = "account_types"
 
 @extend_schema(
     summary="List currencies",
     description="Get all available currencies",
     responses={200: CurrencySerializer(many=True)}
 )
-class CurrencyListView(generics.ListAPIView):
+class CurrencyListView(ReferenceCacheMixin, generics.ListAPIView):
     """
     List all currencies available in the system.
     """
     queryset = Currency.objects.all()
     serializer_class = CurrencySerializer
     permission_classes = [permissions.AllowAny]
+    cache_namespace = "currencies"
 
 @extend_schema(
     summary="Admin: List or create users",
-    description="Admin endpoint to manage all users",
+    description=(
+        "Admin endpoint to manage all users. The list is paginated newest "
+        "first and includes each user's account count, transaction count "
+        "and total balance."
+    ),
+    parameters=[SEARCH_PARAMETER],
     responses={
-        200: UserSerializer(many=True),
-        201: UserSerializer,
+        200: AdminUserSerializer(many=True),
+        201: AdminUserSerializer,
         401: OpenApiResponse(description="Authentication required"),
         403: OpenApiResponse(description="Admin privileges required"),
         400: OpenApiResponse(description="Validation errors")
@@ -114,10 +234,23 @@ class AdminUserListCreateView(generics.ListCreateAPIView):
     """
     Admin view to list all users and create new users
     """
-    queryset = User.objects.all().order_by('-date_joined')
-    serializer_class = UserSerializer
+    serializer_class = AdminUserSerializer
     permission_classes = [IsAdminUser]
     authentication_classes = [CookieJWTAuthentication]
+    pagination_class = AdminUserPagination
+
+    def get_queryset(self):
+        return search_users(User.objects.all(), self.request.query_params)
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        stats = {row['user_id']: row for row in user_account_stats([user.pk for user in page])}
+        for user in page:
+            row = stats.get(user.pk, {})
+            user.account_count = row.get('account_count', 0)
+            user.transaction_count = row.get('transaction_count', 0)
+            user.total_balance = row.get('total_balance', Decimal('0.00'))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
 
     def perform_create(self, serializer):
         # Hash the password before saving
@@ -148,7 +281,8 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 @extend_schema(
     summary="Admin: List all accounts",
-    description="Admin endpoint to view all user accounts",
+    description="Admin endpoint to view all user accounts, paginated by account ID",
+    parameters=[SEARCH_PARAMETER],
     responses={
         200: AccountSerializer(many=True),
         401: OpenApiResponse(description="Authentication required"),
@@ -162,20 +296,25 @@ class AdminAccountListView(generics.ListAPIView):
     serializer_class = AccountSerializer
     permission_classes = [IsAdminUser]
     authentication_classes = [CookieJWTAuthentication]
+    pagination_class = AdminAccountPagination
 
     def get_queryset(self):
-        try:
-            # Use simple ordering by id instead of created_at
-            return Account.objects.all().select_related('user', 'currency', 'account_type').order_by('id')
-        except Exception as e:
-            # Fallback without select_related if there are issues
-            return Account.objects.all().order_by('id')
+        queryset = search_users(
+            Account.objects.filter(deleted_at__isnull=True), self.request.query_params, prefix='user__'
+        )
+        return queryset.select_related('user', 'currency', 'account_type')
+
+    def list(self, request, *args, **kwargs):
+        rows = AccountReadSerializer.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        return self.get_paginated_response(AccountReadSerializer(page).data)
 
 @extend_schema(
     summary="Admin: Manage account",
     description="Admin endpoint to view or delete any account",
     responses={
         200: AccountSerializer,
+        202: OpenApiResponse(description="Account scheduled for deletion"),
         401: OpenApiResponse(description="Authentication required"),
         403: OpenApiResponse(description="Admin privileges required"),
         404: OpenApiResponse(description="Account not found")
@@ -185,7 +324,7 @@ class AdminAccountDetailView(generics.RetrieveDestroyAPIView):
     """
     Admin view to retrieve or delete a specific account
     """
-    queryset = Account.objects.all()
+    queryset = Account.objects.filter(deleted_at__isnull=True).select_related('user', 'currency', 'account_type')
     serializer_class = AccountSerializer
     permission_classes = [IsAdminUser]
     authentication_classes = [CookieJWTAuthentication]
@@ -193,4 +332,8 @@ class AdminAccountDetailView(generics.RetrieveDestroyAPIView):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         self.perform_destroy(instance)
-        return Response({"message": "Account successfully deleted"}, status=status.HTTP_200_OK)
+        return Response({"message": "Account scheduled for deletion"}, status=status.HTTP_202_ACCEPTED)
+
+    def perform_destroy(self, instance):
+        # The account disappears now; purge_deleted_accounts removes its rows
+        schedule_deletion(instance)
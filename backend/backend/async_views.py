@@ -0,0 +1,42 @@
+"""
+Async request handling for DRF views.
+
+DRF dispatches synchronously, so under ASGI every view occupies a thread
+of the sync executor for its whole run. AsyncAPIView dispatches to async
+handlers instead, so they can await the async ORM. Authentication,
+permission and throttle checks may hit the database and still run
+through sync_to_async.
+
+Views using it must define every HTTP handler as a coroutine.
+"""
+import inspect
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # OPTIONS and the not-allowed handlers are inherited sync methods
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,233 @@
+"""
+Per-request performance instrumentation.
+
+PerformanceMiddleware measures each request's wall time, database query
+count and time, response rendering (serialization to bytes) time and
+response size. It reports them to the client in a Server-Timing header
+and aggregates them per view into histograms exposed in the Prometheus
+text format by metrics_view.
+
+Both are off unless PERFORMANCE_METRICS_ENABLED is set; the middleware
+then removes itself from the stack at startup. Outside DEBUG the metrics
+endpoint also needs METRICS_AUTH_TOKEN. Histograms live in the worker
+process, so a server with several workers exposes one set each.
+"""
+import threading
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotFound
+from django.utils.crypto import constant_time_compare
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAMS = {
+    'http_request_duration_seconds': ('Wall time of requests', DURATION_BUCKETS),
+    'http_request_db_queries': ('Database queries run per request', QUERY_COUNT_BUCKETS),
+    'http_request_db_duration_seconds': ('Time spent in database queries per request', DURATION_BUCKETS),
+    'http_request_render_duration_seconds': ('Time spent rendering responses', DURATION_BUCKETS),
+    'http_response_size_bytes': ('Size of non-streaming response bodies', SIZE_BUCKETS),
+}
+
+
+class QueryTimer:
+    """
+    Database execute wrapper that counts queries and sums their duration.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Thread-safe histograms and a request counter keyed by label values.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._requests = {}
+
+    def observe(self, name, labels, value):
+        buckets = HISTOGRAMS[name][1]
+        with self._lock:
+            series = self._histograms.setdefault((name, labels), [[0] * (len(buckets) + 1), 0.0, 0])
+            index = next((i for i, bound in enumerate(buckets) if value <= bound), len(buckets))
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count_request(self, labels):
+        with self._lock:
+            self._requests[labels] = self._requests.get(labels, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+
+    def render(self):
+        """
+        Return all metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            histograms = {key: (list(counts), total, count) for key, (counts, total, count) in self._histograms.items()}
+            requests = dict(self._requests)
+
+        lines = [
+            '# HELP http_requests_total Requests handled',
+            '# TYPE http_requests_total counter',
+        ]
+        for labels, count in sorted(requests.items()):
+            lines.append(f'http_requests_total{{{format_labels(labels)}}} {count}')
+
+        for name, (description, buckets) in HISTOGRAMS.items():
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+            for (series_name, labels), (counts, total, count) in sorted(histograms.items()):
+                if series_name != name:
+                    continue
+                label_text = format_labels(labels)
+                cumulative = 0
+                for bound, bucket_count in zip((*buckets, '+Inf'), counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label_text},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{{label_text}}} {total}')
+                lines.append(f'{name}_count{{{label_text}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    return ','.join(
+        f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for key, value in labels
+    )
+
+
+registry = MetricsRegistry()
+
+
+def wrap_queries(stack, wrapper):
+    """
+    Install wrapper on the calling thread's database connections until
+    stack closes.
+    """
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(wrapper))
+
+
+async def await_wrapped(stack, wrapper, response):
+    """
+    Await response with wrapper installed. Connections belong to the
+    thread that runs the ORM, which under ASGI is the request's
+    sync_to_async thread rather than the event loop.
+    """
+    await sync_to_async(wrap_queries)(stack, wrapper)
+    try:
+        return await response
+    finally:
+        await sync_to_async(stack.close)()
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    return match.view_name or match.route
+
+
+class PerformanceMiddleware:
+    """
+    Records request timings, adds a Server-Timing header and feeds the
+    metrics registry. Runs natively on both WSGI and ASGI stacks.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PERFORMANCE_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer = QueryTimer()
+        request._render_duration = 0.0
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            wrap_queries(stack, timer)
+            response = self.get_response(request)
+        return self.record(request, response, timer, started)
+
+    async def __acall__(self, request):
+        timer = QueryTimer()
+        request._render_duration = 0.0
+        started = time.perf_counter()
+        response = await await_wrapped(ExitStack(), timer, self.get_response(request))
+        return self.record(request, response, timer, started)
+
+    def record(self, request, response, timer, started):
+        duration = time.perf_counter() - started
+
+        view = view_label(request)
+        labels = (('view', view), ('method', request.method))
+        registry.count_request((*labels, ('status', response.status_code)))
+        registry.observe('http_request_duration_seconds', labels, duration)
+        registry.observe('http_request_db_queries', labels, timer.count)
+        registry.observe('http_request_db_duration_seconds', labels, timer.duration)
+        registry.observe('http_request_render_duration_seconds', labels, request._render_duration)
+        if not response.streaming:
+            registry.observe('http_response_size_bytes', labels, len(response.content))
+
+        response['Server-Timing'] = ', '.join([
+            f'total;dur={duration * 1000:.2f}',
+            f'db;dur={timer.duration * 1000:.2f};desc="{timer.count} queries"',
+            f'render;dur={request._render_duration * 1000:.2f}',
+        ])
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns; time it through the
+        # post-render callback
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._render_duration = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+def metrics_view(request):
+    """
+    Expose the collected metrics to a Prometheus scraper, which must send
+    METRICS_AUTH_TOKEN as a bearer token. Without a token the endpoint is
+    only served in DEBUG.
+    """
+    if not settings.PERFORMANCE_METRICS_ENABLED:
+        return HttpResponseNotFound()
+    token = settings.METRICS_AUTH_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponseNotFound()
+    elif not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4')
@@ -0,0 +1,43 @@
+"""
+Read-only serializers for hot list endpoints.
+
+A ValuesSerializer produces the same output as a ModelSerializer, but from
+values_list() rows that select only the columns the response needs,
+related names included through joins. Building each dict directly skips
+model instantiation and DRF's per-field machinery, which dominates the
+cost of long lists. Writes keep using the ModelSerializers.
+"""
+from rest_framework import serializers
+
+# Unbound DRF fields, used for the values whose formatting must match the
+# ModelSerializer output exactly
+DATETIME = serializers.DateTimeField()
+DATE = serializers.DateField()
+
+
+def decimal_field(model, field_name):
+    field = model._meta.get_field(field_name)
+    return serializers.DecimalField(max_digits=field.max_digits, decimal_places=field.decimal_places)
+
+
+class ValuesSerializer:
+    """
+    Subclasses list the query lookups in `lookups` and turn one named row
+    into the response dict in `to_representation`.
+    """
+    lookups = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @classmethod
+    def project(cls, queryset):
+        return queryset.values_list(*cls.lookups, named=True)
+
+    def to_representation(self, row):
+        raise NotImplementedError
+
+    @property
+    def data(self):
+        to_representation = self.to_representation
+        return [to_representation(row) for row in self.rows]
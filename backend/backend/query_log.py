@@ -0,0 +1,135 @@
+"""
+Slow and repeated query log.
+
+QueryLogMiddleware wraps every database query of a request. Queries
+slower than SLOW_QUERY_THRESHOLD_MS, and query shapes that run at least
+N_PLUS_ONE_THRESHOLD times in one request, are written as JSON lines to
+the backend.queries logger together with the view and the first project
+frame on the stack that issued them, e.g.
+transactions.serializers.TransactionSerializer.get_category_name:41.
+
+The middleware removes itself unless QUERY_LOG_ENABLED is set. It runs
+natively under both WSGI and ASGI.
+"""
+import json
+import logging
+import re
+import sys
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .instrumentation import await_wrapped, wrap_queries
+
+logger = logging.getLogger('backend.queries')
+
+# Modules that wrap queries rather than issue them
+WRAPPER_MODULES = {__name__, 'backend.instrumentation'}
+
+# Placeholder lists vary with the number of values, not the query shape
+PLACEHOLDER_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+
+
+def query_shape(sql):
+    return PLACEHOLDER_LIST.sub('(%s, ...)', sql)
+
+
+def app_frame():
+    """
+    Return 'module.qualname:line' for the innermost frame of project code
+    outside the query wrappers, or None when only libraries are involved.
+    """
+    root = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        module = frame.f_globals.get('__name__', '')
+        if filename.startswith(root) and 'site-packages' not in filename and module not in WRAPPER_MODULES:
+            return f'{module}.{frame.f_code.co_qualname}:{frame.f_lineno}'
+        frame = frame.f_back
+    return None
+
+
+def view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else None
+
+
+class QueryLogger:
+    """
+    Execute wrapper recording slow queries and counting query shapes for
+    one request.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.threshold = settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        self.shapes = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            shape = query_shape(sql)
+            seen = self.shapes.get(shape)
+            if seen is None:
+                # Repeats of a shape nearly always come from the same line,
+                # so the stack is only walked the first time
+                seen = self.shapes[shape] = [0, 0.0, app_frame()]
+            seen[0] += 1
+            seen[1] += duration
+            if duration >= self.threshold:
+                self.log('slow_query', sql=sql, duration_ms=round(duration * 1000, 2), frame=app_frame())
+
+    def log(self, event, **fields):
+        logger.warning(json.dumps({
+            'event': event,
+            'view': view_name(self.request),
+            'method': self.request.method,
+            'path': self.request.path,
+            **fields,
+        }))
+
+    def report_repeats(self):
+        for shape, (count, duration, frame) in self.shapes.items():
+            if count >= settings.N_PLUS_ONE_THRESHOLD:
+                self.log(
+                    'repeated_query',
+                    sql=shape,
+                    count=count,
+                    duration_ms=round(duration * 1000, 2),
+                    frame=frame,
+                )
+
+
+class QueryLogMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.QUERY_LOG_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        query_logger = QueryLogger(request)
+        with ExitStack() as stack:
+            wrap_queries(stack, query_logger)
+            response = self.get_response(request)
+        query_logger.report_repeats()
+        return response
+
+    async def __acall__(self, request):
+        query_logger = QueryLogger(request)
+        response = await await_wrapped(ExitStack(), query_logger, self.get_response(request))
+        query_logger.report_repeats()
+        return response
@@ -0,0 +1,94 @@
+"""
+Response cache for reference data that only changes through the admin or
+management commands (categories, currencies, account types).
+
+Each namespace has a version stamp in the database (ReferenceDataVersion)
+that model save and delete signals replace inside the writing transaction.
+Every worker process reads the same stamp, so responses cached under an
+older stamp are never read again and simply expire. The stamp also backs
+the ETag and Last-Modified headers, which lets clients revalidate without
+the list being serialized.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Func
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from accounts.models import ReferenceDataVersion, new_version
+
+
+def get_version(namespace):
+    """
+    Return the current version stamp of a namespace, starting one if the
+    namespace has none yet.
+    """
+    version = ReferenceDataVersion.objects.filter(namespace=namespace).values_list('version', flat=True).first()
+    if version is None:
+        ReferenceDataVersion.objects.bulk_create(
+            [ReferenceDataVersion(namespace=namespace, version=new_version())], ignore_conflicts=True
+        )
+        # Another process may have started the namespace first
+        version = ReferenceDataVersion.objects.values_list('version', flat=True).get(namespace=namespace)
+    return version
+
+
+def bump_version(namespace):
+    if not ReferenceDataVersion.objects.filter(namespace=namespace).update(version=new_version()):
+        get_version(namespace)
+
+
+def reference_version(*namespaces):
+    """
+    Expression for the combined stamp of namespaces, to fold into the query
+    computing an ETag. Stamps only grow, so the sum changes with any of them.
+    """
+    # Func rather than Sum, so the subquery gets no GROUP BY and stays scalar
+    return (
+        ReferenceDataVersion.objects.filter(namespace__in=namespaces)
+        .annotate(total=Func(F('version'), function='SUM'))
+        .values('total')
+    )
+
+
+def invalidate_on_change(model, namespace):
+    """
+    Bump the namespace version whenever a model instance is saved or deleted.
+    """
+    def bump(sender, **kwargs):
+        # Written in the same transaction as the change, so readers see the
+        # new stamp together with the new rows
+        bump_version(namespace)
+
+    post_save.connect(bump, sender=model, weak=False, dispatch_uid=f'refdata_{namespace}')
+    post_delete.connect(bump, sender=model, weak=False, dispatch_uid=f'refdata_{namespace}')
+
+
+class ReferenceCacheMixin:
+    """
+    List view mixin that serves the serialized list from the reference cache
+    and answers conditional requests with 304 Not Modified.
+    """
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        version = get_version(self.cache_namespace)
+        etag = f'"{self.cache_namespace}-{version}"'
+        # Stamps are in microseconds
+        last_modified = version // 1_000_000
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            key = f'refdata:{self.cache_namespace}:{version}:{request.get_full_path()}'
+            data = cache.get(key)
+            if data is None:
+                data = super().list(request, *args, **kwargs).data
+                cache.set(key, data, settings.REFERENCE_CACHE_TIMEOUT)
+            response = Response(data)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -40,6 +40,16 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    # orjson backed JSON when the package is installed, stdlib json otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'backend.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 
 }
 
@@ -71,6 +81,89 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
     'SLIDING_TOKEN_LIFETIME': timedelta(minutes=30),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
+
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.UserClaimsTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.UserClaimsTokenRefreshSerializer',
+}
+
+# Resolve request.user from access token claims instead of loading the user row
+JWT_STATELESS_AUTH = os.environ.get("JWT_STATELESS_AUTH", "true").lower() == "true"
+
+# Seconds a process trusts its cached token version and active flag of a user
+JWT_USER_CACHE_TTL = int(os.environ.get("JWT_USER_CACHE_TTL", 60))
+JWT_USER_CACHE_SIZE = int(os.environ.get("JWT_USER_CACHE_SIZE", 10000))
+
+# Rows validated and inserted per bulk_create call during statement imports
+TRANSACTION_IMPORT_BATCH_SIZE = int(os.environ.get("TRANSACTION_IMPORT_BATCH_SIZE", 1000))
+
+# Rows written per UPDATE or DELETE statement by the bulk transaction endpoints
+TRANSACTION_BULK_BATCH_SIZE = int(os.environ.get("TRANSACTION_BULK_BATCH_SIZE", 500))
+
+# Most transactions one bulk request may change; larger selections are rejected
+TRANSACTION_BULK_MAX_ROWS = int(os.environ.get("TRANSACTION_BULK_MAX_ROWS", 10000))
+
+# Rows fetched per database round trip while streaming exports
+TRANSACTION_EXPORT_CHUNK_SIZE = int(os.environ.get("TRANSACTION_EXPORT_CHUNK_SIZE", 2000))
+
+# Local memory by default; point REDIS_URL at a Redis-compatible server (needs
+# the redis package) to share cached responses between worker processes
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds cached reference data responses (categories, currencies, account
+# types) live. Their version stamps are kept in the database, so every
+# process sees a change at once.
+REFERENCE_CACHE_TIMEOUT = int(os.environ.get("REFERENCE_CACHE_TIMEOUT", 300))
+
+# Serve the hot read endpoints (accounts list, transactions by_account and
+# summary, auth/me) with async views. Only worth it under ASGI; under WSGI
+# every async view adds an event loop hop
+ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS", "false").lower() == "true"
+
+# Per-request timings in Server-Timing headers and Prometheus histograms at
+# /api/metrics/. Scrapers send METRICS_AUTH_TOKEN as a bearer token; without
+# one the endpoint answers 404 unless DEBUG is on
+PERFORMANCE_METRICS_ENABLED = os.environ.get("PERFORMANCE_METRICS_ENABLED", "false").lower() == "true"
+METRICS_AUTH_TOKEN = os.environ.get("METRICS_AUTH_TOKEN", "")
+
+# Log queries slower than SLOW_QUERY_THRESHOLD_MS and query shapes repeated
+# N_PLUS_ONE_THRESHOLD times in one request to a rotating JSON lines file
+QUERY_LOG_ENABLED = os.environ.get("QUERY_LOG_ENABLED", "false").lower() == "true"
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 100))
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", 5))
+QUERY_LOG_FILE = os.environ.get("QUERY_LOG_FILE", str(BASE_DIR / 'queries.log'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'query_log': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': QUERY_LOG_FILE,
+            'maxBytes': int(os.environ.get("QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024)),
+            'backupCount': int(os.environ.get("QUERY_LOG_BACKUP_COUNT", 5)),
+            # Only created once something is logged
+            'delay': True,
+        },
+    },
+    'loggers': {
+        'backend.queries': {
+            'handlers': ['query_log'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
 }
 
 SPECTACULAR_SETTINGS = {
@@ -107,6 +200,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the rest of the stack; removes itself
+    # when PERFORMANCE_METRICS_ENABLED is off
+    'backend.instrumentation.PerformanceMiddleware',
+    'backend.query_log.QueryLogMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -152,6 +249,32 @@ DATABASES = {
     }
 }
 
+# Set SQLITE_PATH to run locally, e.g. benchmarks, against a SQLite file
+if os.environ.get("SQLITE_PATH"):
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ["SQLITE_PATH"],
+    }
+
+# Keep database connections open between requests instead of connecting for
+# each one. With DB_POOL=true, PostgreSQL connections come from a psycopg
+# pool per worker process instead, which threaded and ASGI workers share.
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql' and \
+        os.environ.get("DB_POOL", "false").lower() == "true":
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            'max_size': int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+            'max_idle': float(os.environ.get("DB_POOL_MAX_IDLE", 300)),
+        },
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get("DB_CONN_MAX_AGE", 60))
+# Check reused connections, pooled ones included, before handing them out
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
 # Test database configuration
 if 'test' in sys.argv:
     DATABASES['default'] = {
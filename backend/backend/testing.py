@@ -0,0 +1,24 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """
+    Test mixin for asserting that an endpoint runs a fixed number of queries.
+
+    Call assertQueryBudget() before and after adding more rows; a list
+    endpoint without N+1 queries stays within the same budget either way.
+    """
+
+    def assertQueryBudget(self, budget, url, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, data)
+        executed = len(context.captured_queries)
+        if executed != budget:
+            queries = '\n'.join(
+                f'{i}. {query["sql"]}' for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(
+                f'{url} executed {executed} queries, expected {budget}:\n{queries}'
+            )
+        return response
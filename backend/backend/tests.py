@@ -0,0 +1,148 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+import json
+
+from accounts.models import Account
+from .instrumentation import PerformanceMiddleware, registry
+from .query_log import QueryLogMiddleware, query_shape
+
+User = get_user_model()
+
+
+@override_settings(PERFORMANCE_METRICS_ENABLED=True, METRICS_AUTH_TOKEN='scrape-secret', DEBUG=False)
+class PerformanceInstrumentationTest(APITestCase):
+    def setUp(self):
+        registry.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        Account.objects.create(user=self.user, name='Test Account')
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def get_list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('account-list-create'))
+        return response, len(queries)
+
+    def get_metrics(self, token='scrape-secret'):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return self.client.get(reverse('metrics'))
+
+    def test_server_timing_header_reports_queries(self):
+        response, query_count = self.get_list()
+
+        timing = response['Server-Timing']
+        self.assertIn('total;dur=', timing)
+        self.assertIn('render;dur=', timing)
+        self.assertIn(f'desc="{query_count} queries"', timing)
+
+    def test_metrics_aggregate_per_view(self):
+        _, first_count = self.get_list()
+        _, second_count = self.get_list()
+
+        response = self.get_metrics()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        labels = 'view="account-list-create",method="GET"'
+        self.assertIn(f'http_requests_total{{{labels},status="200"}} 2', body)
+        self.assertIn(f'http_request_db_queries_count{{{labels}}} 2', body)
+        self.assertIn(f'http_request_db_queries_sum{{{labels}}} {first_count + second_count}', body)
+        self.assertIn(f'http_response_size_bytes_bucket{{{labels},le="+Inf"}} 2', body)
+
+    async def test_middleware_stays_async_under_asgi(self):
+        async def get_response(request):
+            await Account.objects.acount()
+            return HttpResponse()
+
+        middleware = PerformanceMiddleware(get_response)
+        response = await middleware(AsyncRequestFactory().get('/api/accounts/'))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertIn('desc="1 queries"', response['Server-Timing'])
+
+    def test_metrics_require_configured_token(self):
+        self.client.credentials()
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_metrics('wrong').status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_metrics().status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS_AUTH_TOKEN='')
+    def test_metrics_without_token_are_only_served_in_debug(self):
+        self.client.credentials()
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_404_NOT_FOUND)
+
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_200_OK)
+
+    @override_settings(PERFORMANCE_METRICS_ENABLED=False)
+    def test_disabled_instrumentation_adds_nothing(self):
+        response = self.client.get(reverse('account-list-create'))
+
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.get_metrics().status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(QUERY_LOG_ENABLED=True, SLOW_QUERY_THRESHOLD_MS=10000, N_PLUS_ONE_THRESHOLD=3)
+class QueryLogTest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=user, name='Test Account')
+        self.request = RequestFactory().get('/api/transactions/')
+
+    def run_request(self, view):
+        def get_response(request):
+            view()
+            return HttpResponse()
+
+        with self.assertLogs('backend.queries', 'WARNING') as logs:
+            QueryLogMiddleware(get_response)(self.request)
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def lookup_accounts_one_by_one(self):
+        for _ in range(3):
+            Account.objects.get(pk=self.account.pk)
+
+    def test_repeated_query_shape_is_reported_once_with_its_frame(self):
+        entries = self.run_request(self.lookup_accounts_one_by_one)
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['event'], 'repeated_query')
+        self.assertEqual(entries[0]['count'], 3)
+        self.assertEqual(entries[0]['path'], '/api/transactions/')
+        self.assertTrue(entries[0]['frame'].startswith(
+            'backend.tests.QueryLogTest.lookup_accounts_one_by_one:'
+        ))
+
+    async def test_middleware_stays_async_under_asgi(self):
+        async def get_response(request):
+            await sync_to_async(self.lookup_accounts_one_by_one)()
+            return HttpResponse()
+
+        middleware = QueryLogMiddleware(get_response)
+        with self.assertLogs('backend.queries', 'WARNING') as logs:
+            await middleware(AsyncRequestFactory().get('/api/transactions/'))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertEqual(json.loads(logs.records[0].getMessage())['count'], 3)
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=0)
+    def test_queries_over_threshold_are_logged(self):
+        entries = self.run_request(lambda: list(Account.objects.all()))
+
+        self.assertEqual([entry['event'] for entry in entries], ['slow_query'])
+        self.assertIn('accounts_account', entries[0]['sql'])
+        self.assertIn('duration_ms', entries[0])
+
+    def test_query_shape_ignores_number_of_values(self):
+        self.assertEqual(
+            query_shape('SELECT 1 WHERE id IN (%s, %s)'),
+            query_shape('SELECT 1 WHERE id IN (%s)'),
+        )
@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.urls import include, path
-from users.views import CreateUserView, CustomTokenObtainPairView, CustomTokenRefreshView, LogoutView, MeView
+from django.conf import settings
+from users.views import AsyncMeView, CreateUserView, CustomTokenObtainPairView, CustomTokenRefreshView, LogoutView, MeView
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from backend.instrumentation import metrics_view
 
 urlpatterns = [
     # Admin site URLs
@@ -14,15 +16,20 @@ urlpatterns = [
     path("api/auth/login/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/auth/refresh/", CustomTokenRefreshView.as_view(), name="token_refresh"),
     path("api/auth/logout/", LogoutView.as_view(), name="logout"),
-    path("api/auth/me/", MeView.as_view(), name="me"),
+    path("api/auth/me/", (AsyncMeView if settings.ASYNC_VIEWS else MeView).as_view(), name="me"),
     path('api/accounts/', include('accounts.urls')),
 
     # Transactions API endpoints
     path('api/transactions/', include('transactions.urls')),
     path('api/categories/', include('categories.urls')),
+    path('api/budgets/', include('budgets.urls')),
+    path('api/notifications/', include('notifications.urls')),
 
     # Swagger URLs
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path("api-auth/", include("rest_framework.urls")),
+
+    # Prometheus metrics from the performance middleware
+    path('api/metrics/', metrics_view, name='metrics'),
 ]
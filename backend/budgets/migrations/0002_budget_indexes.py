@@ -0,0 +1,29 @@
+# Generated by Django 5.1.7 on 2026-10-17 17:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_account_user_index'),
+        ('budgets', '0001_initial'),
+        ('categories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='budget',
+            name='account',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='budgets', to='accounts.account'),
+        ),
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['account', 'category', 'start_date'], name='budget_account_category_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='budget',
+            constraint=models.CheckConstraint(condition=models.Q(('end_date__gte', models.F('start_date'))), name='budget_end_date_after_start_date'),
+        ),
+    ]
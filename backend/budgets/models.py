@@ -1,11 +1,47 @@
+from decimal import Decimal
+
 from django.db import models
+from django.db.models import ExpressionWrapper, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from accounts.models import Account
 from categories.models import Category
+from transactions.models import DailyAccountCategoryTotal
+
+
+class BudgetQuerySet(models.QuerySet):
+    def with_spent(self):
+        """
+        Annotate each budget with the expenses booked in its category and
+        account between start_date and end_date, as a positive amount.
+
+        The sum is a correlated subquery over the daily totals, so any
+        number of budgets is loaded in a single query.
+        """
+        money = models.DecimalField(max_digits=14, decimal_places=2)
+        expenses = (
+            DailyAccountCategoryTotal.objects.filter(
+                account=OuterRef("account"),
+                category=OuterRef("category"),
+                date__gte=OuterRef("start_date"),
+                date__lte=OuterRef("end_date"),
+            )
+            .order_by()
+            .values("account")
+            .annotate(total=Sum("expenses"))
+            .values("total")
+        )
+        return self.annotate(
+            spent=ExpressionWrapper(
+                -Coalesce(Subquery(expenses, output_field=money), Value(Decimal("0.00"))),
+                output_field=money,
+            )
+        )
 
 
 class Budget(models.Model):
+    # Account lookups use budget_account_category_idx
     account = models.ForeignKey(
-        Account, on_delete=models.CASCADE, related_name="budgets"
+        Account, on_delete=models.CASCADE, related_name="budgets", db_index=False
     )
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, related_name="budgets"
@@ -14,6 +50,23 @@ class Budget(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
 
+    objects = BudgetQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Finds the budgets covering a day of spending for budget alerts
+            models.Index(
+                fields=["account", "category", "start_date"],
+                name="budget_account_category_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(end_date__gte=models.F("start_date")),
+                name="budget_end_date_after_start_date",
+            ),
+        ]
+
     def __str__(self):
         return f"Budget for {self.category.name} ({self.account.name})"
 
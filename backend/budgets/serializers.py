@@ -0,0 +1,53 @@
+from rest_framework import serializers
+from .models import Budget, Goal
+
+
+class AccountOwnedSerializer(serializers.ModelSerializer):
+    """
+    Rejects accounts that belong to another user as if they did not exist.
+    """
+    def validate_account(self, account):
+        if account.user_id != self.context['request'].user.pk or account.deleted_at is not None:
+            raise serializers.ValidationError(
+                f'Invalid pk "{account.pk}" - object does not exist.'
+            )
+        return account
+
+
+class BudgetSerializer(AccountOwnedSerializer):
+    category_name = serializers.CharField(source='category.name', read_only=True)
+    account_name = serializers.CharField(source='account.name', read_only=True)
+    spent = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    remaining = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Budget
+        fields = [
+            'id', 'account', 'account_name', 'category', 'category_name',
+            'amount', 'start_date', 'end_date', 'spent', 'remaining'
+        ]
+
+    def get_remaining(self, obj) -> str:
+        return serializers.DecimalField(max_digits=14, decimal_places=2).to_representation(
+            obj.amount - obj.spent
+        )
+
+    def validate(self, attrs):
+        start_date = attrs.get('start_date', getattr(self.instance, 'start_date', None))
+        end_date = attrs.get('end_date', getattr(self.instance, 'end_date', None))
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError(
+                {'end_date': 'end_date must not be before start_date.'}
+            )
+        return attrs
+
+
+class GoalSerializer(AccountOwnedSerializer):
+    account_name = serializers.CharField(source='account.name', read_only=True)
+
+    class Meta:
+        model = Goal
+        fields = [
+            'id', 'account', 'account_name', 'name', 'target_amount',
+            'current_amount', 'due_date'
+        ]
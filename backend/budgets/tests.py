@@ -1,5 +1,18 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db import IntegrityError
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account
+from backend.testing import QueryBudgetMixin
+from categories.models import Category
+from transactions.models import Transaction
+from .models import Budget, Goal
 
 User = get_user_model()
 
@@ -9,4 +22,141 @@ class BudgetTestPlaceholder(TestCase):
             username='testuser',
             email='test@example.com',
             password='testpass123'
-        )
\ No newline at end of file
+        )
+
+    def test_end_date_before_start_date_is_rejected(self):
+        account = Account.objects.create(user=self.user, name='Main')
+        category = Category.objects.create(name='Groceries', is_income=False)
+        with self.assertRaises(IntegrityError):
+            Budget.objects.create(
+                account=account,
+                category=category,
+                amount=Decimal('100.00'),
+                start_date=date(2025, 1, 15),
+                end_date=date(2025, 1, 1)
+            )
+
+
+class BudgetAPITest(QueryBudgetMixin, APITestCase):
+    LIST_QUERY_BUDGET = 2
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.other_account = Account.objects.create(user=self.other_user, name='Other')
+        self.groceries = Category.objects.create(name='Groceries', is_income=False)
+        self.fuel = Category.objects.create(name='Fuel', is_income=False)
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def create_transaction(self, category, amount, day, account=None):
+        return Transaction.objects.create(
+            account=account or self.account,
+            category=category,
+            amount=Decimal(amount),
+            transaction_date=datetime(2025, 1, day, 12)
+        )
+
+    def create_budget(self, category, amount='100.00', account=None):
+        return Budget.objects.create(
+            account=account or self.account,
+            category=category,
+            amount=Decimal(amount),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 15)
+        )
+
+    def test_list_includes_spent_in_window(self):
+        budget = self.create_budget(self.groceries)
+        self.create_transaction(self.groceries, '-30.00', 1)
+        self.create_transaction(self.groceries, '-12.50', 15)
+        self.create_transaction(self.groceries, '5.00', 10)  # refund, not spending
+        self.create_transaction(self.groceries, '-99.00', 16)  # after the window
+        self.create_transaction(self.fuel, '-40.00', 5)
+
+        response = self.client.get('/api/budgets/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], budget.id)
+        self.assertEqual(response.data[0]['spent'], '42.50')
+        self.assertEqual(response.data[0]['remaining'], '57.50')
+        self.assertEqual(response.data[0]['category_name'], 'Groceries')
+
+    def test_budget_without_spending(self):
+        self.create_budget(self.fuel)
+
+        response = self.client.get('/api/budgets/')
+
+        self.assertEqual(response.data[0]['spent'], '0.00')
+
+    def test_list_query_count_does_not_grow_with_budgets(self):
+        self.create_budget(self.groceries)
+        self.assertQueryBudget(self.LIST_QUERY_BUDGET, '/api/budgets/')
+
+        for _ in range(5):
+            self.create_budget(self.fuel)
+        response = self.assertQueryBudget(self.LIST_QUERY_BUDGET, '/api/budgets/')
+        self.assertEqual(len(response.data), 6)
+
+    def test_list_excludes_other_users_budgets(self):
+        self.create_budget(self.groceries, account=self.other_account)
+
+        response = self.client.get('/api/budgets/')
+
+        self.assertEqual(response.data, [])
+
+    def test_create_budget(self):
+        self.create_transaction(self.groceries, '-20.00', 3)
+
+        response = self.client.post('/api/budgets/', {
+            'account': self.account.id,
+            'category': self.groceries.id,
+            'amount': '150.00',
+            'start_date': '2025-01-01',
+            'end_date': '2025-01-31',
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['spent'], '20.00')
+
+    def test_create_budget_validation(self):
+        response = self.client.post('/api/budgets/', {
+            'account': self.other_account.id,
+            'category': self.groceries.id,
+            'amount': '150.00',
+            'start_date': '2025-01-31',
+            'end_date': '2025-01-01',
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('account', response.data)
+        self.assertFalse(Budget.objects.exists())
+
+    def test_goals_crud(self):
+        response = self.client.post('/api/budgets/goals/', {
+            'account': self.account.id,
+            'name': 'Holiday',
+            'target_amount': '2000.00',
+            'due_date': '2025-07-01',
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        Goal.objects.create(
+            account=self.other_account,
+            name='Car',
+            target_amount=Decimal('5000.00'),
+            due_date=date(2025, 12, 1)
+        )
+
+        response = self.client.get('/api/budgets/goals/')
+
+        self.assertEqual([goal['name'] for goal in response.data], ['Holiday'])
@@ -0,0 +1,12 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import BudgetViewSet, GoalViewSet
+
+router = DefaultRouter()
+# Registered before the empty budget prefix so goals/ is not read as a budget id
+router.register(r'goals', GoalViewSet, basename='goal')
+router.register(r'', BudgetViewSet, basename='budget')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
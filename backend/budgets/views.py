@@ -1,3 +1,95 @@
-from django.shortcuts import render
+from rest_framework import viewsets, permissions
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 
-# Create your views here.
+from accounts.authentication import CookieJWTAuthentication
+from .models import Budget, Goal
+from .serializers import BudgetSerializer, GoalSerializer
+
+
+def id_parameter(description):
+    return OpenApiParameter(
+        name="id",
+        type=OpenApiTypes.INT,
+        location=OpenApiParameter.PATH,
+        description=description,
+        required=True
+    )
+
+
+@extend_schema_view(
+    list=extend_schema(
+        description="List the authenticated user's budgets with the amount spent in each budget window"
+    ),
+    retrieve=extend_schema(
+        description="Get a specific budget by ID",
+        parameters=[id_parameter("Budget ID")]
+    ),
+    create=extend_schema(description="Create a new budget"),
+    update=extend_schema(
+        description="Update an existing budget",
+        parameters=[id_parameter("Budget ID")]
+    ),
+    partial_update=extend_schema(
+        description="Partially update an existing budget",
+        parameters=[id_parameter("Budget ID")]
+    ),
+    destroy=extend_schema(
+        description="Delete a budget",
+        parameters=[id_parameter("Budget ID")]
+    ),
+)
+class BudgetViewSet(viewsets.ModelViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = BudgetSerializer
+    authentication_classes = [CookieJWTAuthentication]
+
+    def get_queryset(self):
+        return (
+            Budget.objects.filter(account__user=self.request.user, account__deleted_at__isnull=True)
+            .select_related('category', 'account')
+            .with_spent()
+            .order_by('start_date', 'id')
+        )
+
+    def perform_create(self, serializer):
+        # Re-read the row so the response carries the spent annotation
+        budget = serializer.save()
+        serializer.instance = self.get_queryset().get(pk=budget.pk)
+
+    def perform_update(self, serializer):
+        budget = serializer.save()
+        serializer.instance = self.get_queryset().get(pk=budget.pk)
+
+
+@extend_schema_view(
+    list=extend_schema(description="List the authenticated user's savings goals"),
+    retrieve=extend_schema(
+        description="Get a specific goal by ID",
+        parameters=[id_parameter("Goal ID")]
+    ),
+    create=extend_schema(description="Create a new goal"),
+    update=extend_schema(
+        description="Update an existing goal",
+        parameters=[id_parameter("Goal ID")]
+    ),
+    partial_update=extend_schema(
+        description="Partially update an existing goal",
+        parameters=[id_parameter("Goal ID")]
+    ),
+    destroy=extend_schema(
+        description="Delete a goal",
+        parameters=[id_parameter("Goal ID")]
+    ),
+)
+class GoalViewSet(viewsets.ModelViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = GoalSerializer
+    authentication_classes = [CookieJWTAuthentication]
+
+    def get_queryset(self):
+        return (
+            Goal.objects.filter(account__user=self.request.user, account__deleted_at__isnull=True)
+            .select_related('account')
+            .order_by('due_date', 'id')
+        )
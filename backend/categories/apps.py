@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CategoriesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "categories"
+
+    def ready(self):
+        from backend.reference_cache import invalidate_on_change
+        from .models import Category
+
+        invalidate_on_change(Category, "categories")
@@ -4,6 +4,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiPara
 from drf_spectacular.types import OpenApiTypes
 
 from accounts.authentication import CookieJWTAuthentication
+from backend.reference_cache import ReferenceCacheMixin
 from .models import Category
 from .serializers import CategorySerializer
 
@@ -35,7 +36,7 @@ from .serializers import CategorySerializer
         }
     )
 )
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(ReferenceCacheMixin, viewsets.ReadOnlyModelViewSet):
     """
     A viewset for viewing categories.
     """
@@ -43,4 +44,5 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     authentication_classes = [CookieJWTAuthentication]
+    cache_namespace = "categories"
 
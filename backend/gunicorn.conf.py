@@ -0,0 +1,42 @@
+"""
+Gunicorn configuration for production.
+
+    gunicorn -c gunicorn.conf.py
+
+SERVER_MODE=wsgi (the default) serves backend.wsgi with threaded workers;
+SERVER_MODE=asgi serves backend.asgi with uvicorn workers. Worker counts
+and limits come from the environment so they can be tuned per host.
+"""
+import multiprocessing
+import os
+
+server_mode = os.environ.get("SERVER_MODE", "wsgi")
+
+if server_mode == "asgi":
+    wsgi_app = "backend.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "backend.wsgi:application"
+    worker_class = "gthread"
+    threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers now and then to bound memory growth, staggered so they do
+# not all restart at once
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Connections and pools must not be shared with the master process
+    from django.db import connections
+
+    connections.close_all()
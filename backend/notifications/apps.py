@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class NotificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "notifications"
+
+    def ready(self):
+        from transactions.ledger import transactions_changed
+        from .budget_alerts import queue_budget_checks
+
+        transactions_changed.connect(queue_budget_checks, dispatch_uid="queue_budget_checks")
@@ -0,0 +1,119 @@
+"""
+Budget threshold alerts.
+
+Transaction writes only queue a PendingBudgetCheck row for each day they
+touch. process_pending_checks() runs outside the request cycle, finds the
+budgets covering those days and notifies users once per threshold and
+budget period.
+"""
+from django.db import transaction as db_transaction
+from django.db.models import Q
+
+from budgets.models import Budget
+from .models import Notification, PendingBudgetCheck
+
+# Percentages of a budget that trigger an alert, highest first
+BUDGET_ALERT_THRESHOLDS = (100, 80)
+
+
+def queue_budget_checks(sender, keys, **kwargs):
+    """
+    transactions_changed receiver: remember the touched days. Repeated
+    writes to the same day collapse into one pending row, which gets a new
+    version each time, so a worker evaluating it keeps it for another pass.
+    """
+    PendingBudgetCheck.objects.bulk_create(
+        [
+            PendingBudgetCheck(account_id=account_id, category_id=category_id, date=date)
+            for account_id, category_id, date in keys
+            if category_id is not None
+        ],
+        update_conflicts=True,
+        unique_fields=['account', 'category', 'date'],
+        update_fields=['version'],
+    )
+
+
+def reached_threshold(budget):
+    if budget.amount <= 0:
+        return None
+    percent = budget.spent * 100 / budget.amount
+    return next((t for t in BUDGET_ALERT_THRESHOLDS if percent >= t), None)
+
+
+def budget_alert_message(budget, threshold):
+    return (
+        f"You have used {threshold}% of your {budget.category.name} budget "
+        f"for {budget.account.name} ({budget.spent} of {budget.amount})."
+    )
+
+
+def process_batch(batch_size):
+    """
+    Claim up to batch_size pending checks, create any alerts they call for
+    and delete them, all in one database transaction. Checks locked by a
+    concurrent worker are skipped, and checks queued again since they were
+    claimed are kept. Returns (checks, notifications) counts.
+    """
+    with db_transaction.atomic():
+        checks = list(
+            PendingBudgetCheck.objects.select_for_update(skip_locked=True)
+            .order_by('pk')[:batch_size]
+        )
+        if not checks:
+            return 0, 0
+
+        covering = Q()
+        for check in checks:
+            covering |= Q(
+                account_id=check.account_id,
+                category_id=check.category_id,
+                start_date__lte=check.date,
+                end_date__gte=check.date,
+            )
+        budgets = list(
+            # Accounts pending deletion are no longer shown to their owner
+            Budget.objects.filter(covering, account__deleted_at__isnull=True)
+            .select_related('account', 'category')
+            .with_spent()
+        )
+        sent = set(
+            Notification.objects.filter(budget__in=budgets)
+            .values_list('budget_id', 'period_start', 'threshold')
+        )
+
+        notifications = []
+        for budget in budgets:
+            threshold = reached_threshold(budget)
+            if threshold is None:
+                continue
+            # A 100% alert makes a later 80% alert for the same period redundant
+            if any(
+                budget_id == budget.pk and period_start == budget.start_date and sent_threshold >= threshold
+                for budget_id, period_start, sent_threshold in sent
+            ):
+                continue
+            notifications.append(Notification(
+                user_id=budget.account.user_id,
+                message=budget_alert_message(budget, threshold),
+                budget=budget,
+                threshold=threshold,
+                period_start=budget.start_date,
+            ))
+        Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+        unchanged = Q()
+        for check in checks:
+            unchanged |= Q(pk=check.pk, version=check.version)
+        PendingBudgetCheck.objects.filter(unchanged).delete()
+    return len(checks), len(notifications)
+
+
+def process_pending_checks(batch_size=500):
+    check_count = notification_count = 0
+    while True:
+        checks, notifications = process_batch(batch_size)
+        if not checks:
+            break
+        check_count += checks
+        notification_count += notifications
+    return check_count, notification_count
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from notifications.budget_alerts import process_pending_checks
+
+
+class Command(BaseCommand):
+    help = 'Evaluates budgets touched by recent transactions and sends threshold alerts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of pending checks to claim per database transaction',
+        )
+
+    def handle(self, *args, **options):
+        checks, notifications = process_pending_checks(options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Processed {checks} budget checks ({notifications} notifications)'
+        ))
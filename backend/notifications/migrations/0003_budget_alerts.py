@@ -0,0 +1,92 @@
+# Generated by Django 5.1.7 on 2026-10-17 16:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0003_account_opening_balance"),
+        ("budgets", "0001_initial"),
+        ("categories", "0001_initial"),
+        ("notifications", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingBudgetCheck",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_budget_checks",
+                        to="accounts.account",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_budget_checks",
+                        to="categories.category",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "category", "date"),
+                        name="pending_budget_check_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="budget",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="notifications",
+                to="budgets.budget",
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="period_start",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="threshold",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_read", "created_at"],
+                name="notification_user_unread_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="notification",
+            constraint=models.UniqueConstraint(
+                fields=("budget", "threshold", "period_start"),
+                name="notification_budget_threshold_uniq",
+            ),
+        ),
+    ]
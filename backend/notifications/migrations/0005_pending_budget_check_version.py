@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:33
+
+import accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_notification_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingbudgetcheck',
+            name='version',
+            field=models.BigIntegerField(default=accounts.models.new_version),
+        ),
+    ]
@@ -1,14 +1,82 @@
 from django.db import models
+from accounts.models import Account, new_version
+from budgets.models import Budget
+from categories.models import Category
 from users.models import User
 
 
 class Notification(models.Model):
+    # User lookups use the notification list indexes
     user = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name="notifications"
+        User, on_delete=models.CASCADE, related_name="notifications", db_index=False
     )
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Set for budget alerts; one alert per threshold and budget period
+    # Budget lookups use notification_budget_threshold_uniq
+    budget = models.ForeignKey(
+        Budget,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="notifications",
+        db_index=False,
+    )
+    threshold = models.PositiveSmallIntegerField(null=True, blank=True)
+    period_start = models.DateField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Back the newest-first notification list of a user and its
+            # unread filter without a sort
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notification_user_created_idx",
+            ),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                condition=models.Q(is_read=False),
+                name="notification_user_unread_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["budget", "threshold", "period_start"],
+                name="notification_budget_threshold_uniq",
+            ),
+        ]
+
     def __str__(self):
         return f"Notification for {self.user.username} ({'Read' if self.is_read else 'Unread'})"
+
+
+class PendingBudgetCheck(models.Model):
+    """
+    A day of an account's spending in a category that changed since budget
+    alerts were last evaluated. Rows are queued by transaction writes and
+    consumed by the process_budget_alerts command.
+    """
+    # Account lookups use pending_budget_check_uniq
+    account = models.ForeignKey(
+        Account, on_delete=models.CASCADE, related_name="pending_budget_checks", db_index=False
+    )
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="pending_budget_checks"
+    )
+    date = models.DateField()
+    # Restamped whenever a write queues the day again, so a worker only
+    # deletes the row if nothing queued it while the check was evaluated
+    version = models.BigIntegerField(default=new_version)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "category", "date"],
+                name="pending_budget_check_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.category_id} ({self.account_id})"
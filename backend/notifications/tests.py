@@ -1,5 +1,21 @@
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account
+from budgets.models import Budget
+from categories.models import Category
+from transactions.models import Transaction
+from .budget_alerts import process_batch, process_pending_checks, reached_threshold
+from .models import Notification, PendingBudgetCheck
 
 User = get_user_model()
 
@@ -25,3 +41,147 @@ class NotificationTestPlaceholder(TestCase):
     # - Budget limit notifications
     # - Recurring transaction reminders
     # - Account balance alerts
+
+
+class BudgetAlertTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.category = Category.objects.create(name='Groceries', is_income=False)
+        self.budget = Budget.objects.create(
+            account=self.account,
+            category=self.category,
+            amount=Decimal('100.00'),
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31)
+        )
+
+    def spend(self, amount, day=10):
+        return Transaction.objects.create(
+            account=self.account,
+            category=self.category,
+            amount=Decimal(amount),
+            transaction_date=datetime(2025, 1, day, 12)
+        )
+
+    def test_writes_only_queue_checks(self):
+        self.spend('-90.00')
+        self.spend('-5.00')
+
+        self.assertEqual(PendingBudgetCheck.objects.count(), 1)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_threshold_notifications(self):
+        self.spend('-50.00')
+        process_pending_checks()
+        self.assertFalse(Notification.objects.exists())
+
+        self.spend('-35.00')
+        process_pending_checks()
+        notification = Notification.objects.get()
+        self.assertEqual(notification.threshold, 80)
+        self.assertEqual(notification.user, self.user)
+        self.assertIn('80% of your Groceries budget', notification.message)
+
+        self.spend('-20.00')
+        process_pending_checks()
+        self.assertEqual(
+            sorted(Notification.objects.values_list('threshold', flat=True)), [80, 100]
+        )
+        self.assertFalse(PendingBudgetCheck.objects.exists())
+
+    def test_notifications_are_deduplicated(self):
+        self.spend('-85.00')
+        process_pending_checks()
+        self.spend('-1.00', day=11)
+        process_pending_checks()
+
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_lower_threshold_skipped_after_higher(self):
+        self.spend('-120.00')
+        process_pending_checks()
+        self.spend('30.00', day=11)
+        process_pending_checks()
+
+        self.assertEqual(list(Notification.objects.values_list('threshold', flat=True)), [100])
+
+    def test_check_queued_again_while_claimed_is_kept(self):
+        self.spend('-50.00')
+
+        def spend_while_evaluating(budget):
+            # Another write lands between the claim and the delete
+            if not Transaction.objects.filter(amount=Decimal('-40.00')).exists():
+                self.spend('-40.00')
+            return reached_threshold(budget)
+
+        with mock.patch('notifications.budget_alerts.reached_threshold', spend_while_evaluating):
+            self.assertEqual(process_batch(10), (1, 0))
+
+        self.assertEqual(PendingBudgetCheck.objects.count(), 1)
+        process_pending_checks()
+        self.assertEqual(Notification.objects.get().threshold, 80)
+
+    def test_spending_outside_budget_window(self):
+        Transaction.objects.create(
+            account=self.account,
+            category=self.category,
+            amount=Decimal('-500.00'),
+            transaction_date=datetime(2025, 2, 1, 12)
+        )
+        out = StringIO()
+
+        call_command('process_budget_alerts', stdout=out)
+
+        self.assertIn('Processed 1 budget checks (0 notifications)', out.getvalue())
+        self.assertFalse(Notification.objects.exists())
+
+
+class NotificationAPITest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.unread = Notification.objects.create(user=self.user, message='Unread')
+        self.read = Notification.objects.create(user=self.user, message='Read', is_read=True)
+        Notification.objects.create(user=self.other_user, message='Other')
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def test_list_notifications(self):
+        response = self.client.get('/api/notifications/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [n['message'] for n in response.data['results']], ['Read', 'Unread']
+        )
+
+    def test_filter_unread(self):
+        response = self.client.get('/api/notifications/', {'is_read': 'false'})
+
+        self.assertEqual([n['id'] for n in response.data['results']], [self.unread.id])
+
+    def test_mark_read(self):
+        response = self.client.patch(f'/api/notifications/{self.unread.id}/', {'is_read': True})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.unread.refresh_from_db()
+        self.assertTrue(self.unread.is_read)
+
+    def test_read_all(self):
+        response = self.client.post('/api/notifications/read_all/')
+
+        self.assertEqual(response.data, {'updated': 1})
+        self.assertFalse(Notification.objects.filter(user=self.user, is_read=False).exists())
+        self.assertTrue(Notification.objects.filter(user=self.other_user, is_read=False).exists())
@@ -1,3 +1,64 @@
-from django.shortcuts import render
+from rest_framework import mixins, viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
 
-# Create your views here.
+from accounts.authentication import CookieJWTAuthentication
+from .models import Notification
+from .serializers import NotificationSerializer
+
+
+class NotificationPagination(CursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size = 50
+
+
+ID_PARAMETER = OpenApiParameter(
+    name="id",
+    type=OpenApiTypes.INT,
+    location=OpenApiParameter.PATH,
+    description="Notification ID",
+    required=True
+)
+
+
+@extend_schema_view(
+    list=extend_schema(
+        description="List the authenticated user's notifications, newest first",
+        parameters=[
+            OpenApiParameter(
+                name="is_read",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Only return read (true) or unread (false) notifications",
+                required=False
+            )
+        ]
+    ),
+    update=extend_schema(description="Mark a notification as read or unread", parameters=[ID_PARAMETER]),
+    partial_update=extend_schema(description="Mark a notification as read or unread", parameters=[ID_PARAMETER]),
+)
+class NotificationViewSet(mixins.ListModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet):
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = NotificationSerializer
+    authentication_classes = [CookieJWTAuthentication]
+    pagination_class = NotificationPagination
+
+    def get_queryset(self):
+        queryset = Notification.objects.filter(user=self.request.user)
+        is_read = self.request.query_params.get('is_read')
+        if is_read in ('true', 'false'):
+            queryset = queryset.filter(is_read=is_read == 'true')
+        return queryset
+
+    @extend_schema(
+        description="Mark all of the authenticated user's notifications as read",
+        request=None,
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'])
+    def read_all(self, request):
+        updated = Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
+        return Response({'updated': updated})
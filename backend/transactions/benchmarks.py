@@ -0,0 +1,222 @@
+"""
+In-process benchmark of the key API endpoints.
+
+Requests go through the full Django stack with the test client, so the
+numbers include middleware, authentication, serialization and rendering
+but no network or server overhead. Run it against a dataset made by the
+generate_data command.
+"""
+import asyncio
+import io
+import math
+import time
+
+from asgiref.sync import sync_to_async
+
+from django.db import DEFAULT_DB_ALIAS, connection, reset_queries
+from django.db.backends.signals import connection_created
+from django.test import AsyncRequestFactory, Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import Account
+from backend.wsgi import application
+
+
+def percentile(values, percent):
+    """
+    Return the nearest-rank percentile of a list of numbers.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def login(client, username, password):
+    response = client.post('/api/auth/login/', {'username': username, 'password': password})
+    if response.status_code != 200:
+        raise ValueError(f'Could not log in as {username}: {response.status_code}')
+
+
+def measure(name, send, iterations):
+    """
+    Send one untimed request to count its queries and bytes, then time
+    iterations more. Returns a result dict with latencies in milliseconds.
+    """
+    # Requests clear the query log when DEBUG is on, so start from empty
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        response = send()
+    if response.status_code >= 400:
+        raise ValueError(f'{name} returned {response.status_code}')
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        send()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'endpoint': name,
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'queries': len(queries.captured_queries),
+        'bytes': len(response.content),
+    }
+
+
+def run_benchmarks(username, admin_username, password, iterations=50):
+    """
+    Benchmark the endpoints as username, and the admin lists as
+    admin_username. Returns one result dict per endpoint.
+    """
+    user_client = Client()
+    login(user_client, username, password)
+    admin_client = Client()
+    login(admin_client, admin_username, password)
+
+    account_id = (
+        Account.objects.filter(user__username=username)
+        .order_by('pk')
+        .values_list('pk', flat=True)
+        .first()
+    )
+
+    endpoints = [
+        ('login', lambda: Client().post(
+            '/api/auth/login/', {'username': username, 'password': password}
+        )),
+        ('me', lambda: user_client.get('/api/auth/me/')),
+        ('accounts list', lambda: user_client.get('/api/accounts/')),
+        ('transactions list', lambda: user_client.get('/api/transactions/')),
+        ('transactions by_account', lambda: user_client.get(
+            '/api/transactions/by_account/', {'account_id': account_id}
+        )),
+        ('transactions summary', lambda: user_client.get('/api/transactions/summary/')),
+        ('admin users list', lambda: admin_client.get('/api/accounts/admin/users/')),
+        ('admin accounts list', lambda: admin_client.get('/api/accounts/admin/accounts/')),
+    ]
+    return [measure(name, send, iterations) for name, send in endpoints]
+
+
+def wsgi_get(path, headers):
+    """
+    Send a GET request through the WSGI application the way a server does,
+    including the request_started and request_finished signals that open
+    and close database connections. Returns the status line.
+    """
+    environ = RequestFactory().get(path, headers=headers).environ
+    statuses = []
+    response = application(environ, lambda status, response_headers: statuses.append(status))
+    try:
+        b''.join(response)
+    finally:
+        response.close()
+    return statuses[0]
+
+
+def measure_connection_reuse(path, headers, iterations):
+    """
+    Send iterations requests to path and count the distinct database
+    connections they opened. Without persistent connections or a pool
+    that is one per request.
+    """
+    opened = []
+
+    def record(sender, connection, **kwargs):
+        # Pooled connections are handed out again, so count distinct ones
+        if connection.alias == DEFAULT_DB_ALIAS and not any(raw is connection.connection for raw in opened):
+            opened.append(connection.connection)
+
+    # Start disconnected so the first request's connection is counted
+    connection.close()
+    connection_created.connect(record)
+    timings = []
+    try:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            status = wsgi_get(path, headers)
+            timings.append((time.perf_counter() - started) * 1000)
+            if not status.startswith('2'):
+                raise ValueError(f'{path} returned {status}')
+    finally:
+        connection_created.disconnect(record)
+
+    return {
+        'endpoint': path,
+        'requests': iterations,
+        'connections_opened': len(opened),
+        'p50_ms': round(percentile(timings, 50), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+    }
+
+
+async def measure_concurrency(view, path, headers, requests, concurrency):
+    """
+    Send requests to an async view callable with at most concurrency of them
+    in flight and return the throughput. Sync views should be adapted with
+    sync_to_async first, as the ASGI handler does.
+    """
+    factory = AsyncRequestFactory()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send():
+        async with semaphore:
+            response = await view(factory.get(path, headers=headers))
+            await sync_to_async(response.render)()
+            if response.status_code >= 400:
+                raise ValueError(f'{path} returned {response.status_code}')
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        'endpoint': path,
+        'requests': requests,
+        'concurrency': concurrency,
+        'requests_per_second': round(requests / elapsed, 1),
+    }
+
+
+def measure_codec(name, data, renderer, parser, iterations):
+    """
+    Time rendering data to JSON bytes and parsing it back. Returns the
+    rendered bytes and a result dict with median timings in milliseconds.
+    """
+    render_timings = []
+    parse_timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        body = renderer.render(data)
+        render_timings.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        parser.parse(io.BytesIO(body))
+        parse_timings.append((time.perf_counter() - started) * 1000)
+
+    return body, {
+        'codec': name,
+        'rows': len(data),
+        'render_ms': round(percentile(render_timings, 50), 2),
+        'parse_ms': round(percentile(parse_timings, 50), 2),
+        'bytes': len(body),
+    }
+
+
+def measure_serializer(name, serialize, iterations):
+    """
+    Time serialize(), which runs the list query and builds the response
+    data. Returns the data of the last run and a result dict.
+    """
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        data = serialize()
+        timings.append(time.perf_counter() - started)
+
+    median = percentile(timings, 50)
+    return data, {
+        'serializer': name,
+        'rows': len(data),
+        'median_ms': round(median * 1000, 2),
+        'rows_per_second': round(len(data) / median) if median else 0,
+    }
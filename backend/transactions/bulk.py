@@ -0,0 +1,80 @@
+"""
+Batched writes to many transactions at once.
+
+Both writers take a queryset already limited to the caller's own
+transactions, lock the matching rows with one query, write them with a
+few UPDATE or DELETE statements and report the effect to the ledger,
+all in one database transaction.
+"""
+from django.conf import settings
+from django.db import transaction as db_transaction
+
+from .ledger import LEDGER_FIELDS, LedgerRow, apply_changes
+from .models import Transaction
+
+
+def lock_rows(queryset, ids=None):
+    """
+    Lock the selected transactions and return their (pk, *LEDGER_FIELDS)
+    rows. With ids, raises Transaction.DoesNotExist unless every id is
+    among the queryset's rows, so ownership is checked by the same query.
+    Raises ValueError when more than TRANSACTION_BULK_MAX_ROWS are selected.
+    """
+    if ids is not None:
+        queryset = queryset.filter(pk__in=ids)
+    limit = settings.TRANSACTION_BULK_MAX_ROWS
+    # One row past the limit is enough to tell the selection is too large
+    rows = list(
+        queryset.select_for_update(of=('self',))
+        .order_by('pk')
+        .values_list('pk', *LEDGER_FIELDS)[:limit + 1]
+    )
+    if len(rows) > limit:
+        raise ValueError(f"The selection matches more than {limit} transactions; narrow the filter")
+    if ids is not None and len(rows) != len(set(ids)):
+        found = {row[0] for row in rows}
+        missing = sorted(set(ids) - found)
+        raise Transaction.DoesNotExist(f"Transactions not found: {', '.join(map(str, missing))}")
+    return rows
+
+
+def batches(rows, batch_size):
+    for start in range(0, len(rows), batch_size):
+        yield [row[0] for row in rows[start:start + batch_size]]
+
+
+def bulk_update_transactions(queryset, changes, ids=None):
+    """
+    Set the fields in changes, a {field name: value} mapping, on every
+    selected transaction. Returns the number of rows updated.
+    """
+    batch_size = settings.TRANSACTION_BULK_BATCH_SIZE
+    with db_transaction.atomic():
+        rows = lock_rows(queryset, ids)
+        for pks in batches(rows, batch_size):
+            Transaction.objects.filter(pk__in=pks).update(**changes)
+
+        removed = [LedgerRow._make(row[1:]) for row in rows]
+        ledger_changes = {}
+        if 'account' in changes:
+            ledger_changes['account_id'] = changes['account'].pk
+        if 'category' in changes:
+            ledger_changes['category_id'] = changes['category'].pk if changes['category'] else None
+        # Rows whose ledger fields are unchanged cancel out, but their
+        # accounts still get a new version stamp for the ETags
+        apply_changes(removed=removed, added=[row._replace(**ledger_changes) for row in removed])
+    return len(rows)
+
+
+def bulk_delete_transactions(queryset, ids=None):
+    """
+    Delete every selected transaction. Returns the number of rows deleted.
+    """
+    batch_size = settings.TRANSACTION_BULK_BATCH_SIZE
+    with db_transaction.atomic():
+        rows = lock_rows(queryset, ids)
+        for pks in batches(rows, batch_size):
+            # Nothing references transactions, so this is a plain DELETE
+            Transaction.objects.filter(pk__in=pks).delete()
+        apply_changes(removed=[LedgerRow._make(row[1:]) for row in rows])
+    return len(rows)
@@ -0,0 +1,102 @@
+"""
+Streaming writers for transaction exports.
+
+Rows come from a values_list() iterator, so an export never builds model
+instances and never holds more than one database chunk in memory. Django's
+ASGI handler buffers a sync iterator whole before sending it, so under ASGI
+the chunks are read in the database thread and written by an async
+generator instead; both share the same per-format row writers.
+"""
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+# (column name, queryset lookup) pairs in output order
+EXPORT_COLUMNS = (
+    ('id', 'id'),
+    ('transaction_date', 'transaction_date'),
+    ('amount', 'amount'),
+    ('description', 'description'),
+    ('category_name', 'category__name'),
+    ('account_name', 'account__name'),
+    ('frequency', 'frequency'),
+    ('next_due_date', 'next_due_date'),
+)
+
+
+class Echo:
+    """
+    File-like object whose write() hands back the value instead of storing it.
+    """
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, chunk_size):
+    lookups = [lookup for _, lookup in EXPORT_COLUMNS]
+    return (
+        queryset.order_by('-transaction_date', '-id')
+        .values_list(*lookups)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+async def aexport_rows(queryset, chunk_size):
+    # Chunks are pulled in the database thread the way QuerySet.aiterator()
+    # does, which cannot be used here: it calls the iterable's __iter__() in
+    # the event loop, and for values_list() that already runs the query.
+    # async for over the queryset would load every row at once.
+    rows = export_rows(queryset, chunk_size)
+    next_chunk = sync_to_async(lambda: list(islice(rows, chunk_size)))
+    while True:
+        chunk = await next_chunk()
+        for row in chunk:
+            yield row
+        if len(chunk) < chunk_size:
+            break
+
+
+def csv_writer():
+    """
+    Return the (header, write_row) pair for CSV output.
+    """
+    writer = csv.writer(Echo())
+    return writer.writerow([name for name, _ in EXPORT_COLUMNS]), writer.writerow
+
+
+def ndjson_writer():
+    """
+    Return the (header, write_row) pair for NDJSON output, which has no header.
+    """
+    names = [name for name, _ in EXPORT_COLUMNS]
+    encoder = DjangoJSONEncoder()
+    return None, lambda row: encoder.encode(dict(zip(names, row))) + '\n'
+
+
+WRITERS = {
+    'csv': csv_writer,
+    'ndjson': ndjson_writer,
+}
+
+
+def stream_export(rows, file_format):
+    header, write_row = WRITERS[file_format]()
+    if header is not None:
+        yield header
+    for row in rows:
+        yield write_row(row)
+
+
+async def astream_export(rows, file_format):
+    header, write_row = WRITERS[file_format]()
+    if header is not None:
+        yield header
+    async for row in rows:
+        yield write_row(row)
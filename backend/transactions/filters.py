@@ -0,0 +1,122 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import Transaction
+
+
+def parse_date_param(params, name):
+    """
+    Read an optional YYYY-MM-DD query parameter.
+    Raises ValueError when the value is present but not a valid date.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError(f"{name} must be a date in YYYY-MM-DD format")
+    return parsed
+
+
+def start_of_day(day):
+    """
+    Return the first instant of a calendar day as a value comparable with
+    transaction_date, so range filters can use the column's index.
+    """
+    moment = datetime.combine(day, time.min)
+    if settings.USE_TZ:
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def filter_date_range(queryset, date_from=None, date_to=None):
+    """
+    Limit transactions to the inclusive [date_from, date_to] calendar range.
+    """
+    if date_from:
+        queryset = queryset.filter(transaction_date__gte=start_of_day(date_from))
+    if date_to:
+        queryset = queryset.filter(transaction_date__lt=start_of_day(date_to + timedelta(days=1)))
+    return queryset
+
+
+TRANSACTION_TYPES = ('income', 'expense')
+
+# Query parameters read by filter_transactions()
+TRANSACTION_FILTERS = (
+    'date_from', 'date_to', 'amount_min', 'amount_max', 'category', 'type', 'frequency', 'search',
+)
+
+
+def parse_amount_param(params, name):
+    """
+    Read an optional decimal query parameter.
+    Raises ValueError when the value is present but not a number.
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        amount = None
+    if amount is None or not amount.is_finite():
+        raise ValueError(f"{name} must be a number")
+    return amount
+
+
+def filter_transactions(queryset, params):
+    """
+    Apply the list filters in the query parameters: date_from and date_to,
+    amount_min and amount_max, category (an id, or "none" for
+    uncategorized), type (income or expense), frequency and search, a
+    case-insensitive match within the description.
+    Raises ValueError when a parameter is invalid.
+    """
+    queryset = filter_date_range(
+        queryset, parse_date_param(params, 'date_from'), parse_date_param(params, 'date_to')
+    )
+
+    amount_min = parse_amount_param(params, 'amount_min')
+    if amount_min is not None:
+        queryset = queryset.filter(amount__gte=amount_min)
+    amount_max = parse_amount_param(params, 'amount_max')
+    if amount_max is not None:
+        queryset = queryset.filter(amount__lte=amount_max)
+
+    category = params.get('category')
+    if category == 'none':
+        queryset = queryset.filter(category__isnull=True)
+    elif category:
+        if not category.isdigit():
+            raise ValueError('category must be a category id or "none"')
+        queryset = queryset.filter(category_id=int(category))
+
+    transaction_type = params.get('type')
+    if transaction_type == 'income':
+        queryset = queryset.filter(amount__gt=0)
+    elif transaction_type == 'expense':
+        queryset = queryset.filter(amount__lt=0)
+    elif transaction_type:
+        raise ValueError(f"type must be one of: {', '.join(TRANSACTION_TYPES)}")
+
+    frequency = params.get('frequency')
+    if frequency:
+        frequencies = [choice for choice, _ in Transaction.RECURRING_FREQUENCIES]
+        if frequency not in frequencies:
+            raise ValueError(f"frequency must be one of: {', '.join(frequencies)}")
+        queryset = queryset.filter(frequency=frequency)
+
+    search = params.get('search', '').strip()
+    if search:
+        # Served by transaction_description_trgm_idx on PostgreSQL
+        queryset = queryset.filter(description__icontains=search)
+
+    return queryset
@@ -0,0 +1,270 @@
+"""
+Streaming parsers for bank statement files.
+
+Each parser reads an uploaded file incrementally and yields
+(row_number, fields) pairs, where fields holds the raw string values for
+date, amount, description and optionally category and frequency. A file
+that cannot be parsed at all raises ValueError.
+"""
+import codecs
+import csv
+import io
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import serializers
+
+from categories.models import Category
+from .ledger import apply_changes
+from .models import Transaction
+
+IMPORT_FORMATS = ('csv', 'ofx', 'qif')
+
+# Only the first errors are echoed back; the total is always reported
+MAX_REPORTED_ERRORS = 100
+
+CSV_COLUMN_ALIASES = {
+    'date': ('date', 'transaction_date'),
+    'amount': ('amount',),
+    'description': ('description', 'memo', 'payee'),
+    'category': ('category', 'category_name'),
+    'frequency': ('frequency',),
+}
+
+OFX_TRANSACTION_RE = re.compile(r'<STMTTRN>(.*?)</STMTTRN>', re.IGNORECASE | re.DOTALL)
+OFX_FIELD_RE = re.compile(r'<(DTPOSTED|TRNAMT|NAME|MEMO)>([^<\r\n]*)', re.IGNORECASE)
+
+FREQUENCIES = {value for value, _ in Transaction.RECURRING_FREQUENCIES}
+
+
+def decode_as_cp1252(error):
+    return error.object[error.start:error.end].decode('cp1252', errors='replace'), error.end
+
+
+# Bank exports are often Windows-1252 rather than UTF-8. Text files are read
+# as UTF-8 with this error handler, so bytes that are not valid UTF-8 are
+# read as Windows-1252 instead of failing the import
+TEXT_DECODE_ERRORS = 'transaction_import_cp1252'
+codecs.register_error(TEXT_DECODE_ERRORS, decode_as_cp1252)
+
+
+def description_field():
+    """
+    Return the description field of the transaction API serializer, so
+    imported descriptions get the same checks, e.g. no NUL characters.
+    """
+    from .serializers import TransactionSerializer
+    return TransactionSerializer().fields['description']
+
+
+def import_transactions(account, uploaded_file, file_format, batch_size=None):
+    """
+    Stream rows from an uploaded statement into the account.
+
+    Rows are validated and inserted in batches with bulk_create inside a
+    single database transaction; invalid rows are skipped and reported.
+    Returns a dict with the created count and the per-row errors.
+    """
+    if batch_size is None:
+        batch_size = settings.TRANSACTION_IMPORT_BATCH_SIZE
+    categories = {
+        name.lower(): pk for pk, name in Category.objects.values_list('pk', 'name')
+    }
+    description = description_field()
+    result = {'created': 0, 'error_count': 0, 'errors': []}
+
+    with db_transaction.atomic():
+        batch = []
+        for row_number, fields in iter_rows(uploaded_file, file_format):
+            try:
+                batch.append(build_transaction(fields, account, categories, description))
+            except ValueError as e:
+                result['error_count'] += 1
+                if len(result['errors']) < MAX_REPORTED_ERRORS:
+                    result['errors'].append({'row': row_number, 'errors': e.args[0]})
+                continue
+            if len(batch) >= batch_size:
+                result['created'] += _insert_batch(batch)
+                batch = []
+        if batch:
+            result['created'] += _insert_batch(batch)
+    return result
+
+
+def _insert_batch(batch):
+    Transaction.objects.bulk_create(batch)
+    # bulk_create skips Transaction.save(), so report the rows to the ledger
+    apply_changes(added=[transaction.ledger_row() for transaction in batch])
+    return len(batch)
+
+
+def iter_rows(uploaded_file, file_format):
+    parsers = {
+        'csv': iter_csv_rows,
+        'ofx': iter_ofx_rows,
+        'qif': iter_qif_rows,
+    }
+    uploaded_file.seek(0)
+    return parsers[file_format](getattr(uploaded_file, 'file', uploaded_file))
+
+
+def iter_csv_rows(uploaded_file):
+    text = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', errors=TEXT_DECODE_ERRORS, newline='')
+    reader = csv.DictReader(text)
+    try:
+        columns = {
+            field: next((name for name in (reader.fieldnames or []) if name.strip().lower() in aliases), None)
+            for field, aliases in CSV_COLUMN_ALIASES.items()
+        }
+        for row in reader:
+            yield reader.line_num, {
+                field: (row.get(column) or '').strip() if column else ''
+                for field, column in columns.items()
+            }
+    except csv.Error as e:
+        raise ValueError(f'Line {reader.line_num}: {e}') from e
+    text.detach()
+
+
+def iter_ofx_rows(uploaded_file, chunk_size=64 * 1024):
+    decoder = codecs.getincrementaldecoder('latin-1')()
+    buffer = ''
+    row_number = 0
+    for chunk in iter(lambda: uploaded_file.read(chunk_size), b''):
+        buffer += decoder.decode(chunk)
+        consumed = 0
+        for match in OFX_TRANSACTION_RE.finditer(buffer):
+            row_number += 1
+            fields = {name.upper(): value.strip() for name, value in OFX_FIELD_RE.findall(match.group(1))}
+            yield row_number, {
+                'date': fields.get('DTPOSTED', ''),
+                'amount': fields.get('TRNAMT', ''),
+                'description': fields.get('NAME') or fields.get('MEMO', ''),
+                'category': '',
+                'frequency': '',
+            }
+            consumed = match.end()
+        # Keep only the unfinished tail so memory stays bounded by one record
+        buffer = buffer[consumed:]
+
+
+def iter_qif_rows(uploaded_file):
+    text = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', errors=TEXT_DECODE_ERRORS)
+    fields = {}
+    start_line = None
+    for line_number, line in enumerate(text, start=1):
+        line = line.rstrip('\r\n')
+        if not line or line.startswith('!'):
+            continue
+        code, value = line[0], line[1:].strip()
+        if code == '^':
+            if fields:
+                yield start_line, {
+                    'date': fields.get('D', ''),
+                    'amount': fields.get('T') or fields.get('U', ''),
+                    'description': fields.get('P') or fields.get('M', ''),
+                    'category': fields.get('L', ''),
+                    'frequency': '',
+                }
+            fields = {}
+            start_line = None
+            continue
+        if start_line is None:
+            start_line = line_number
+        fields[code] = value
+    text.detach()
+
+
+def parse_transaction_date(value):
+    """
+    Accept ISO dates and datetimes, OFX timestamps (YYYYMMDD[HHMMSS]) and
+    QIF dates (MM/DD/YYYY or MM/DD'YY).
+    """
+    value = value.strip()
+    parsed = None
+    try:
+        parsed = parse_datetime(value) or parse_date(value)
+        if parsed is None and re.match(r'^\d{8}', value):
+            parsed = datetime.strptime(value[:14].ljust(14, '0'), '%Y%m%d%H%M%S')
+        if parsed is None and re.match(r"^\d{1,2}/\d{1,2}['/]\s*\d{2,4}$", value):
+            month, day, year = re.split(r"['/]", value)
+            year = int(year)
+            if year < 100:
+                year += 2000
+            parsed = date(year, int(month), int(day))
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError('Enter a valid date.')
+
+    if not isinstance(parsed, datetime):
+        parsed = datetime.combine(parsed, datetime.min.time())
+    if settings.USE_TZ and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    if not settings.USE_TZ and timezone.is_aware(parsed):
+        parsed = timezone.make_naive(parsed)
+    return parsed
+
+
+def parse_amount(value):
+    try:
+        amount = Decimal(value.replace(',', '').strip())
+    except InvalidOperation:
+        raise ValueError('A valid number is required.')
+    if not amount.is_finite():
+        raise ValueError('A valid number is required.')
+    if abs(amount) >= Decimal('10000000000'):
+        raise ValueError('Ensure that there are no more than 12 digits in total.')
+    if amount != amount.quantize(Decimal('0.01')):
+        raise ValueError('Ensure that there are no more than 2 decimal places.')
+    return amount
+
+
+def build_transaction(fields, account, categories, description):
+    """
+    Validate one parsed row and return an unsaved Transaction, checking
+    the description with the given serializer field.
+    Raises ValueError with a {field: [message]} dict on invalid input.
+    """
+    errors = {}
+    values = {}
+
+    try:
+        values['transaction_date'] = parse_transaction_date(fields['date'])
+    except ValueError as e:
+        errors['transaction_date'] = [str(e)]
+
+    try:
+        values['amount'] = parse_amount(fields['amount'])
+    except ValueError as e:
+        errors['amount'] = [str(e)]
+
+    category_name = fields.get('category', '')
+    values['category_id'] = None
+    if category_name:
+        values['category_id'] = categories.get(category_name.lower())
+        if values['category_id'] is None:
+            errors['category'] = [f'Unknown category "{category_name}".']
+
+    try:
+        values['description'] = description.run_validation(fields.get('description') or None)
+    except serializers.ValidationError as e:
+        errors['description'] = [str(message) for message in e.detail]
+
+    frequency = (fields.get('frequency') or 'none').lower()
+    if frequency not in FREQUENCIES:
+        errors['frequency'] = [f'"{frequency}" is not a valid choice.']
+
+    if errors:
+        raise ValueError(errors)
+
+    return Transaction(
+        account=account,
+        frequency=frequency,
+        **values
+    )
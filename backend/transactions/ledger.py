@@ -0,0 +1,117 @@
+"""
+Keeps data derived from transactions in step with transaction writes.
+
+Every code path that inserts, changes or removes Transaction rows reports
+the affected rows here, inside the same database transaction as the write.
+"""
+from collections import defaultdict, namedtuple
+from decimal import Decimal
+
+from django.db.models import F
+from django.dispatch import Signal
+from django.utils import timezone
+
+from accounts.models import Account, new_version
+
+LEDGER_FIELDS = ('account_id', 'category_id', 'transaction_date', 'amount')
+
+LedgerRow = namedtuple('LedgerRow', LEDGER_FIELDS)
+
+# Sent after apply_changes() with keys, a list of the (account_id,
+# category_id, date) days it touched. Receivers run inside the writer's
+# database transaction, so they should only record work to do later.
+transactions_changed = Signal()
+
+
+def rollup_date(transaction_date):
+    """
+    Return the calendar day a transaction is counted under in daily totals.
+    """
+    if timezone.is_aware(transaction_date):
+        return timezone.localtime(transaction_date).date()
+    return transaction_date.date()
+
+
+def apply_changes(removed=(), added=()):
+    """
+    Apply the effect of removing and adding transaction rows (LedgerRow
+    tuples) to account balances and daily totals. An update is a removal
+    of the old row plus an addition of the new one.
+    """
+    balance_deltas = defaultdict(Decimal)
+    rollup_deltas = defaultdict(lambda: [Decimal('0'), Decimal('0'), 0])
+
+    for sign, rows in ((-1, removed), (1, added)):
+        for row in rows:
+            amount = Decimal(row.amount)
+            balance_deltas[row.account_id] += sign * amount
+            delta = rollup_deltas[(row.account_id, row.category_id, rollup_date(row.transaction_date))]
+            delta[0 if amount > 0 else 1] += sign * amount
+            delta[2] += sign
+
+    if not balance_deltas:
+        return
+    lock_accounts(balance_deltas)
+    # Accounts with a zero delta still get a new version stamp
+    adjust_balances(balance_deltas)
+    adjust_daily_totals({key: delta for key, delta in rollup_deltas.items() if any(delta)})
+    transactions_changed.send(sender=None, keys=list(rollup_deltas))
+
+
+def lock_accounts(account_ids):
+    """
+    Lock account rows in primary key order so concurrent writers touching
+    the same accounts queue up instead of deadlocking.
+    """
+    list(
+        Account.objects.select_for_update()
+        .filter(pk__in=sorted(account_ids))
+        .order_by('pk')
+        .values_list('pk', flat=True)
+    )
+
+
+def adjust_balances(deltas):
+    """
+    Add each delta in an {account_id: delta} mapping to the account balance
+    and stamp the account version. Callers must hold the account locks.
+    """
+    version = new_version()
+    for account_id in sorted(deltas):
+        Account.objects.filter(pk=account_id).update(
+            balance=F('balance') + deltas[account_id],
+            version=version,
+        )
+
+
+def adjust_daily_totals(deltas):
+    """
+    Apply {(account_id, category_id, date): [income, expenses, count]}
+    deltas to the daily totals, creating missing rows. Callers must hold
+    the account locks, which keeps two writers from creating the same row.
+    """
+    from .models import DailyAccountCategoryTotal
+
+    for (account_id, category_id, date), (income, expenses, count) in deltas.items():
+        pk = (
+            DailyAccountCategoryTotal.objects
+            .filter(account_id=account_id, category_id=category_id, date=date)
+            .order_by('pk')
+            .values_list('pk', flat=True)
+            .first()
+        )
+        if pk is None:
+            DailyAccountCategoryTotal.objects.create(
+                account_id=account_id,
+                category_id=category_id,
+                date=date,
+                income=income,
+                expenses=expenses,
+                count=count,
+            )
+        else:
+            DailyAccountCategoryTotal.objects.filter(pk=pk).update(
+                income=F('income') + income,
+                expenses=F('expenses') + expenses,
+                count=F('count') + count,
+            )
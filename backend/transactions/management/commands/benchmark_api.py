@@ -0,0 +1,45 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from transactions.benchmarks import run_benchmarks
+from transactions.synthetic import SYNTHETIC_PASSWORD
+
+
+class Command(BaseCommand):
+    help = 'Times the key API endpoints against a generated dataset and reports p50/p95 latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix',
+            default='bench',
+            help='Username prefix the dataset was generated with',
+        )
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per endpoint')
+        parser.add_argument('--output', help='Also write the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        try:
+            results = run_benchmarks(
+                f'{prefix}_user_0', f'{prefix}_admin', SYNTHETIC_PASSWORD, options['iterations']
+            )
+        except ValueError as e:
+            raise CommandError(f'{e}. Generate a dataset with generate_data first.')
+
+        self.stdout.write(f'{"endpoint":<26}{"p50 ms":>10}{"p95 ms":>10}{"queries":>9}{"bytes":>10}')
+        for result in results:
+            self.stdout.write(
+                f'{result["endpoint"]:<26}{result["p50_ms"]:>10.2f}{result["p95_ms"]:>10.2f}'
+                f'{result["queries"]:>9}{result["bytes"]:>10}'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'database': connection.vendor,
+                    'iterations': options['iterations'],
+                    'results': results,
+                }, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Wrote results to {options["output"]}'))
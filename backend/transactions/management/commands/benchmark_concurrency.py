@@ -0,0 +1,84 @@
+import json
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from accounts.models import Account
+from accounts.views import AccountListCreateView, AsyncAccountListCreateView
+from transactions.benchmarks import measure_concurrency
+from transactions.views import AsyncTransactionsByAccountView, AsyncTransactionSummaryView, TransactionViewSet
+from users.serializers import UserClaimsTokenObtainPairSerializer
+from users.views import AsyncMeView, MeView
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the throughput of the sync and async versions of the hot read '
+        'endpoints under concurrent requests on one event loop'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix',
+            default='bench',
+            help='Username prefix the dataset was generated with',
+        )
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and mode')
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight at once')
+        parser.add_argument('--output', help='Also write the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        username = f'{options["prefix"]}_user_0'
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f'User {username} does not exist. Generate a dataset with generate_data first.')
+        # Login tokens carry the claims that let authentication skip the user query
+        token = UserClaimsTokenObtainPairSerializer.get_token(user).access_token
+        headers = {'authorization': f'Bearer {token}'}
+        account_id = Account.objects.filter(user=user).order_by('pk').values_list('pk', flat=True).first()
+
+        endpoints = [
+            (
+                '/api/accounts/',
+                AccountListCreateView.as_view(),
+                AsyncAccountListCreateView.as_view(),
+            ),
+            (
+                f'/api/transactions/by_account/?account_id={account_id}',
+                TransactionViewSet.as_view({'get': 'by_account'}),
+                AsyncTransactionsByAccountView.as_view(),
+            ),
+            (
+                '/api/transactions/summary/',
+                TransactionViewSet.as_view({'get': 'summary'}),
+                AsyncTransactionSummaryView.as_view(),
+            ),
+            ('/api/auth/me/', MeView.as_view(), AsyncMeView.as_view()),
+        ]
+
+        results = []
+        try:
+            for path, sync_view, async_view in endpoints:
+                for mode, view in (('sync', sync_to_async(sync_view)), ('async', async_view)):
+                    result = async_to_sync(measure_concurrency)(
+                        view, path, headers, options['requests'], options['concurrency']
+                    )
+                    results.append({'mode': mode, **result})
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f'{"endpoint":<52}{"mode":>6}{"req/s":>10}')
+        for result in results:
+            self.stdout.write(
+                f'{result["endpoint"]:<52}{result["mode"]:>6}{result["requests_per_second"]:>10.1f}'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({'database': connection.vendor, 'results': results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Wrote results to {options["output"]}'))
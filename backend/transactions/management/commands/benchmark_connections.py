@@ -0,0 +1,58 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework_simplejwt.tokens import AccessToken
+
+from transactions.benchmarks import measure_connection_reuse
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends requests through the WSGI application and reports how many database '
+        'connections they opened under the current connection settings'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix',
+            default='bench',
+            help='Username prefix the dataset was generated with',
+        )
+        parser.add_argument('--path', default='/api/accounts/', help='Endpoint to request')
+        parser.add_argument('--iterations', type=int, default=200, help='Requests to send')
+        parser.add_argument('--output', help='Also write the result as JSON to this file')
+
+    def handle(self, *args, **options):
+        username = f'{options["prefix"]}_user_0'
+        try:
+            user = User.objects.get(username=username)
+        except User.DoesNotExist:
+            raise CommandError(f'User {username} does not exist. Generate a dataset with generate_data first.')
+        headers = {'authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+        pool = connection.settings_dict['OPTIONS'].get('pool')
+        if pool:
+            mode = f'pool (max_size={pool.get("max_size")})'
+        else:
+            mode = f'CONN_MAX_AGE={connection.settings_dict["CONN_MAX_AGE"]}'
+
+        try:
+            result = measure_connection_reuse(options['path'], headers, options['iterations'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        result['mode'] = mode
+
+        self.stdout.write(f'{connection.vendor}, {mode}')
+        self.stdout.write(
+            f'{result["requests"]} requests opened {result["connections_opened"]} connections; '
+            f'p50 {result["p50_ms"]:.2f} ms, p95 {result["p95_ms"]:.2f} ms'
+        )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({'database': connection.vendor, **result}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Wrote results to {options["output"]}'))
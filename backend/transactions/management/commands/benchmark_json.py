@@ -0,0 +1,62 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from backend.parsers import FastJSONParser
+from backend.renderers import FastJSONRenderer, orjson
+from transactions.benchmarks import measure_codec
+from transactions.models import Transaction
+from transactions.serializers import TransactionSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Times rendering a large transaction list to JSON and parsing it back with '
+        "DRF's stdlib JSON classes and the orjson backed ones"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Transactions in the list')
+        parser.add_argument('--iterations', type=int, default=20, help='Timed runs per codec')
+        parser.add_argument('--output', help='Also write the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        transactions = list(
+            Transaction.objects.select_related('category', 'account')
+            .order_by('-transaction_date', '-id')[:options['rows']]
+        )
+        if not transactions:
+            raise CommandError('There are no transactions. Generate a dataset with generate_data first.')
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; both codecs use stdlib json'))
+
+        started = time.perf_counter()
+        data = TransactionSerializer(transactions, many=True).data
+        serialize_ms = (time.perf_counter() - started) * 1000
+        self.stdout.write(f'Serialized {len(data)} rows in {serialize_ms:.2f} ms')
+
+        stdlib_body, stdlib = measure_codec('stdlib', data, JSONRenderer(), JSONParser(), options['iterations'])
+        fast_body, fast = measure_codec('orjson', data, FastJSONRenderer(), FastJSONParser(), options['iterations'])
+
+        self.stdout.write(f'{"codec":<10}{"render ms":>12}{"parse ms":>12}{"rows/s":>14}{"bytes":>12}')
+        for result in (stdlib, fast):
+            rows_per_second = result['rows'] / (result['render_ms'] / 1000) if result['render_ms'] else 0
+            result['render_rows_per_second'] = round(rows_per_second)
+            self.stdout.write(
+                f'{result["codec"]:<10}{result["render_ms"]:>12.2f}{result["parse_ms"]:>12.2f}'
+                f'{result["render_rows_per_second"]:>14}{result["bytes"]:>12}'
+            )
+        identical = stdlib_body == fast_body
+        self.stdout.write(f'Identical output: {"yes" if identical else "no"}')
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({
+                    'serialize_ms': round(serialize_ms, 2),
+                    'identical_output': identical,
+                    'results': [stdlib, fast],
+                }, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Wrote results to {options["output"]}'))
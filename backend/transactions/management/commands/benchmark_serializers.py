@@ -0,0 +1,62 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.models import Account
+from accounts.serializers import AccountReadSerializer, AccountSerializer
+from transactions.benchmarks import measure_serializer
+from transactions.models import Transaction
+from transactions.serializers import TransactionReadSerializer, TransactionSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares rows per second of the model serializers and the values() '
+        'based read serializers on the transaction and account lists'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Rows per list')
+        parser.add_argument('--iterations', type=int, default=10, help='Timed runs per serializer')
+        parser.add_argument('--output', help='Also write the results as JSON to this file')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        transactions = Transaction.objects.select_related('category', 'account').order_by('-transaction_date', '-id')
+        accounts = Account.objects.select_related('user', 'currency', 'account_type').order_by('id')
+        if not transactions.exists():
+            raise CommandError('There are no transactions. Generate a dataset with generate_data first.')
+
+        cases = [
+            (
+                'transactions',
+                lambda: TransactionSerializer(transactions[:rows], many=True).data,
+                lambda: TransactionReadSerializer(TransactionReadSerializer.project(transactions)[:rows]).data,
+            ),
+            (
+                'accounts',
+                lambda: AccountSerializer(accounts[:rows], many=True).data,
+                lambda: AccountReadSerializer(AccountReadSerializer.project(accounts)[:rows]).data,
+            ),
+        ]
+
+        results = []
+        self.stdout.write(f'{"list":<14}{"serializer":<12}{"rows":>8}{"median ms":>12}{"rows/s":>12}')
+        for name, model_path, read_path in cases:
+            model_data, model_result = measure_serializer('model', model_path, options['iterations'])
+            read_data, read_result = measure_serializer('values', read_path, options['iterations'])
+            for result in (model_result, read_result):
+                result['list'] = name
+                results.append(result)
+                self.stdout.write(
+                    f'{name:<14}{result["serializer"]:<12}{result["rows"]:>8}'
+                    f'{result["median_ms"]:>12.2f}{result["rows_per_second"]:>12}'
+                )
+            if json.loads(json.dumps(model_data)) != read_data:
+                raise CommandError(f'The {name} serializers produced different output')
+
+        self.stdout.write('Both paths produced identical output')
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({'results': results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f'Wrote results to {options["output"]}'))
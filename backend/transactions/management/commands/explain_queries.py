@@ -0,0 +1,231 @@
+import re
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from accounts.models import Account
+from accounts.views import (
+    AccountListCreateView,
+    AdminAccountListView,
+    AdminAccountPagination,
+    AdminUserListCreateView,
+    AdminUserPagination,
+    user_account_stats,
+)
+from budgets.models import Budget
+from budgets.views import BudgetViewSet, GoalViewSet
+from notifications.models import PendingBudgetCheck
+from notifications.views import NotificationPagination, NotificationViewSet
+from transactions.models import DailyAccountCategoryTotal, Transaction
+from transactions.pagination import TransactionCursorPagination
+from transactions.views import TransactionViewSet
+
+User = get_user_model()
+
+# Full table scans in PostgreSQL and SQLite plans. SQLite reports index
+# scans as "SCAN table USING INDEX", which the pattern leaves out.
+SEQ_SCAN_PATTERNS = [
+    re.compile(r'Seq Scan on (\w+)'),
+    re.compile(r'\bSCAN (\w+)(?: AS \w+)?\s*$', re.MULTILINE),
+]
+
+
+def view_queryset(view_class, user, **query_params):
+    view = view_class()
+    view.request = SimpleNamespace(user=user, query_params=query_params)
+    view.kwargs = {}
+    return view.get_queryset()
+
+
+def endpoint_queries(user, account, category_id, today):
+    """
+    Return (name, queryset, full_scan_expected) for the queries behind each
+    endpoint and background job, shaped like the requests they serve.
+    """
+    transaction_page = TransactionCursorPagination.page_size + 1
+    notification_page = NotificationPagination.page_size + 1
+    admin_page = AdminUserPagination.page_size + 1
+    year_ago = today - timedelta(days=365)
+    return [
+        ('accounts list', view_queryset(AccountListCreateView, user), False),
+        (
+            'accounts list etag',
+            Account.objects.filter(user=user, deleted_at__isnull=True)
+            .values('user').annotate(Count('id'), Sum('version')),
+            False,
+        ),
+        (
+            'transactions list',
+            view_queryset(TransactionViewSet, user)
+            .order_by('-transaction_date', '-id')[:transaction_page],
+            False,
+        ),
+        (
+            'transactions list search',
+            view_queryset(TransactionViewSet, user)
+            .filter(description__icontains='transaction')
+            .order_by('-transaction_date', '-id')[:transaction_page],
+            False,
+        ),
+        (
+            'transactions by_account',
+            view_queryset(TransactionViewSet, user)
+            .filter(account__id=account.pk)
+            .order_by('-transaction_date', '-id')[:transaction_page],
+            False,
+        ),
+        (
+            'transactions by_account etag',
+            Account.objects.filter(pk=account.pk, user=user, deleted_at__isnull=True)
+            .values_list('version', flat=True),
+            False,
+        ),
+        (
+            'transactions summary',
+            DailyAccountCategoryTotal.objects.filter(
+                account__user=user, account__deleted_at__isnull=True, count__gt=0, date__gte=year_ago
+            ).values('category').annotate(Sum('income'), Sum('expenses')),
+            False,
+        ),
+        (
+            'transactions export',
+            Transaction.objects.filter(account__id=account.pk, account__user=user, account__deleted_at__isnull=True)
+            .order_by('-transaction_date', '-id'),
+            False,
+        ),
+        ('budgets list', view_queryset(BudgetViewSet, user), False),
+        ('goals list', view_queryset(GoalViewSet, user), False),
+        (
+            'notifications list',
+            view_queryset(NotificationViewSet, user)
+            .order_by(*NotificationPagination.ordering)[:notification_page],
+            False,
+        ),
+        (
+            'notifications list unread',
+            view_queryset(NotificationViewSet, user, is_read='false')
+            .order_by(*NotificationPagination.ordering)[:notification_page],
+            False,
+        ),
+        (
+            'recurring due templates',
+            Transaction.objects.exclude(frequency='none')
+            .filter(next_due_date__lte=today)
+            .order_by('next_due_date', 'id')[:500],
+            False,
+        ),
+        (
+            'budget alert coverage',
+            Budget.objects.filter(
+                account_id=account.pk,
+                category_id=category_id,
+                start_date__lte=today,
+                end_date__gte=today,
+            ).with_spent(),
+            False,
+        ),
+        # The queue is drained completely, so reading it in order is a scan
+        ('pending budget checks', PendingBudgetCheck.objects.order_by('pk')[:500], True),
+        (
+            'admin users list',
+            view_queryset(AdminUserListCreateView, user).order_by(*AdminUserPagination.ordering)[:admin_page],
+            False,
+        ),
+        (
+            'admin users search',
+            view_queryset(AdminUserListCreateView, user, search=user.username[:3])
+            .order_by(*AdminUserPagination.ordering)[:admin_page],
+            False,
+        ),
+        ('admin user stats', user_account_stats([user.pk]), False),
+        # Walks the primary key index, which SQLite reports as a table scan
+        (
+            'admin accounts list',
+            view_queryset(AdminAccountListView, user).order_by(AdminAccountPagination.ordering)[:admin_page],
+            True,
+        ),
+    ]
+
+
+def sequential_scans(plan):
+    return sorted({table for pattern in SEQ_SCAN_PATTERNS for table in pattern.findall(plan)})
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs EXPLAIN on the queries behind each API endpoint for a seeded user '
+        'and reports the ones that scan whole tables'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--username',
+            help='User whose data the queries run against (defaults to the user with the most transactions)',
+        )
+        parser.add_argument(
+            '--planner-default',
+            action='store_true',
+            help=(
+                'On PostgreSQL, keep the planner free to choose sequential scans. By default they '
+                'are disabled, so a remaining Seq Scan means no index can serve the query.'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        user = self._get_user(options['username'])
+        account = user.accounts.annotate(count=Count('transactions')).order_by('-count', 'pk').first()
+        if account is None:
+            raise CommandError(f'{user.username} has no accounts; seed some data first')
+        category_id = (
+            account.transactions.exclude(category=None)
+            .values_list('category_id', flat=True)
+            .first()
+        )
+
+        flagged = []
+        with transaction.atomic():
+            if connection.vendor == 'postgresql' and not options['planner_default']:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for name, queryset, full_scan_expected in endpoint_queries(
+                user, account, category_id, timezone.now().date()
+            ):
+                plan = queryset.explain()
+                tables = sequential_scans(plan)
+                if options['verbosity'] > 1:
+                    self.stdout.write(f'{name}:\n{plan}\n')
+
+                if not tables:
+                    self.stdout.write(f'{name}: ok')
+                elif full_scan_expected:
+                    self.stdout.write(f'{name}: full scan of {", ".join(tables)} (expected)')
+                else:
+                    flagged.append(name)
+                    self.stdout.write(self.style.WARNING(
+                        f'{name}: sequential scan of {", ".join(tables)}'
+                    ))
+
+        if flagged:
+            raise CommandError(f'{len(flagged)} queries use sequential scans: {", ".join(flagged)}')
+        self.stdout.write(self.style.SUCCESS('No unexpected sequential scans'))
+
+    def _get_user(self, username):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'User {username} does not exist')
+        user = (
+            User.objects.annotate(count=Count('accounts__transactions'))
+            .order_by('-count', 'pk')
+            .first()
+        )
+        if user is None:
+            raise CommandError('The database has no users; seed some data first')
+        return user
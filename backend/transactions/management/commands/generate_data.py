@@ -0,0 +1,47 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from transactions.synthetic import SYNTHETIC_PASSWORD, generate_dataset
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Generates a deterministic synthetic dataset of users, accounts and transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='Number of users to create')
+        parser.add_argument('--accounts', type=int, default=3, help='Accounts per user')
+        parser.add_argument('--transactions', type=int, default=1000, help='Transactions per account')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed yields the same data')
+        parser.add_argument(
+            '--prefix',
+            default='bench',
+            help='Prefix of the generated usernames, so several datasets can coexist',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of rows inserted per bulk_create call',
+        )
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if User.objects.filter(username__startswith=f'{prefix}_').exists():
+            raise CommandError(f'Users prefixed {prefix}_ already exist; pick another --prefix')
+
+        counts = generate_dataset(
+            options['users'],
+            options['accounts'],
+            options['transactions'],
+            seed=options['seed'],
+            prefix=prefix,
+            batch_size=options['batch_size'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {counts.get('users', 0)} users, {counts.get('accounts', 0)} accounts and "
+            f"{counts.get('transactions', 0)} transactions. Log in as {prefix}_user_0 or "
+            f"{prefix}_admin with password {SYNTHETIC_PASSWORD}"
+        ))
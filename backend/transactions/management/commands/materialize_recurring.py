@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from transactions.recurring import materialize_due
+
+
+class Command(BaseCommand):
+    help = 'Creates the occurrences of recurring transactions that have fallen due'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            help='Materialize occurrences due on or before this date (YYYY-MM-DD, defaults to today)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of recurring transactions to claim per database transaction',
+        )
+
+    def handle(self, *args, **options):
+        today = None
+        if options['date']:
+            today = parse_date(options['date'])
+            if today is None:
+                raise CommandError('--date must be a date in YYYY-MM-DD format')
+
+        templates, occurrences = materialize_due(today, options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {occurrences} occurrences for {templates} recurring transactions'
+        ))
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+from accounts.models import Account
+from transactions.ledger import lock_accounts
+from transactions.models import DailyAccountCategoryTotal, Transaction
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the daily per-account, per-category transaction totals'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Number of accounts to rebuild per aggregate query',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        account_ids = list(Account.objects.order_by('pk').values_list('pk', flat=True))
+        created_count = 0
+
+        for start in range(0, len(account_ids), batch_size):
+            created_count += self._rebuild_batch(account_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt daily totals for {len(account_ids)} accounts ({created_count} rows)'
+        ))
+
+    def _rebuild_batch(self, account_ids):
+        # Use transaction so readers never see a half-rebuilt batch
+        with transaction.atomic():
+            lock_accounts(account_ids)
+            DailyAccountCategoryTotal.objects.filter(account_id__in=account_ids).delete()
+            totals = (
+                Transaction.objects.filter(account_id__in=account_ids)
+                .annotate(date=TruncDate('transaction_date'))
+                .values('account_id', 'category_id', 'date')
+                .annotate(
+                    income=Sum('amount', filter=Q(amount__gt=0)),
+                    expenses=Sum('amount', filter=Q(amount__lte=0)),
+                    count=Count('id'),
+                )
+                .order_by()
+            )
+            rows = [
+                DailyAccountCategoryTotal(
+                    account_id=row['account_id'],
+                    category_id=row['category_id'],
+                    date=row['date'],
+                    income=row['income'] or 0,
+                    expenses=row['expenses'] or 0,
+                    count=row['count'],
+                )
+                for row in totals
+            ]
+            DailyAccountCategoryTotal.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-17 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_initial"),
+        ("categories", "0001_initial"),
+        ("transactions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["account", "-transaction_date", "-id"],
+                name="transaction_account_date_idx",
+            ),
+        ),
+    ]
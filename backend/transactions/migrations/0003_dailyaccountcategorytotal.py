@@ -0,0 +1,97 @@
+# Generated by Django 5.1.7 on 2026-10-17 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_daily_totals(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    DailyAccountCategoryTotal = apps.get_model("transactions", "DailyAccountCategoryTotal")
+
+    totals = (
+        Transaction.objects.annotate(date=TruncDate("transaction_date"))
+        .values("account_id", "category_id", "date")
+        .annotate(
+            income=Sum("amount", filter=Q(amount__gt=0)),
+            expenses=Sum("amount", filter=Q(amount__lte=0)),
+            count=Count("id"),
+        )
+        .order_by()
+    )
+    DailyAccountCategoryTotal.objects.bulk_create(
+        (
+            DailyAccountCategoryTotal(
+                account_id=row["account_id"],
+                category_id=row["category_id"],
+                date=row["date"],
+                income=row["income"] or 0,
+                expenses=row["expenses"] or 0,
+                count=row["count"],
+            )
+            for row in totals.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0003_account_opening_balance"),
+        ("categories", "0001_initial"),
+        ("transactions", "0002_transaction_account_date_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyAccountCategoryTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "income",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                (
+                    "expenses",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+                ("count", models.IntegerField(default=0)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_totals",
+                        to="accounts.account",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="daily_totals",
+                        to="categories.category",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "category", "date"),
+                        name="daily_total_account_category_date_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_daily_totals, migrations.RunPython.noop),
+    ]
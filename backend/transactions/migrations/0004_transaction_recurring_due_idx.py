@@ -0,0 +1,19 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("transactions", "0003_dailyaccountcategorytotal"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["frequency", "next_due_date"],
+                name="transaction_recurring_due_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.7 on 2026-10-17 17:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_account_user_index'),
+        ('categories', '0001_initial'),
+        ('transactions', '0004_transaction_recurring_due_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='transaction_recurring_due_idx',
+        ),
+        migrations.AlterField(
+            model_name='dailyaccountcategorytotal',
+            name='account',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_totals', to='accounts.account'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='account',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='transactions', to='accounts.account'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('frequency', 'none'), _negated=True), fields=['next_due_date', 'id'], name='transaction_recurring_due_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+from django.db.models.functions import Upper
+
+# Matches the UPPER(description) LIKE pattern of description__icontains on
+# PostgreSQL, so substring searches use the trigram index. Other databases
+# search without an index.
+DESCRIPTION_SEARCH_INDEX = GinIndex(
+    OpClass(Upper('description'), name='gin_trgm_ops'),
+    name='transaction_description_trgm_idx',
+)
+
+
+def add_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.add_index(apps.get_model('transactions', 'Transaction'), DESCRIPTION_SEARCH_INDEX)
+
+
+def remove_search_index(apps, schema_editor):
+    # The pg_trgm extension stays installed
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('transactions', 'Transaction'), DESCRIPTION_SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0005_query_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_index, remove_search_index),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction as db_transaction
+from django.db.models import Q
 from accounts.models import Account
 from categories.models import Category
+from .ledger import LEDGER_FIELDS, LedgerRow, apply_changes
 
 
 class Transaction(models.Model):
@@ -12,8 +14,9 @@ class Transaction(models.Model):
         ("yearly", "Yearly"),
     ]
 
+    # Account lookups use transaction_account_date_idx
     account = models.ForeignKey(
-        Account, on_delete=models.CASCADE, related_name="transactions", db_index=True
+        Account, on_delete=models.CASCADE, related_name="transactions", db_index=False
     )
     category = models.ForeignKey(
         Category, on_delete=models.SET_NULL, null=True, related_name="transactions"
@@ -30,9 +33,92 @@ class Transaction(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Backs keyset pagination of an account's history, newest first
+            models.Index(
+                fields=["account", "-transaction_date", "-id"],
+                name="transaction_account_date_idx",
+            ),
+            # Lets the recurring scheduler range-scan due schedules; one-time
+            # transactions, nearly all rows, are left out of the index
+            models.Index(
+                fields=["next_due_date", "id"],
+                condition=~Q(frequency="none"),
+                name="transaction_recurring_due_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        with db_transaction.atomic():
+            previous = None
+            if self.pk is not None:
+                previous = (
+                    Transaction.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list(*LEDGER_FIELDS)
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            apply_changes(
+                removed=[LedgerRow._make(previous)] if previous else [],
+                added=[self.ledger_row()],
+            )
+
+    def delete(self, *args, **kwargs):
+        with db_transaction.atomic():
+            current = (
+                Transaction.objects.select_for_update()
+                .filter(pk=self.pk)
+                .values_list(*LEDGER_FIELDS)
+                .first()
+            )
+            result = super().delete(*args, **kwargs)
+            if current:
+                apply_changes(removed=[LedgerRow._make(current)])
+        return result
+
+    def ledger_row(self):
+        return LedgerRow(self.account_id, self.category_id, self.transaction_date, self.amount)
+
     def is_recurring(self):
         return self.frequency != "none"
 
     def __str__(self):
         rec = f" ({self.frequency})" if self.is_recurring() else ""
         return f"{self.category.name}: {self.amount} ({self.account.name}){rec}"
+
+
+class DailyAccountCategoryTotal(models.Model):
+    """
+    Per-day totals of an account's transactions in one category, kept
+    current by transactions.ledger so reports scale with days rather
+    than with the number of transactions.
+    """
+    # Account lookups use the unique constraint's index
+    account = models.ForeignKey(
+        Account, on_delete=models.CASCADE, related_name="daily_totals", db_index=False
+    )
+    category = models.ForeignKey(
+        Category, on_delete=models.SET_NULL, null=True, related_name="daily_totals"
+    )
+    date = models.DateField()
+    # Positive and negative amounts are summed separately
+    income = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    expenses = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "category", "date"],
+                name="daily_total_account_category_date_uniq",
+            ),
+        ]
+
+    @property
+    def total(self):
+        return self.income + self.expenses
+
+    def __str__(self):
+        return f"{self.date} {self.category_id}: {self.total} ({self.account_id})"
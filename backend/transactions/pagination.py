@@ -0,0 +1,217 @@
+from base64 import b64decode, b64encode
+from datetime import datetime
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def encode_cursor(transaction_date, pk, reverse=False):
+    """
+    Build an opaque cursor pointing at a (transaction_date, id) position.
+    """
+    tokens = {'d': transaction_date.isoformat(), 'i': pk}
+    if reverse:
+        tokens['r'] = '1'
+    querystring = parse.urlencode(tokens, doseq=True)
+    return b64encode(querystring.encode('ascii')).decode('ascii')
+
+
+def decode_cursor(encoded):
+    """
+    Return the (transaction_date, id, reverse) tuple stored in a cursor.
+    Raises ValueError when the cursor is malformed.
+    """
+    try:
+        querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+        tokens = parse.parse_qs(querystring, keep_blank_values=True)
+        transaction_date = datetime.fromisoformat(tokens['d'][0])
+        pk = int(tokens['i'][0])
+        reverse = tokens.get('r', ['0'])[0] == '1'
+    except (TypeError, ValueError, KeyError, UnicodeError):
+        raise ValueError('Invalid cursor')
+    return transaction_date, pk, reverse
+
+
+def keyset_queryset(queryset, page_size, cursor=None):
+    """
+    Return the query for one page past the cursor position, seeking on the
+    (transaction_date, id) index instead of using OFFSET. It fetches one
+    extra row to find out whether another page exists.
+    """
+    if cursor is not None:
+        transaction_date, pk, reverse = cursor
+        if reverse:
+            queryset = queryset.filter(
+                Q(transaction_date__gt=transaction_date)
+                | Q(transaction_date=transaction_date, id__gt=pk)
+            )
+        else:
+            queryset = queryset.filter(
+                Q(transaction_date__lt=transaction_date)
+                | Q(transaction_date=transaction_date, id__lt=pk)
+            )
+
+    if cursor is not None and cursor[2]:
+        queryset = queryset.order_by('transaction_date', 'id')
+    else:
+        queryset = queryset.order_by('-transaction_date', '-id')
+    return queryset[:page_size + 1]
+
+
+def keyset_page(rows, page_size, cursor=None):
+    """
+    Turn the rows fetched by keyset_queryset into (rows, next_position,
+    previous_position) where each position is a (transaction_date, id,
+    reverse) tuple or None. Rows are model instances or named
+    values_list() rows.
+    """
+    reverse = cursor is not None and cursor[2]
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+
+    if not rows:
+        return rows, None, None
+
+    first, last = rows[0], rows[-1]
+    if reverse:
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, cursor is not None
+
+    next_position = (last.transaction_date, last.id, False) if has_next else None
+    previous_position = (first.transaction_date, first.id, True) if has_previous else None
+    return rows, next_position, previous_position
+
+
+def paginate_by_keyset(queryset, page_size, cursor=None):
+    """
+    Return one page of transactions newest first, seeking past the cursor
+    position on the (transaction_date, id) index instead of using OFFSET.
+
+    Returns (rows, next_position, previous_position) where each position is
+    a (transaction_date, id, reverse) tuple or None.
+    """
+    rows = list(keyset_queryset(queryset, page_size, cursor))
+    return keyset_page(rows, page_size, cursor)
+
+
+async def apaginate_by_keyset(queryset, page_size, cursor=None):
+    """
+    Async version of paginate_by_keyset.
+    """
+    rows = [row async for row in keyset_queryset(queryset, page_size, cursor)]
+    return keyset_page(rows, page_size, cursor)
+
+
+class TransactionCursorPagination(BasePagination):
+    """
+    Keyset pagination over transactions ordered by (-transaction_date, -id).
+
+    Every page is a single index range scan, so fetching page N costs the
+    same as fetching page 1.
+    """
+    cursor_query_param = 'cursor'
+    cursor_query_description = 'The pagination cursor value.'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    page_size_query_description = 'Number of results to return per page.'
+    max_page_size = 500
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size, cursor = self._read_request(request)
+        rows, self.next_position, self.previous_position = paginate_by_keyset(
+            queryset, page_size, cursor
+        )
+        return rows
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_size, cursor = self._read_request(request)
+        rows, self.next_position, self.previous_position = await apaginate_by_keyset(
+            queryset, page_size, cursor
+        )
+        return rows
+
+    def _read_request(self, request):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        cursor = None
+        if encoded:
+            try:
+                cursor = decode_cursor(encoded)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+        return self.get_page_size(request), cursor
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def get_next_link(self):
+        return self._get_link(self.next_position)
+
+    def get_previous_link(self):
+        return self._get_link(self.previous_position)
+
+    def _get_link(self, position):
+        if position is None:
+            return None
+        encoded = encode_cursor(*position)
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': self.cursor_query_description,
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': self.page_size_query_description,
+                'schema': {'type': 'integer'},
+            },
+        ]
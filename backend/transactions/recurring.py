@@ -0,0 +1,109 @@
+"""
+Materializes occurrences of recurring transactions.
+
+A recurring transaction acts as a template: its next_due_date is the day
+of the next occurrence still to be generated. Each run creates every
+occurrence that has fallen due and moves next_due_date past today.
+"""
+import calendar
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from .ledger import apply_changes
+from .models import Transaction
+
+
+def next_occurrence(day, frequency, anchor_day):
+    """
+    Return the occurrence after day. Monthly and yearly schedules keep the
+    template's day of month, clamped to the length of shorter months.
+    """
+    if frequency == 'daily':
+        return day + timedelta(days=1)
+    if frequency == 'weekly':
+        return day + timedelta(weeks=1)
+    if frequency == 'monthly':
+        year, month = divmod(day.year * 12 + day.month, 12)
+        month += 1
+    elif frequency == 'yearly':
+        year, month = day.year + 1, day.month
+    else:
+        raise ValueError(f'{frequency} is not a recurring frequency')
+    return day.replace(
+        year=year, month=month, day=min(anchor_day, calendar.monthrange(year, month)[1])
+    )
+
+
+def local_datetime(transaction_date):
+    if timezone.is_aware(transaction_date):
+        return timezone.localtime(transaction_date)
+    return transaction_date
+
+
+def build_occurrences(template, today):
+    """
+    Return unsaved transactions for every due occurrence of the template
+    and advance template.next_due_date past today.
+    """
+    start = local_datetime(template.transaction_date)
+    occurrences = []
+    due = template.next_due_date
+    while due <= today:
+        transaction_date = datetime.combine(due, start.time())
+        if settings.USE_TZ:
+            transaction_date = timezone.make_aware(transaction_date)
+        occurrences.append(Transaction(
+            account_id=template.account_id,
+            category_id=template.category_id,
+            amount=template.amount,
+            description=template.description,
+            transaction_date=transaction_date,
+        ))
+        due = next_occurrence(due, template.frequency, start.day)
+    template.next_due_date = due
+    return occurrences
+
+
+def materialize_batch(today, batch_size):
+    """
+    Claim up to batch_size due templates, insert their occurrences and
+    advance their schedules in one database transaction. Rows locked by a
+    concurrent runner are skipped. Returns (templates, occurrences) counts.
+    """
+    with db_transaction.atomic():
+        templates = list(
+            Transaction.objects.select_for_update(skip_locked=True)
+            .exclude(frequency='none')
+            # Accounts pending deletion get no new occurrences
+            .filter(next_due_date__lte=today, account__deleted_at__isnull=True)
+            .order_by('next_due_date', 'id')[:batch_size]
+        )
+        occurrences = []
+        for template in templates:
+            occurrences.extend(build_occurrences(template, today))
+        Transaction.objects.bulk_create(occurrences, batch_size=1000)
+        # bulk_create skips Transaction.save(), so report the rows to the ledger
+        apply_changes(added=[occurrence.ledger_row() for occurrence in occurrences])
+        Transaction.objects.bulk_update(templates, ['next_due_date'], batch_size=1000)
+    return len(templates), len(occurrences)
+
+
+def materialize_due(today=None, batch_size=500):
+    """
+    Generate all occurrences due on or before today. Safe to run from
+    several workers at once: each batch only sees templates no other
+    worker holds, and committed batches are no longer due.
+    """
+    if today is None:
+        today = timezone.localdate()
+    template_count = occurrence_count = 0
+    while True:
+        templates, occurrences = materialize_batch(today, batch_size)
+        if not templates:
+            break
+        template_count += templates
+        occurrence_count += occurrences
+    return template_count, occurrence_count
@@ -1,5 +1,11 @@
+import os
+
 from rest_framework import serializers
+from backend.projections import DATE, DATETIME, ValuesSerializer, decimal_field
 from .models import Transaction
+from .importers import IMPORT_FORMATS
+from .filters import TRANSACTION_FILTERS, filter_transactions
+from accounts.models import Account
 from categories.models import Category
 
 
@@ -20,3 +26,179 @@ class TransactionSerializer(serializers.ModelSerializer):
     
     def get_account_name(self, obj):
         return obj.account.name if obj.account else None
+
+
+class TransactionReadSerializer(ValuesSerializer):
+    """
+    TransactionSerializer's output built from a values_list() projection.
+    """
+    lookups = (
+        'id', 'account_id', 'amount', 'transaction_date', 'description',
+        'category_id', 'category__name', 'account__name', 'frequency', 'next_due_date',
+    )
+    amount_field = decimal_field(Transaction, 'amount')
+
+    def to_representation(self, row):
+        return {
+            'id': row.id,
+            'account': row.account_id,
+            'amount': self.amount_field.to_representation(row.amount),
+            'transaction_date': DATETIME.to_representation(row.transaction_date),
+            'description': row.description,
+            'category': row.category_id,
+            'category_name': row.category__name,
+            'account_name': row.account__name,
+            'frequency': row.frequency,
+            'next_due_date': DATE.to_representation(row.next_due_date) if row.next_due_date else None,
+        }
+
+
+class TransactionSummarySerializer(serializers.Serializer):
+    """
+    One aggregated bucket of transactions for a period and category.
+    Expenses are reported as a negative sum, matching transaction amounts.
+    """
+    period = serializers.DateField()
+    category = serializers.IntegerField(allow_null=True)
+    category_name = serializers.CharField(allow_null=True)
+    is_income = serializers.BooleanField(allow_null=True)
+    income = serializers.DecimalField(max_digits=14, decimal_places=2)
+    expenses = serializers.DecimalField(max_digits=14, decimal_places=2)
+    net = serializers.DecimalField(max_digits=14, decimal_places=2)
+    count = serializers.IntegerField()
+
+
+class TransactionSummaryTotalsSerializer(serializers.Serializer):
+    income = serializers.DecimalField(max_digits=14, decimal_places=2)
+    expenses = serializers.DecimalField(max_digits=14, decimal_places=2)
+    net = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class TransactionSummaryResponseSerializer(serializers.Serializer):
+    period = serializers.CharField()
+    totals = TransactionSummaryTotalsSerializer()
+    results = TransactionSummarySerializer(many=True)
+    largest_expense = TransactionSerializer(allow_null=True)
+    largest_income = TransactionSerializer(allow_null=True)
+
+
+class TransactionBulkSelectionSerializer(serializers.Serializer):
+    """
+    Selects the transactions a bulk action applies to: either explicit ids
+    or the filters accepted by the list endpoint, plus an optional account_id.
+    """
+    max_ids = 1000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=max_ids,
+        required=False
+    )
+    filter = serializers.DictField(
+        # Blank values select nothing, which would widen the selection to
+        # every transaction, so they are rejected
+        child=serializers.CharField(),
+        allow_empty=False,
+        required=False,
+        help_text="List filters, e.g. {\"category\": \"none\", \"date_to\": \"2025-01-31\"}"
+    )
+
+    def validate_filter(self, params):
+        # A misspelt filter must not widen the selection to every transaction
+        unknown = sorted(set(params) - set(TRANSACTION_FILTERS) - {'account_id'})
+        if unknown:
+            raise serializers.ValidationError(f"Unknown filters: {', '.join(unknown)}")
+        try:
+            filter_transactions(Transaction.objects.none(), params)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        account_id = params.get('account_id')
+        if account_id and not account_id.isdigit():
+            raise serializers.ValidationError('account_id must be an account id')
+        return params
+
+    def validate(self, attrs):
+        if ('ids' in attrs) == ('filter' in attrs):
+            raise serializers.ValidationError('Provide either ids or filter.')
+        return attrs
+
+    def select(self, queryset):
+        """
+        Return (queryset, ids) for the bulk writers in transactions.bulk.
+        """
+        ids = self.validated_data.get('ids')
+        if ids is not None:
+            return queryset, ids
+        params = self.validated_data['filter']
+        queryset = filter_transactions(queryset, params)
+        if params.get('account_id'):
+            queryset = queryset.filter(account__id=int(params['account_id']))
+        return queryset, None
+
+
+class TransactionBulkChangesSerializer(serializers.ModelSerializer):
+    account = serializers.PrimaryKeyRelatedField(queryset=Account.objects.all(), required=False)
+
+    class Meta:
+        model = Transaction
+        fields = ['account', 'category', 'description', 'frequency', 'next_due_date']
+        extra_kwargs = {field: {'required': False} for field in fields}
+
+    def validate_account(self, account):
+        if account.user_id != self.context['request'].user.pk or account.deleted_at is not None:
+            raise serializers.ValidationError(
+                f'Invalid pk "{account.pk}" - object does not exist.'
+            )
+        return account
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError('Provide at least one field to change.')
+        return attrs
+
+
+class TransactionBulkUpdateSerializer(TransactionBulkSelectionSerializer):
+    changes = TransactionBulkChangesSerializer()
+
+
+class TransactionBulkResultSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+
+
+class TransactionImportSerializer(serializers.Serializer):
+    account = serializers.PrimaryKeyRelatedField(queryset=Account.objects.all())
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=IMPORT_FORMATS,
+        required=False,
+        help_text="Defaults to the file extension"
+    )
+
+    def validate_account(self, account):
+        if account.user_id != self.context['request'].user.pk or account.deleted_at is not None:
+            raise serializers.ValidationError(
+                f'Invalid pk "{account.pk}" - object does not exist.'
+            )
+        return account
+
+    def validate(self, attrs):
+        if 'file_format' not in attrs:
+            extension = os.path.splitext(attrs['file'].name)[1].lstrip('.').lower()
+            if extension not in IMPORT_FORMATS:
+                raise serializers.ValidationError(
+                    {'file_format': 'Could not infer the file format; please specify it.'}
+                )
+            attrs['file_format'] = extension
+        return attrs
+
+
+class TransactionImportErrorSerializer(serializers.Serializer):
+    row = serializers.IntegerField()
+    errors = serializers.DictField(child=serializers.ListField(child=serializers.CharField()))
+
+
+class TransactionImportResultSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+    errors = TransactionImportErrorSerializer(many=True)
@@ -0,0 +1,145 @@
+"""
+Deterministic synthetic data for benchmarks and query plan checks.
+
+Rows are inserted with bulk_create in batches. Balances and daily totals
+are computed while the transactions are generated and written with them,
+so a generated dataset is consistent without replaying the ledger.
+"""
+import random
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction as db_transaction
+from django.db.models import F
+from django.utils import timezone
+
+from accounts.models import Account, AccountType, Currency, new_version
+from categories.models import Category
+from .ledger import rollup_date
+from .models import DailyAccountCategoryTotal, Transaction
+
+User = get_user_model()
+
+SYNTHETIC_PASSWORD = 'benchmark-pass-123'
+
+CURRENCIES = [('USD', 'US Dollar', '$'), ('EUR', 'Euro', '€'), ('PLN', 'Polish Zloty', 'zł')]
+ACCOUNT_TYPES = ['Checking', 'Savings', 'Credit Card']
+CATEGORIES = [
+    ('Salary', True), ('Investments', True),
+    ('Food & Groceries', False), ('Housing', False), ('Entertainment', False),
+    ('Transport', False), ('Health', False), ('Utilities', False),
+]
+
+# Transactions are spread over this many days before now
+HISTORY_DAYS = 730
+
+
+def reference_data():
+    """
+    Return (currency_ids, account_type_ids, categories) for the generator,
+    creating missing rows. categories is a list of (id, is_income).
+    """
+    currencies = [
+        Currency.objects.get_or_create(code=code, defaults={'name': name, 'symbol': symbol})[0].pk
+        for code, name, symbol in CURRENCIES
+    ]
+    account_types = [AccountType.objects.get_or_create(name=name)[0].pk for name in ACCOUNT_TYPES]
+    categories = [
+        (Category.objects.get_or_create(name=name, defaults={'is_income': is_income})[0].pk, is_income)
+        for name, is_income in CATEGORIES
+    ]
+    return currencies, account_types, categories
+
+
+def generate_dataset(users, accounts_per_user, transactions_per_account, seed=0,
+                     prefix='bench', batch_size=5000):
+    """
+    Create users x accounts_per_user x transactions_per_account rows plus a
+    staff user named f'{prefix}_admin'. Every user's password is
+    SYNTHETIC_PASSWORD. The same arguments always produce the same rows,
+    with dates counted back from the time of generation. Returns a dict of created row counts.
+    """
+    rng = random.Random(seed)
+    now = timezone.now().replace(microsecond=0)
+    password = make_password(SYNTHETIC_PASSWORD)
+    counts = defaultdict(int)
+
+    with db_transaction.atomic():
+        currencies, account_types, categories = reference_data()
+
+        User.objects.create_user(
+            username=f'{prefix}_admin', password=SYNTHETIC_PASSWORD, is_staff=True
+        )
+        for start in range(0, users, batch_size):
+            user_batch = User.objects.bulk_create([
+                User(username=f'{prefix}_user_{i}', email=f'{prefix}_user_{i}@example.com', password=password)
+                for i in range(start, min(start + batch_size, users))
+            ])
+            counts['users'] += len(user_batch)
+
+            account_batch = []
+            for user in user_batch:
+                for number in range(accounts_per_user):
+                    balance = Decimal(rng.randint(0, 500000)) / 100
+                    account_batch.append(Account(
+                        user=user,
+                        name=f'Account {number + 1}',
+                        balance=balance,
+                        opening_balance=balance,
+                        currency_id=rng.choice(currencies),
+                        account_type_id=rng.choice(account_types),
+                        version=new_version(),
+                    ))
+            Account.objects.bulk_create(account_batch)
+            counts['accounts'] += len(account_batch)
+
+            for account in account_batch:
+                counts['transactions'] += _generate_transactions(
+                    rng, account, transactions_per_account, categories, now, batch_size
+                )
+    return dict(counts)
+
+
+def _generate_transactions(rng, account, count, categories, now, batch_size):
+    total = Decimal('0')
+    daily = defaultdict(lambda: [Decimal('0'), Decimal('0'), 0])
+
+    for start in range(0, count, batch_size):
+        batch = []
+        for _ in range(min(batch_size, count - start)):
+            category_id, is_income = rng.choice(categories)
+            cents = rng.randint(100, 500000) if is_income else -rng.randint(100, 30000)
+            amount = Decimal(cents) / 100
+            transaction_date = now - timedelta(seconds=rng.randint(0, HISTORY_DAYS * 86400))
+            batch.append(Transaction(
+                account_id=account.pk,
+                category_id=category_id,
+                amount=amount,
+                transaction_date=transaction_date,
+                description=f'Synthetic transaction {start + len(batch) + 1}',
+            ))
+            total += amount
+            day = daily[(category_id, rollup_date(transaction_date))]
+            day[0 if amount > 0 else 1] += amount
+            day[2] += 1
+        Transaction.objects.bulk_create(batch)
+
+    DailyAccountCategoryTotal.objects.bulk_create(
+        [
+            DailyAccountCategoryTotal(
+                account_id=account.pk,
+                category_id=category_id,
+                date=date,
+                income=income,
+                expenses=expenses,
+                count=day_count,
+            )
+            for (category_id, date), (income, expenses, day_count) in daily.items()
+        ],
+        batch_size=batch_size,
+    )
+    Account.objects.filter(pk=account.pk).update(balance=F('opening_balance') + total)
+    return count
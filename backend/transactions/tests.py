@@ -5,11 +5,33 @@ from rest_framework.test import APITestCase
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.utils import timezone
+from django.core.management import CommandError, call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncRequestFactory, override_settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
+from io import StringIO
+import io
+import json
+from asgiref.sync import sync_to_async
 from accounts.models import Account, AccountType, Currency
 from categories.models import Category
-from .models import Transaction
+from backend.parsers import FastJSONParser
+from backend.renderers import FastJSONRenderer
+from backend.testing import QueryBudgetMixin
+from .models import DailyAccountCategoryTotal, Transaction
+from .benchmarks import percentile
+from .management.commands.explain_queries import sequential_scans
+from .recurring import materialize_due, next_occurrence
+from .synthetic import generate_dataset
+from .serializers import TransactionReadSerializer, TransactionSerializer
+from .views import AsyncTransactionSummaryView, AsyncTransactionsByAccountView, TransactionViewSet
 
 User = get_user_model()
 
@@ -157,7 +179,7 @@ class TransactionAPITest(APITestCase):
         response = self.client.get(url, {'account_id': self.account.id})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
 
     def test_cannot_access_other_user_transactions(self):
         Transaction.objects.create(
@@ -176,7 +198,7 @@ class TransactionAPITest(APITestCase):
         response = self.client.get(url, {'account_id': self.other_account.id})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
     def test_delete_transaction(self):
         transaction = Transaction.objects.create(
@@ -203,3 +225,1133 @@ class TransactionAPITest(APITestCase):
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+class TransactionPaginationTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name='Test Account',
+            balance=Decimal('1000.00')
+        )
+        self.category = Category.objects.create(
+            name='Groceries',
+            is_income=False
+        )
+        # Two transactions share each timestamp so ties are broken by id
+        base_date = timezone.now()
+        for i in range(10):
+            Transaction.objects.create(
+                account=self.account,
+                category=self.category,
+                amount=Decimal('-1.00') * (i + 1),
+                transaction_date=base_date - timedelta(days=i // 2)
+            )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def expected_ids(self):
+        return list(
+            Transaction.objects.order_by('-transaction_date', '-id').values_list('id', flat=True)
+        )
+
+    def collect_pages(self, url, params):
+        ids = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(row['id'] for row in response.data['results'])
+            if not response.data['next']:
+                return ids, response
+            response = self.client.get(response.data['next'])
+
+    def test_by_account_walks_all_pages_in_order(self):
+        ids, last_response = self.collect_pages(
+            '/api/transactions/by_account/',
+            {'account_id': self.account.id, 'page_size': 3}
+        )
+        self.assertEqual(ids, self.expected_ids())
+        self.assertIsNotNone(last_response.data['previous'])
+
+    def test_list_is_paginated(self):
+        response = self.client.get('/api/transactions/', {'page_size': 4})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertIsNone(response.data['previous'])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_previous_link_returns_prior_page(self):
+        first = self.client.get('/api/transactions/', {'page_size': 4})
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+
+        self.assertEqual(
+            [row['id'] for row in back.data['results']],
+            [row['id'] for row in first.data['results']]
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/transactions/', {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+class TransactionQueryCountTest(QueryBudgetMixin, APITestCase):
+    # One query to load the authenticated user, one for the page of rows
+    LIST_QUERY_BUDGET = 2
+    # Plus the account change stamp behind the ETag
+    BY_ACCOUNT_QUERY_BUDGET = 3
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name='Test Account',
+            balance=Decimal('1000.00')
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def create_transactions(self, count):
+        for i in range(count):
+            category = Category.objects.create(name=f'Category {i}', is_income=False)
+            Transaction.objects.create(
+                account=self.account,
+                category=category,
+                amount=Decimal('-10.00'),
+                transaction_date=timezone.now()
+            )
+
+    def test_list_query_count_is_constant(self):
+        self.create_transactions(1)
+        self.assertQueryBudget(self.LIST_QUERY_BUDGET, '/api/transactions/')
+
+        self.create_transactions(25)
+        response = self.assertQueryBudget(self.LIST_QUERY_BUDGET, '/api/transactions/')
+        self.assertEqual(len(response.data['results']), 26)
+
+    def test_by_account_query_count_is_constant(self):
+        params = {'account_id': self.account.id}
+        self.create_transactions(1)
+        self.assertQueryBudget(self.BY_ACCOUNT_QUERY_BUDGET, '/api/transactions/by_account/', params)
+
+        self.create_transactions(25)
+        response = self.assertQueryBudget(
+            self.BY_ACCOUNT_QUERY_BUDGET, '/api/transactions/by_account/', params
+        )
+        self.assertEqual(response.data['results'][0]['account_name'], 'Test Account')
+
+class TransactionConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=self.user, name='Test Account')
+        self.category = Category.objects.create(name='Food', is_income=False)
+        self.transaction = Transaction.objects.create(
+            account=self.account,
+            category=self.category,
+            amount=Decimal('-10.00'),
+            transaction_date=timezone.now()
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        self.url = '/api/transactions/by_account/'
+        self.params = {'account_id': self.account.id}
+
+    def get_etag(self):
+        return self.client.get(self.url, self.params)['ETag']
+
+    def test_unchanged_account_returns_not_modified_without_list_query(self):
+        etag = self.get_etag()
+
+        # The user lookup of the authentication and the account change stamp
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_transaction_writes_change_etag(self):
+        etag = self.get_etag()
+        self.transaction.description = 'Lunch'
+        self.transaction.save()
+        self.assertNotEqual(self.get_etag(), etag)
+
+        etag = self.get_etag()
+        self.transaction.delete()
+        response = self.client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    def test_category_rename_changes_etag(self):
+        etag = self.get_etag()
+        self.category.name = 'Groceries'
+        self.category.save()
+        self.assertNotEqual(self.get_etag(), etag)
+
+    def test_other_users_account_has_no_etag(self):
+        other = User.objects.create_user(username='other', password='otherpass123')
+        account = Account.objects.create(user=other, name='Other Account')
+
+        response = self.client.get(self.url, {'account_id': account.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
+        self.assertEqual(response.data['results'], [])
+
+class AccountBalanceTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name='Test Account',
+            balance=Decimal('1000.00')
+        )
+        self.other_account = Account.objects.create(
+            user=self.user,
+            name='Savings',
+            balance=Decimal('0.00')
+        )
+        self.category = Category.objects.create(
+            name='Groceries',
+            is_income=False
+        )
+
+    def create_transaction(self, amount, account=None):
+        return Transaction.objects.create(
+            account=account or self.account,
+            category=self.category,
+            amount=Decimal(amount),
+            transaction_date=timezone.now()
+        )
+
+    def assertBalance(self, account, expected):
+        account.refresh_from_db()
+        self.assertEqual(account.balance, Decimal(expected))
+
+    def test_create_applies_amount(self):
+        self.create_transaction('-50.00')
+        self.create_transaction('200.00')
+        self.assertBalance(self.account, '1150.00')
+
+    def test_update_applies_difference(self):
+        transaction = self.create_transaction('-50.00')
+        transaction.amount = Decimal('-80.00')
+        transaction.save()
+        self.assertBalance(self.account, '920.00')
+
+    def test_moving_transaction_between_accounts(self):
+        transaction = self.create_transaction('-50.00')
+        transaction.account = self.other_account
+        transaction.save()
+        self.assertBalance(self.account, '1000.00')
+        self.assertBalance(self.other_account, '-50.00')
+
+    def test_delete_reverts_amount(self):
+        transaction = self.create_transaction('-50.00')
+        transaction.delete()
+        self.assertBalance(self.account, '1000.00')
+
+    def test_rebuild_balances_command(self):
+        self.create_transaction('-50.00')
+        self.create_transaction('25.00', account=self.other_account)
+        Account.objects.update(balance=Decimal('0.00'))
+
+        call_command('rebuild_balances', batch_size=1, stdout=StringIO())
+
+        self.assertBalance(self.account, '950.00')
+        self.assertBalance(self.other_account, '25.00')
+
+class TransactionSummaryTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.other_account = Account.objects.create(user=self.user, name='Savings')
+        self.salary = Category.objects.create(name='Salary', is_income=True)
+        self.groceries = Category.objects.create(name='Groceries', is_income=False)
+
+        for account, category, amount, date in [
+            (self.account, self.salary, '3000.00', datetime(2025, 1, 1, 9)),
+            (self.account, self.groceries, '-40.00', datetime(2025, 1, 3, 12)),
+            (self.account, self.groceries, '-60.00', datetime(2025, 1, 20, 12)),
+            (self.account, self.groceries, '10.00', datetime(2025, 1, 21, 12)),
+            (self.account, self.groceries, '-25.00', datetime(2025, 2, 2, 12)),
+            (self.other_account, self.groceries, '-5.00', datetime(2025, 1, 5, 12)),
+        ]:
+            Transaction.objects.create(
+                account=account,
+                category=category,
+                amount=Decimal(amount),
+                transaction_date=date
+            )
+
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def test_monthly_summary_by_category(self):
+        # User lookup, the grouped query and one query per extreme
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                '/api/transactions/summary/',
+                {'account_id': self.account.id}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['period'], 'month')
+        rows = [
+            (row['period'], row['category_name'], row['income'], row['expenses'], row['net'], row['count'])
+            for row in response.data['results']
+        ]
+        self.assertEqual(rows, [
+            ('2025-01-01', 'Salary', '3000.00', '0.00', '3000.00', 1),
+            ('2025-01-01', 'Groceries', '10.00', '-100.00', '-90.00', 3),
+            ('2025-02-01', 'Groceries', '0.00', '-25.00', '-25.00', 1),
+        ])
+        self.assertEqual(response.data['totals'], {
+            'income': '3010.00',
+            'expenses': '-125.00',
+            'net': '2885.00',
+        })
+        self.assertEqual(response.data['largest_expense']['amount'], '-60.00')
+        self.assertEqual(response.data['largest_income']['amount'], '3000.00')
+
+    def test_summary_across_accounts_with_date_range(self):
+        response = self.client.get(
+            '/api/transactions/summary/',
+            {'period': 'day', 'date_from': '2025-01-03', 'date_to': '2025-01-05'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(row['period'], row['net']) for row in response.data['results']],
+            [('2025-01-03', '-40.00'), ('2025-01-05', '-5.00')]
+        )
+
+    def test_invalid_parameters(self):
+        response = self.client.get('/api/transactions/summary/', {'period': 'decade'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get('/api/transactions/summary/', {'date_from': '2025-13-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+class DailyTotalsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.groceries = Category.objects.create(name='Groceries', is_income=False)
+        self.dining = Category.objects.create(name='Dining', is_income=False)
+
+    def create_transaction(self, amount, category, date):
+        return Transaction.objects.create(
+            account=self.account,
+            category=category,
+            amount=Decimal(amount),
+            transaction_date=date
+        )
+
+    def daily_totals(self):
+        return list(
+            DailyAccountCategoryTotal.objects.filter(count__gt=0)
+            .order_by('category__name', 'date')
+            .values_list('category__name', 'date', 'income', 'expenses', 'count')
+        )
+
+    def test_totals_follow_writes(self):
+        day = datetime(2025, 3, 1, 10)
+        first = self.create_transaction('-20.00', self.groceries, day)
+        self.create_transaction('-5.00', self.groceries, day + timedelta(hours=5))
+        self.create_transaction('15.00', self.groceries, day)
+
+        self.assertEqual(self.daily_totals(), [
+            ('Groceries', day.date(), Decimal('15.00'), Decimal('-25.00'), 3),
+        ])
+
+        first.category = self.dining
+        first.transaction_date = day + timedelta(days=1)
+        first.save()
+        self.assertEqual(self.daily_totals(), [
+            ('Dining', day.date() + timedelta(days=1), Decimal('0.00'), Decimal('-20.00'), 1),
+            ('Groceries', day.date(), Decimal('15.00'), Decimal('-5.00'), 2),
+        ])
+
+        first.delete()
+        self.assertEqual(self.daily_totals(), [
+            ('Groceries', day.date(), Decimal('15.00'), Decimal('-5.00'), 2),
+        ])
+
+    def test_rebuild_matches_incremental_totals(self):
+        day = datetime(2025, 3, 1, 10)
+        self.create_transaction('-20.00', self.groceries, day)
+        self.create_transaction('-7.50', self.dining, day + timedelta(days=2))
+        self.create_transaction('100.00', None, day)
+        expected = self.daily_totals()
+
+        DailyAccountCategoryTotal.objects.all().delete()
+        call_command('rebuild_daily_totals', stdout=StringIO())
+
+        self.assertEqual(self.daily_totals(), expected)
+
+class TransactionImportTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name='Main',
+            balance=Decimal('100.00')
+        )
+        self.other_account = Account.objects.create(user=self.other_user, name='Other')
+        self.category = Category.objects.create(name='Groceries', is_income=False)
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def upload(self, name, content, account=None, **extra):
+        data = {
+            'account': (account or self.account).id,
+            'file': SimpleUploadedFile(name, content if isinstance(content, bytes) else content.encode('utf-8')),
+            **extra
+        }
+        return self.client.post('/api/transactions/import/', data, format='multipart')
+
+    @override_settings(TRANSACTION_IMPORT_BATCH_SIZE=2)
+    def test_csv_import_reports_row_errors(self):
+        content = (
+            'date,amount,description,category\n'
+            '2025-01-01,-10.50,Shop,Groceries\n'
+            '2025-01-02,abc,Broken amount,\n'
+            '2025-01-03T08:30:00,-4.50,Coffee,\n'
+            'not-a-date,-1.00,Broken date,Unknown\n'
+            '2025-01-04,250.00,Refund,groceries\n'
+        )
+        response = self.upload('statement.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 3)
+        self.assertEqual(response.data['error_count'], 2)
+        self.assertEqual(response.data['errors'][0]['row'], 3)
+        self.assertIn('amount', response.data['errors'][0]['errors'])
+        self.assertEqual(
+            set(response.data['errors'][1]['errors']),
+            {'transaction_date', 'category'}
+        )
+        self.assertEqual(Transaction.objects.filter(category=self.category).count(), 2)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('335.00'))
+
+    def test_ofx_import(self):
+        content = (
+            'OFXHEADER:100\n<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>\n'
+            '<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20250105120000<TRNAMT>-42.10<NAME>Market</STMTTRN>\n'
+            '<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20250106\n<TRNAMT>1000.00\n<MEMO>Salary\n</STMTTRN>\n'
+            '</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>\n'
+        )
+        response = self.upload('statement.ofx', content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(
+            list(Transaction.objects.order_by('transaction_date').values_list('description', 'amount')),
+            [('Market', Decimal('-42.10')), ('Salary', Decimal('1000.00'))]
+        )
+
+    def test_qif_import(self):
+        content = (
+            '!Type:Bank\n'
+            'D01/15/2025\nT-12.00\nPBakery\nLGroceries\n^\n'
+            "D1/16'25\nT1,200.00\nPEmployer\n^\n"
+        )
+        response = self.upload('statement.txt', content, file_format='qif')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 2)
+        bakery = Transaction.objects.get(description='Bakery')
+        self.assertEqual(bakery.category, self.category)
+        self.assertEqual(bakery.transaction_date.date(), datetime(2025, 1, 15).date())
+
+    def test_non_utf8_files_fall_back_to_windows_1252(self):
+        csv_content = 'date,amount,description\n2025-01-01,-3.20,Caf\xe9 cr\xe8me\n'.encode('latin-1')
+        qif_content = '!Type:Bank\nD01/15/2025\nT-5.00\nP\u20ac shop\n^\n'.encode('cp1252')
+
+        self.assertEqual(self.upload('statement.csv', csv_content).status_code, status.HTTP_201_CREATED)
+        response = self.upload('statement.qif', qif_content, file_format='qif')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            set(Transaction.objects.values_list('description', flat=True)),
+            {'Caf\xe9 cr\xe8me', '\u20ac shop'}
+        )
+
+    def test_descriptions_get_the_serializer_checks(self):
+        content = 'date,amount,description\n2025-01-01,-1.00,Bad\x00byte\n2025-01-02,-2.00,Fine\n'
+        response = self.upload('statement.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['errors'][0]['row'], 2)
+        self.assertIn('description', response.data['errors'][0]['errors'])
+        self.assertEqual(list(Transaction.objects.values_list('description', flat=True)), ['Fine'])
+
+    def test_unparseable_file_is_rejected(self):
+        content = 'date,amount,description\n2025-01-01,-1.00,Fine\n2025-01-02,-2.00,"' + 'x' * 200000 + '"\n'
+        response = self.upload('statement.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Line', response.data['detail'])
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_cannot_import_into_other_users_account(self):
+        response = self.upload(
+            'statement.csv',
+            'date,amount\n2025-01-01,-1.00\n',
+            account=self.other_account
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('account', response.data)
+        self.assertEqual(Transaction.objects.count(), 0)
+
+    def test_unknown_file_format(self):
+        response = self.upload('statement.xlsx', 'date,amount\n')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('file_format', response.data)
+
+class TransactionExportTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='otherpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.other_account = Account.objects.create(user=self.other_user, name='Other')
+        self.category = Category.objects.create(name='Groceries', is_income=False)
+        for day, amount in [(1, '-10.00'), (2, '-20.50')]:
+            Transaction.objects.create(
+                account=self.account,
+                category=self.category,
+                amount=Decimal(amount),
+                description=f'Day {day}, shopping',
+                transaction_date=datetime(2025, 1, day, 12)
+            )
+        Transaction.objects.create(
+            account=self.other_account,
+            amount=Decimal('-99.00'),
+            transaction_date=datetime(2025, 1, 1, 12)
+        )
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    def export(self, **params):
+        return self.client.get('/api/transactions/export/', params)
+
+    def test_csv_export(self):
+        response = self.export(account_id=self.account.id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'id,transaction_date,amount,description,category_name,account_name,frequency,next_due_date')
+        self.assertEqual(len(lines), 3)
+        self.assertIn('-20.50,"Day 2, shopping",Groceries,Main,none,', lines[1])
+
+    def test_ndjson_export(self):
+        response = self.export(account_id=self.account.id, file_format='ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['amount'] for row in rows], ['-20.50', '-10.00'])
+        self.assertEqual(rows[0]['category_name'], 'Groceries')
+
+    def test_export_excludes_other_users_accounts(self):
+        response = self.export(account_id=self.other_account.id)
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+
+    def test_export_applies_list_filters(self):
+        for params in ({'date_from': '2025-01-02'}, {'search': 'DAY 2'}, {'amount_max': '-15'}):
+            response = self.export(account_id=self.account.id, **params)
+            lines = b''.join(response.streaming_content).decode().splitlines()
+            self.assertEqual(len(lines), 2, params)
+            self.assertIn('"Day 2, shopping"', lines[1])
+
+        self.assertEqual(
+            self.export(account_id=self.account.id, type='refund').status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+    @override_settings(TRANSACTION_EXPORT_CHUNK_SIZE=1)
+    async def test_export_streams_asynchronously_under_asgi(self):
+        token = await sync_to_async(RefreshToken.for_user)(self.user)
+        request = AsyncRequestFactory().get(
+            '/api/transactions/export/',
+            {'account_id': self.account.id},
+            headers={'authorization': f'Bearer {token.access_token}'},
+        )
+        response = await sync_to_async(TransactionViewSet.as_view({'get': 'export'}))(request)
+
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        expected = await sync_to_async(
+            lambda: b''.join(self.export(account_id=self.account.id).streaming_content)
+        )()
+        self.assertEqual(content, expected)
+
+    def test_export_requires_valid_parameters(self):
+        self.assertEqual(self.export().status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.export(account_id='abc').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.export(account_id=self.account.id, file_format='xml').status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+
+class RecurringTransactionTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.category = Category.objects.create(name='Rent', is_income=False)
+
+    def create_template(self, frequency, first_date, next_due_date):
+        return Transaction.objects.create(
+            account=self.account,
+            category=self.category,
+            amount=Decimal('-100.00'),
+            description='Rent',
+            transaction_date=first_date,
+            frequency=frequency,
+            next_due_date=next_due_date
+        )
+
+    def test_next_occurrence_clamps_to_month_length(self):
+        self.assertEqual(next_occurrence(date(2025, 1, 31), 'monthly', 31), date(2025, 2, 28))
+        self.assertEqual(next_occurrence(date(2025, 2, 28), 'monthly', 31), date(2025, 3, 31))
+        self.assertEqual(next_occurrence(date(2025, 12, 15), 'monthly', 15), date(2026, 1, 15))
+        self.assertEqual(next_occurrence(date(2024, 2, 29), 'yearly', 29), date(2025, 2, 28))
+        self.assertEqual(next_occurrence(date(2025, 1, 1), 'weekly', 1), date(2025, 1, 8))
+
+    def test_generates_all_missed_occurrences(self):
+        template = self.create_template('monthly', datetime(2025, 1, 31, 9), date(2025, 2, 28))
+
+        templates, occurrences = materialize_due(date(2025, 5, 1))
+
+        self.assertEqual((templates, occurrences), (1, 3))
+        generated = Transaction.objects.exclude(pk=template.pk).order_by('transaction_date')
+        self.assertEqual(
+            [t.transaction_date.date() for t in generated],
+            [date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)]
+        )
+        self.assertTrue(all(t.frequency == 'none' and t.amount == Decimal('-100.00') for t in generated))
+        template.refresh_from_db()
+        self.assertEqual(template.next_due_date, date(2025, 5, 31))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal('-400.00'))
+
+    def test_rerun_is_idempotent(self):
+        self.create_template('weekly', datetime(2025, 1, 1, 9), date(2025, 1, 8))
+
+        materialize_due(date(2025, 1, 20))
+        self.assertEqual(materialize_due(date(2025, 1, 20)), (0, 0))
+        self.assertEqual(Transaction.objects.count(), 3)
+
+    def test_ignores_one_time_and_future_schedules(self):
+        self.create_template('none', datetime(2025, 1, 1, 9), date(2025, 1, 2))
+        self.create_template('daily', datetime(2025, 1, 1, 9), date(2025, 2, 1))
+
+        self.assertEqual(materialize_due(date(2025, 1, 20)), (0, 0))
+
+    def test_command_processes_in_batches(self):
+        for _ in range(3):
+            self.create_template('daily', datetime(2025, 1, 1, 9), date(2025, 1, 2))
+        out = StringIO()
+
+        call_command('materialize_recurring', '--date=2025-01-03', '--batch-size=2', stdout=out)
+
+        self.assertIn('Created 6 occurrences for 3 recurring transactions', out.getvalue())
+
+
+class ExplainQueriesCommandTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        account = Account.objects.create(user=self.user, name='Test Account')
+        category = Category.objects.create(name='Food', is_income=False)
+        for day in range(1, 4):
+            Transaction.objects.create(
+                account=account,
+                category=category,
+                amount=Decimal('-10.00'),
+                transaction_date=datetime(2025, 1, day, 12)
+            )
+
+    def test_endpoint_queries_use_indexes(self):
+        out = StringIO()
+        call_command('explain_queries', stdout=out)
+        output = out.getvalue()
+        self.assertIn('transactions by_account: ok', output)
+        self.assertIn('transactions list search: ok', output)
+        self.assertIn('recurring due templates: ok', output)
+        self.assertIn('admin users list: ok', output)
+        self.assertIn('admin user stats: ok', output)
+
+    def test_sequential_scans_are_found_in_postgres_and_sqlite_plans(self):
+        self.assertEqual(
+            sequential_scans('Limit\n  ->  Seq Scan on transactions_transaction\n        Filter: (account_id = 1)'),
+            ['transactions_transaction']
+        )
+        self.assertEqual(
+            sequential_scans('3 0 0 SCAN users_user\n5 0 0 SCAN accounts_account USING INDEX account_user_version_idx'),
+            ['users_user']
+        )
+
+    def test_missing_user_is_reported(self):
+        with self.assertRaises(CommandError):
+            call_command('explain_queries', username='nobody', stdout=StringIO())
+
+
+class SyntheticDataTest(TestCase):
+    def test_generate_data_creates_consistent_dataset(self):
+        call_command(
+            'generate_data', users=2, accounts=2, transactions=30, batch_size=7, stdout=StringIO()
+        )
+
+        self.assertEqual(User.objects.filter(username__startswith='bench_user_').count(), 2)
+        self.assertTrue(User.objects.get(username='bench_admin').is_staff)
+        self.assertEqual(Account.objects.filter(user__username__startswith='bench_').count(), 4)
+        self.assertEqual(Transaction.objects.count(), 120)
+
+        balances = dict(Account.objects.values_list('pk', 'balance'))
+        totals = dict(DailyAccountCategoryTotal.objects.values('account').annotate(
+            count=Sum('count')
+        ).values_list('account', 'count'))
+        call_command('rebuild_balances', stdout=StringIO())
+        call_command('rebuild_daily_totals', stdout=StringIO())
+        self.assertEqual(dict(Account.objects.values_list('pk', 'balance')), balances)
+        self.assertEqual(totals, {pk: 30 for pk in balances})
+
+    def test_same_seed_generates_same_transactions(self):
+        generate_dataset(1, 1, 20, seed=7, prefix='first')
+        generate_dataset(1, 1, 20, seed=7, prefix='second')
+
+        def amounts(prefix):
+            return list(
+                Transaction.objects.filter(account__user__username__startswith=prefix)
+                .order_by('pk')
+                .values_list('amount', 'category_id')
+            )
+        self.assertEqual(amounts('first'), amounts('second'))
+
+    def test_existing_prefix_is_rejected(self):
+        generate_dataset(1, 1, 1)
+        with self.assertRaises(CommandError):
+            call_command('generate_data', users=1, stdout=StringIO())
+
+
+class BenchmarkTest(TestCase):
+    def test_benchmark_reports_every_endpoint(self):
+        generate_dataset(2, 2, 10)
+        out = StringIO()
+
+        call_command('benchmark_api', iterations=2, stdout=out)
+
+        output = out.getvalue()
+        for endpoint in ('login', 'accounts list', 'transactions by_account', 'admin users list'):
+            self.assertIn(endpoint, output)
+
+    def test_connection_benchmark_sends_requests_through_wsgi(self):
+        generate_dataset(1, 1, 5)
+        out = StringIO()
+
+        call_command('benchmark_connections', iterations=3, stdout=out)
+
+        self.assertIn('3 requests opened', out.getvalue())
+
+    def test_concurrency_benchmark_compares_sync_and_async_views(self):
+        generate_dataset(1, 1, 5)
+        out = StringIO()
+
+        call_command('benchmark_concurrency', requests=2, concurrency=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertEqual(output.count(' sync '), 4)
+        self.assertEqual(output.count('async '), 4)
+
+    def test_json_benchmark_compares_codecs(self):
+        generate_dataset(1, 1, 5)
+        out = StringIO()
+
+        call_command('benchmark_json', iterations=2, stdout=out)
+
+        self.assertIn('Identical output: yes', out.getvalue())
+
+    def test_serializer_benchmark_checks_identical_output(self):
+        generate_dataset(1, 1, 5)
+        out = StringIO()
+
+        call_command('benchmark_serializers', iterations=2, stdout=out)
+
+        self.assertIn('Both paths produced identical output', out.getvalue())
+
+    def test_percentile_uses_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+
+
+class AsyncTransactionViewsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=self.user, name='Test Account')
+        category = Category.objects.create(name='Food', is_income=False)
+        for days, amount in enumerate(('-10.00', '25.00', '-3.50')):
+            Transaction.objects.create(
+                account=self.account,
+                category=category,
+                amount=Decimal(amount),
+                transaction_date=timezone.now() - timedelta(days=days),
+            )
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.headers = {'authorization': f'Bearer {token}'}
+
+    async def assertSameResponse(self, path, sync_view, async_view):
+        factory = AsyncRequestFactory()
+        expected = await sync_to_async(sync_view)(factory.get(path, headers=self.headers))
+        response = await async_view(factory.get(path, headers=self.headers))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.render().content),
+            json.loads(expected.render().content),
+        )
+
+    async def test_by_account_matches_sync_view(self):
+        await self.assertSameResponse(
+            f'/api/transactions/by_account/?account_id={self.account.pk}&page_size=2',
+            TransactionViewSet.as_view({'get': 'by_account'}),
+            AsyncTransactionsByAccountView.as_view(),
+        )
+
+    async def test_summary_matches_sync_view(self):
+        await self.assertSameResponse(
+            '/api/transactions/summary/?period=day',
+            TransactionViewSet.as_view({'get': 'summary'}),
+            AsyncTransactionSummaryView.as_view(),
+        )
+
+    async def test_async_view_requires_authentication(self):
+        response = await AsyncTransactionSummaryView.as_view()(AsyncRequestFactory().get('/api/transactions/summary/'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class FastJSONTest(TestCase):
+    data = {
+        'amount': Decimal('12.50'),
+        'transaction_date': datetime(2025, 3, 1, 12, 30, 15, 123456),
+        'day': date(2025, 3, 1),
+        'description': 'line\u2028separator ż',
+        1: [None, True, 1.5],
+    }
+
+    def test_renders_like_stdlib_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_indented_output_uses_stdlib_renderer(self):
+        media_type = 'application/json; indent=2'
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type),
+        )
+
+    def test_parses_like_stdlib_parser(self):
+        body = b'{"amount": "12.50", "category": null, "ids": [1, 2.5], "name": "\\u017c"}'
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"amount": NaN}'))
+
+
+class TransactionReadSerializerTest(TestCase):
+    def test_matches_model_serializer(self):
+        user = User.objects.create_user(username='testuser', password='testpass123')
+        account = Account.objects.create(user=user, name='Test Account')
+        category = Category.objects.create(name='Salary', is_income=True)
+        Transaction.objects.create(
+            account=account,
+            category=category,
+            amount=Decimal('1234.5'),
+            transaction_date=timezone.now(),
+            description='Monthly salary',
+            frequency='monthly',
+            next_due_date=date(2025, 2, 1),
+        )
+        Transaction.objects.create(
+            account=account,
+            amount=Decimal('-3'),
+            transaction_date=timezone.now() - timedelta(days=1),
+        )
+        queryset = Transaction.objects.select_related('category', 'account').order_by('id')
+
+        self.assertEqual(
+            TransactionReadSerializer(TransactionReadSerializer.project(queryset)).data,
+            json.loads(json.dumps(TransactionSerializer(queryset, many=True).data)),
+        )
+
+
+class TransactionFilterTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=self.user, name='Test Account')
+        self.food = Category.objects.create(name='Food', is_income=False)
+        salary = Category.objects.create(name='Salary', is_income=True)
+        rows = [
+            ('-12.50', self.food, datetime(2025, 1, 5, 9), 'Grocery store', 'none'),
+            ('-80.00', self.food, datetime(2025, 1, 20, 18), 'Dinner with friends', 'none'),
+            ('3000.00', salary, datetime(2025, 1, 31, 8), 'January salary', 'monthly'),
+            ('-5.00', None, datetime(2025, 2, 2, 12), 'Coffee', 'none'),
+        ]
+        self.ids = {}
+        for amount, category, when, description, frequency in rows:
+            self.ids[description] = Transaction.objects.create(
+                account=self.account, category=category, amount=Decimal(amount),
+                transaction_date=when, description=description, frequency=frequency,
+            ).id
+        other = User.objects.create_user(username='other', password='testpass123')
+        Transaction.objects.create(
+            account=Account.objects.create(user=other, name='Other'), amount=Decimal('-1.00'),
+            transaction_date=datetime(2025, 1, 10), description='Grocery store',
+        )
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def descriptions(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row['description'] for row in response.data['results']]
+
+    def test_list_filters(self):
+        url = reverse('transaction-list')
+        self.assertEqual(self.descriptions(url, date_from='2025-01-20', date_to='2025-01-31'),
+                         ['January salary', 'Dinner with friends'])
+        self.assertEqual(self.descriptions(url, amount_min='-20', amount_max='0'),
+                         ['Coffee', 'Grocery store'])
+        self.assertEqual(self.descriptions(url, category=self.food.id),
+                         ['Dinner with friends', 'Grocery store'])
+        self.assertEqual(self.descriptions(url, category='none'), ['Coffee'])
+        self.assertEqual(self.descriptions(url, type='income'), ['January salary'])
+        self.assertEqual(self.descriptions(url, type='expense', frequency='none', search='FRIENDS'),
+                         ['Dinner with friends'])
+        self.assertEqual(self.descriptions(url, frequency='monthly'), ['January salary'])
+
+    def test_search_stays_within_own_transactions(self):
+        self.assertEqual(self.descriptions(reverse('transaction-list'), search='grocery'), ['Grocery store'])
+
+    def test_by_account_filters_and_keeps_them_in_page_links(self):
+        url = reverse('transaction-by-account')
+        response = self.client.get(url, {'account_id': self.account.id, 'type': 'expense', 'page_size': 2})
+
+        self.assertEqual([row['id'] for row in response.data['results']],
+                         [self.ids['Coffee'], self.ids['Dinner with friends']])
+        self.assertIn('type=expense', response.data['next'])
+        self.assertEqual(
+            [row['id'] for row in self.client.get(response.data['next']).data['results']],
+            [self.ids['Grocery store']],
+        )
+
+    def test_invalid_filters_are_rejected(self):
+        url = reverse('transaction-list')
+        for params in ({'amount_min': 'ten'}, {'category': 'food'}, {'type': 'refund'},
+                       {'frequency': 'hourly'}, {'date_from': '2025-13-01'}):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn('detail', response.data)
+
+
+class TransactionBulkWriteTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.account = Account.objects.create(user=self.user, name='Main')
+        self.savings = Account.objects.create(user=self.user, name='Savings')
+        self.food = Category.objects.create(name='Food', is_income=False)
+        self.travel = Category.objects.create(name='Travel', is_income=False)
+        day = datetime(2025, 3, 1, 10)
+        self.transactions = [
+            Transaction.objects.create(
+                account=self.account, category=self.food, amount=Decimal(amount),
+                transaction_date=day + timedelta(days=offset), description=f'Row {offset}',
+            )
+            for offset, amount in enumerate(['-10.00', '-20.00', '-30.00', '40.00'])
+        ]
+        other = User.objects.create_user(username='other', password='testpass123')
+        self.foreign = Transaction.objects.create(
+            account=Account.objects.create(user=other, name='Other'), category=self.food,
+            amount=Decimal('-5.00'), transaction_date=day,
+        )
+        token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def ids(self, *indexes):
+        return [self.transactions[index].id for index in indexes]
+
+    def assertLedgerConsistent(self):
+        for account in Account.objects.all():
+            self.assertEqual(
+                account.balance,
+                account.transactions.aggregate(total=Sum('amount'))['total'] or Decimal('0.00'),
+                account.name,
+            )
+        totals = list(
+            DailyAccountCategoryTotal.objects.filter(count__gt=0)
+            .order_by('account', 'category', 'date')
+            .values_list('account', 'category', 'date', 'income', 'expenses', 'count')
+        )
+        DailyAccountCategoryTotal.objects.all().delete()
+        call_command('rebuild_daily_totals', stdout=StringIO())
+        self.assertEqual(totals, list(
+            DailyAccountCategoryTotal.objects.filter(count__gt=0)
+            .order_by('account', 'category', 'date')
+            .values_list('account', 'category', 'date', 'income', 'expenses', 'count')
+        ))
+
+    def test_update_by_ids_moves_rollups(self):
+        response = self.client.post(reverse('transaction-bulk-update'), {
+            'ids': self.ids(0, 1),
+            'changes': {'category': self.travel.id, 'account': self.savings.id, 'description': 'Trip'},
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'count': 2})
+        self.assertEqual(
+            set(Transaction.objects.filter(pk__in=self.ids(0, 1)).values_list('account', 'category', 'description')),
+            {(self.savings.id, self.travel.id, 'Trip')},
+        )
+        self.assertLedgerConsistent()
+
+    def test_update_by_filter(self):
+        response = self.client.post(reverse('transaction-bulk-update'), {
+            'filter': {'type': 'expense', 'amount_max': '-20', 'account_id': str(self.account.id)},
+            'changes': {'category': None},
+        }, format='json')
+
+        self.assertEqual(response.data, {'count': 2})
+        self.assertEqual(list(Transaction.objects.filter(category=None).order_by('id').values_list('id', flat=True)),
+                         self.ids(1, 2))
+        self.assertLedgerConsistent()
+
+    def test_delete_by_ids(self):
+        response = self.client.post(reverse('transaction-bulk-delete'), {'ids': self.ids(0, 3)}, format='json')
+
+        self.assertEqual(response.data, {'count': 2})
+        self.assertFalse(Transaction.objects.filter(pk__in=self.ids(0, 3)).exists())
+        self.assertLedgerConsistent()
+
+    def test_delete_by_filter_stays_within_own_transactions(self):
+        response = self.client.post(reverse('transaction-bulk-delete'), {'filter': {'type': 'expense'}}, format='json')
+
+        self.assertEqual(response.data, {'count': 3})
+        self.assertTrue(Transaction.objects.filter(pk=self.foreign.pk).exists())
+        self.assertLedgerConsistent()
+
+    def test_foreign_ids_change_nothing(self):
+        for url, data in (
+            (reverse('transaction-bulk-delete'), {'ids': [*self.ids(0), self.foreign.id]}),
+            (reverse('transaction-bulk-update'), {'ids': [*self.ids(0), self.foreign.id],
+                                                  'changes': {'description': 'Mine'}}),
+        ):
+            response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertIn(str(self.foreign.id), response.data['detail'])
+        self.assertEqual(Transaction.objects.count(), 5)
+        self.assertFalse(Transaction.objects.filter(description='Mine').exists())
+
+    def test_invalid_requests_are_rejected(self):
+        other_account = Account.objects.get(name='Other')
+        for url, data in (
+            (reverse('transaction-bulk-delete'), {}),
+            (reverse('transaction-bulk-delete'), {'ids': self.ids(0), 'filter': {'type': 'expense'}}),
+            (reverse('transaction-bulk-delete'), {'filter': {}}),
+            (reverse('transaction-bulk-delete'), {'filter': {'categroy': '1'}}),
+            (reverse('transaction-bulk-delete'), {'filter': {'type': 'refund'}}),
+            (reverse('transaction-bulk-update'), {'ids': self.ids(0), 'changes': {}}),
+            (reverse('transaction-bulk-update'), {'ids': self.ids(0), 'changes': {'account': other_account.id}}),
+        ):
+            response = self.client.post(url, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
+        self.assertEqual(Transaction.objects.count(), 5)
+
+    def test_empty_or_blank_filters_select_nothing(self):
+        for url, extra in (
+            (reverse('transaction-bulk-delete'), {}),
+            (reverse('transaction-bulk-update'), {'changes': {'description': 'Wiped'}}),
+        ):
+            for selection in ({}, {'search': ''}, {'search': '   '}, {'category': ''}, {'account_id': ''}):
+                response = self.client.post(url, {'filter': selection, **extra}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, selection)
+        self.assertEqual(Transaction.objects.count(), 5)
+        self.assertFalse(Transaction.objects.filter(description='Wiped').exists())
+
+    @override_settings(TRANSACTION_BULK_MAX_ROWS=2)
+    def test_selection_over_limit_is_rejected(self):
+        response = self.client.post(reverse('transaction-bulk-delete'), {'filter': {'type': 'expense'}}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Transaction.objects.count(), 5)
+
+    def bulk_update_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('transaction-bulk-update'), {
+                'filter': {'account_id': str(self.account.id)}, 'changes': {'description': 'Same'},
+            }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        queries = self.bulk_update_queries()
+        for transaction in self.transactions * 5:
+            Transaction.objects.create(
+                account=self.account, category=self.food, amount=Decimal('-1.00'),
+                transaction_date=transaction.transaction_date,
+            )
+        self.assertEqual(self.bulk_update_queries(), queries)
+        self.assertLedgerConsistent()
@@ -1,11 +1,21 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import TransactionViewSet
+from .views import AsyncTransactionsByAccountView, AsyncTransactionSummaryView, TransactionViewSet
 
 router = DefaultRouter()
 router.register(r'', TransactionViewSet, basename='transaction')
 
+if settings.ASYNC_VIEWS:
+    by_account_view = AsyncTransactionsByAccountView.as_view()
+    # Takes precedence over the viewset's summary route
+    extra_routes = [path('summary/', AsyncTransactionSummaryView.as_view(), name='transaction-summary')]
+else:
+    by_account_view = TransactionViewSet.as_view({'get': 'by_account'})
+    extra_routes = []
+
 urlpatterns = [
-    path('by_account/', TransactionViewSet.as_view({'get': 'by_account'}), name='transaction-by-account'),
+    path('by_account/', by_account_view, name='transaction-by-account'),
+    *extra_routes,
     path('', include(router.urls)),
 ]
@@ -1,15 +1,155 @@
-from rest_framework import viewsets, permissions, status
+from rest_framework import generics, viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from .models import Transaction
-from .serializers import TransactionSerializer
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.parsers import FormParser, MultiPartParser
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek, TruncYear
+from .models import DailyAccountCategoryTotal, Transaction
+from .serializers import (
+    TransactionBulkResultSerializer,
+    TransactionBulkSelectionSerializer,
+    TransactionBulkUpdateSerializer,
+    TransactionImportResultSerializer,
+    TransactionImportSerializer,
+    TransactionReadSerializer,
+    TransactionSerializer,
+    TransactionSummaryResponseSerializer,
+)
+from .importers import import_transactions
+from .bulk import bulk_delete_transactions, bulk_update_transactions
+from .exporters import EXPORT_FORMATS, aexport_rows, astream_export, export_rows, stream_export
+from .pagination import TransactionCursorPagination
+from .filters import TRANSACTION_TYPES, filter_date_range, filter_transactions, parse_date_param
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
 from accounts.authentication import CookieJWTAuthentication
+from accounts.etags import aaccount_transactions_etag, account_transactions_etag, not_modified, set_etag
+from backend.async_views import AsyncAPIView
+
+SUMMARY_PERIODS = {
+    'day': TruncDay,
+    'week': TruncWeek,
+    'month': TruncMonth,
+    'year': TruncYear,
+}
+
+FILTER_PARAMETERS = [
+    OpenApiParameter(
+        name="date_from", type=OpenApiTypes.DATE, location=OpenApiParameter.QUERY,
+        description="First day to include", required=False
+    ),
+    OpenApiParameter(
+        name="date_to", type=OpenApiTypes.DATE, location=OpenApiParameter.QUERY,
+        description="Last day to include", required=False
+    ),
+    OpenApiParameter(
+        name="amount_min", type=OpenApiTypes.DECIMAL, location=OpenApiParameter.QUERY,
+        description="Smallest amount to include", required=False
+    ),
+    OpenApiParameter(
+        name="amount_max", type=OpenApiTypes.DECIMAL, location=OpenApiParameter.QUERY,
+        description="Largest amount to include", required=False
+    ),
+    OpenApiParameter(
+        name="category", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+        description='Category ID, or "none" for uncategorized transactions', required=False
+    ),
+    OpenApiParameter(
+        name="type", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+        enum=list(TRANSACTION_TYPES), description="Only income or only expenses", required=False
+    ),
+    OpenApiParameter(
+        name="frequency", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+        enum=[choice for choice, _ in Transaction.RECURRING_FREQUENCIES], required=False
+    ),
+    OpenApiParameter(
+        name="search", type=OpenApiTypes.STR, location=OpenApiParameter.QUERY,
+        description="Case-insensitive text to find in the description", required=False
+    ),
+]
+
+
+def apply_filters(queryset, params):
+    try:
+        return filter_transactions(queryset, params)
+    except ValueError as e:
+        raise ParseError(str(e))
+
+
+def summary_queries(user, params):
+    """
+    Build the queries behind the summary endpoint from its query parameters.
+    Returns (period, rows, extremes) where rows yields the per period and
+    category buckets and extremes is the transaction queryset to pick the
+    largest expense and income from. Raises ValueError for invalid parameters.
+    """
+    period = params.get('period', 'month')
+    if period not in SUMMARY_PERIODS:
+        raise ValueError(f"period must be one of: {', '.join(SUMMARY_PERIODS)}")
+
+    date_from = parse_date_param(params, 'date_from')
+    date_to = parse_date_param(params, 'date_to')
+
+    # Buckets are read from the daily totals, so the cost grows with the
+    # number of days and categories rather than transactions
+    daily_totals = DailyAccountCategoryTotal.objects.filter(
+        account__user=user, account__deleted_at__isnull=True, count__gt=0
+    )
+    queryset = Transaction.objects.filter(account__user=user, account__deleted_at__isnull=True)
+    account_id = params.get('account_id')
+    if account_id:
+        daily_totals = daily_totals.filter(account__id=account_id)
+        queryset = queryset.filter(account__id=account_id)
+    if date_from:
+        daily_totals = daily_totals.filter(date__gte=date_from)
+    if date_to:
+        daily_totals = daily_totals.filter(date__lte=date_to)
+    queryset = filter_date_range(queryset, date_from, date_to)
+
+    money = DecimalField(max_digits=14, decimal_places=2)
+    rows = (
+        daily_totals
+        .annotate(period=SUMMARY_PERIODS[period]('date'))
+        .values('period', 'category')
+        .annotate(
+            category_name=F('category__name'),
+            is_income=F('category__is_income'),
+            income=Sum('income'),
+            expenses=Sum('expenses'),
+            net=ExpressionWrapper(F('income') + F('expenses'), output_field=money),
+            count=Sum('count'),
+        )
+        .order_by('period', 'category')
+    )
+    # The extremes need whole rows, so they cost one LIMIT 1 query each
+    return period, rows, queryset.select_related('category', 'account')
+
+
+def summary_data(period, rows, largest_expense, largest_income):
+    totals = {
+        'income': sum((row['income'] for row in rows), 0),
+        'expenses': sum((row['expenses'] for row in rows), 0),
+    }
+    totals['net'] = totals['income'] + totals['expenses']
+    return {
+        'period': period,
+        'totals': totals,
+        'results': rows,
+        'largest_expense': largest_expense,
+        'largest_income': largest_income,
+    }
+
 
 @extend_schema_view(
-    list=extend_schema(description="List all transactions for the authenticated user"),
+    list=extend_schema(
+        description="List the authenticated user's transactions matching the filters",
+        parameters=FILTER_PARAMETERS
+    ),
     retrieve=extend_schema(
         description="Get a specific transaction by ID",
         parameters=[
@@ -64,10 +204,17 @@ class TransactionViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = TransactionSerializer
     authentication_classes = [CookieJWTAuthentication]
+    pagination_class = TransactionCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        return Transaction.objects.filter(account__user=user)
+        return Transaction.objects.filter(account__user=user, account__deleted_at__isnull=True).select_related('category', 'account')
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in ('list', 'by_account'):
+            queryset = apply_filters(queryset, self.request.query_params)
+        return queryset
 
     @extend_schema(
         parameters=[
@@ -77,7 +224,8 @@ class TransactionViewSet(viewsets.ModelViewSet):
                 location=OpenApiParameter.QUERY,
                 description="ID of the account to fetch transactions for",
                 required=True
-            )
+            ),
+            *FILTER_PARAMETERS,
         ]
     )
     @action(detail=False, methods=['get'])
@@ -90,10 +238,285 @@ class TransactionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = Transaction.objects.filter(
-            account__id=account_id,
-            account__user=request.user
-        ).order_by('-transaction_date')
+        # Unchanged accounts are answered from the account's change stamp
+        etag = account_transactions_etag(request.user, account_id)
+        if etag is not None:
+            response = not_modified(request, etag)
+            if response is not None:
+                return set_etag(response, etag)
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(account__id=account_id)
+        queryset = TransactionReadSerializer.project(queryset)
         
-        serializer = self.get_serializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(TransactionReadSerializer(page).data)
+        return set_etag(response, etag) if etag is not None else response
+
+    @extend_schema(
+        description="Totals grouped by period and category, aggregated from daily totals",
+        parameters=[
+            OpenApiParameter(
+                name="account_id",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Limit the summary to one account (defaults to all accounts)",
+                required=False
+            ),
+            OpenApiParameter(
+                name="period",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description="Bucket size",
+                enum=list(SUMMARY_PERIODS),
+                default="month",
+                required=False
+            ),
+            OpenApiParameter(
+                name="date_from",
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description="First day to include",
+                required=False
+            ),
+            OpenApiParameter(
+                name="date_to",
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description="Last day to include",
+                required=False
+            ),
+        ],
+        responses={200: TransactionSummaryResponseSerializer}
+    )
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        try:
+            period, rows, extremes = summary_queries(request.user, request.query_params)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = TransactionSummaryResponseSerializer(summary_data(
+            period,
+            list(rows),
+            extremes.filter(amount__lt=0).order_by('amount', 'id').first(),
+            extremes.filter(amount__gt=0).order_by('-amount', 'id').first(),
+        ))
+        return Response(serializer.data)
+
+    @extend_schema(
+        description=(
+            "Import transactions from an uploaded CSV, OFX or QIF statement. "
+            "Valid rows are inserted in batches within one database transaction; "
+            "invalid rows are skipped and reported by row number. Text files are "
+            "read as UTF-8, falling back to Windows-1252 for other bytes. A file "
+            "that cannot be parsed is rejected with 400 and nothing is imported."
+        ),
+        request={'multipart/form-data': TransactionImportSerializer},
+        responses={
+            201: TransactionImportResultSerializer,
+            400: TransactionImportResultSerializer,
+        }
+    )
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        parser_classes=[MultiPartParser, FormParser]
+    )
+    def import_file(self, request):
+        serializer = TransactionImportSerializer(
+            data=request.data,
+            context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = import_transactions(
+                serializer.validated_data['account'],
+                serializer.validated_data['file'],
+                serializer.validated_data['file_format'],
+            )
+        except ValueError as e:
+            raise ParseError(str(e))
+        return Response(
+            TransactionImportResultSerializer(result).data,
+            status=status.HTTP_201_CREATED if result['created'] else status.HTTP_400_BAD_REQUEST
+        )
+
+    @extend_schema(
+        description=(
+            "Stream an account's transactions matching the list filters as CSV "
+            "or newline-delimited JSON, newest first"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="account_id",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="ID of the account to export transactions for",
+                required=True
+            ),
+            OpenApiParameter(
+                name="file_format",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=list(EXPORT_FORMATS),
+                default="csv",
+                required=False
+            ),
+            *FILTER_PARAMETERS,
+        ],
+        responses={(200, media_type): OpenApiTypes.BINARY for media_type in EXPORT_FORMATS.values()}
+    )
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        account_id = request.query_params.get('account_id')
+        file_format = request.query_params.get('file_format', 'csv')
+
+        if not account_id:
+            return Response(
+                {"detail": "account_id parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not account_id.isdigit():
+            return Response(
+                {"detail": "account_id must be an account id"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"file_format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = apply_filters(
+            Transaction.objects.filter(
+                account__id=account_id, account__user=request.user, account__deleted_at__isnull=True
+            ),
+            request.query_params
+        )
+        chunk_size = settings.TRANSACTION_EXPORT_CHUNK_SIZE
+        # The ASGI handler would buffer a sync iterator into one response
+        if isinstance(request._request, ASGIRequest):
+            content = astream_export(aexport_rows(queryset, chunk_size), file_format)
+        else:
+            content = stream_export(export_rows(queryset, chunk_size), file_format)
+        response = StreamingHttpResponse(
+            content,
+            content_type=EXPORT_FORMATS[file_format]
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="transactions-{account_id}.{file_format}"'
+        )
+        return response
+
+    def bulk_selection(self, serializer):
+        serializer.is_valid(raise_exception=True)
+        # Ownership is part of the row selection, so it costs no extra query
+        return serializer.select(
+            Transaction.objects.filter(account__user=self.request.user, account__deleted_at__isnull=True)
+        )
+
+    @extend_schema(
+        description=(
+            "Apply the same changes to many transactions, selected by ids or by "
+            "the list filters, in one database transaction. Fails with 404 "
+            "without changing anything if any id is not the user's transaction, "
+            "and with 400 if the selection exceeds TRANSACTION_BULK_MAX_ROWS."
+        ),
+        request=TransactionBulkUpdateSerializer,
+        responses={200: TransactionBulkResultSerializer}
+    )
+    @action(detail=False, methods=['post'], url_path='bulk_update')
+    def bulk_update(self, request):
+        serializer = TransactionBulkUpdateSerializer(data=request.data, context=self.get_serializer_context())
+        queryset, ids = self.bulk_selection(serializer)
+        try:
+            count = bulk_update_transactions(queryset, serializer.validated_data['changes'], ids)
+        except Transaction.DoesNotExist as e:
+            raise NotFound(str(e))
+        except ValueError as e:
+            raise ParseError(str(e))
+        return Response(TransactionBulkResultSerializer({'count': count}).data)
+
+    @extend_schema(
+        description=(
+            "Delete many transactions, selected by ids or by the list filters, "
+            "in one database transaction. Fails with 404 without deleting "
+            "anything if any id is not the user's transaction, and with 400 "
+            "if the selection exceeds TRANSACTION_BULK_MAX_ROWS."
+        ),
+        request=TransactionBulkSelectionSerializer,
+        responses={200: TransactionBulkResultSerializer}
+    )
+    @action(detail=False, methods=['post'], url_path='bulk_delete')
+    def bulk_delete(self, request):
+        serializer = TransactionBulkSelectionSerializer(data=request.data, context=self.get_serializer_context())
+        queryset, ids = self.bulk_selection(serializer)
+        try:
+            count = bulk_delete_transactions(queryset, ids)
+        except Transaction.DoesNotExist as e:
+            raise NotFound(str(e))
+        except ValueError as e:
+            raise ParseError(str(e))
+        return Response(TransactionBulkResultSerializer({'count': count}).data)
+
+    # Defined last so the name does not shadow the builtin in the class body
+    def list(self, request, *args, **kwargs):
+        queryset = TransactionReadSerializer.project(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(TransactionReadSerializer(page).data)
+
+
+class AsyncTransactionReadView(AsyncAPIView, generics.GenericAPIView):
+    """
+    Base for async versions of TransactionViewSet's read actions.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = TransactionSerializer
+    authentication_classes = [CookieJWTAuthentication]
+    pagination_class = TransactionCursorPagination
+
+    def get_queryset(self):
+        return (
+            Transaction.objects.filter(account__user=self.request.user, account__deleted_at__isnull=True)
+            .select_related('category', 'account')
+        )
+
+
+class AsyncTransactionsByAccountView(AsyncTransactionReadView):
+    async def get(self, request):
+        account_id = request.query_params.get('account_id')
+        if not account_id:
+            return Response(
+                {"detail": "account_id parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        etag = await aaccount_transactions_etag(request.user, account_id)
+        if etag is not None:
+            response = not_modified(request, etag)
+            if response is not None:
+                return set_etag(response, etag)
+
+        queryset = apply_filters(self.get_queryset(), request.query_params).filter(account__id=account_id)
+        queryset = TransactionReadSerializer.project(queryset)
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        response = self.get_paginated_response(TransactionReadSerializer(page).data)
+        return set_etag(response, etag) if etag is not None else response
+
+
+class AsyncTransactionSummaryView(AsyncTransactionReadView):
+    async def get(self, request):
+        try:
+            period, rows, extremes = summary_queries(request.user, request.query_params)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = TransactionSummaryResponseSerializer(summary_data(
+            period,
+            [row async for row in rows],
+            await extremes.filter(amount__lt=0).order_by('amount', 'id').afirst(),
+            await extremes.filter(amount__gt=0).order_by('-amount', 'id').afirst(),
+        ))
         return Response(serializer.data)
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "users"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from .auth_cache import invalidate_user
+        from .models import User
+
+        post_save.connect(invalidate_user, sender=User, dispatch_uid="invalidate_user_auth_state")
+        post_delete.connect(invalidate_user, sender=User, dispatch_uid="invalidate_user_auth_state")
@@ -0,0 +1,72 @@
+"""
+In-process cache of the per-user state that access tokens are checked
+against, so authenticating a request with a claims-bearing token does not
+have to load the user row.
+
+Entries expire after JWT_USER_CACHE_TTL seconds and are dropped as soon as
+the user is saved or deleted in this process; other processes pick up the
+change when their entry expires.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.db.models import F
+
+from .models import User
+
+AuthState = namedtuple('AuthState', ('token_version', 'is_active'))
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_auth_state(user_id):
+    """
+    Return the AuthState of a user, or None if the user does not exist.
+    """
+    user_id = User._meta.pk.to_python(user_id)
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    row = User.objects.filter(pk=user_id).values_list('token_version', 'is_active').first()
+    state = AuthState(*row) if row is not None else None
+
+    with _lock:
+        _entries[user_id] = (now + settings.JWT_USER_CACHE_TTL, state)
+        _entries.move_to_end(user_id)
+        while len(_entries) > settings.JWT_USER_CACHE_SIZE:
+            _entries.popitem(last=False)
+    return state
+
+
+def invalidate(user_id):
+    with _lock:
+        _entries.pop(user_id, None)
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+
+
+def update_auth_state(queryset, **fields):
+    """
+    Bulk-update AUTH_STATE_FIELDS of the users in queryset and revoke their
+    issued tokens. A plain update() skips User.save() and the signals, so it
+    would neither bump token_version nor drop the cached states. Other
+    processes see the change once their entries expire.
+
+    Returns the number of users updated.
+    """
+    updated = queryset.update(token_version=F('token_version') + 1, **fields)
+    clear()
+    return updated
+
+
+def invalidate_user(sender, instance, **kwargs):
+    invalidate(instance.pk)
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.7 on 2026-10-17 18:04
+
+from django.contrib.postgres.indexes import OpClass
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+# Match the UPPER(column) LIKE 'PREFIX%' pattern of the istartswith lookups
+# of the admin search on PostgreSQL. text_pattern_ops makes the prefix
+# usable as an index range whatever the database collation. Other
+# databases search without an index.
+SEARCH_INDEXES = [
+    models.Index(OpClass(Upper('username'), name='text_pattern_ops'), name='user_username_prefix_idx'),
+    models.Index(OpClass(Upper('email'), name='text_pattern_ops'), name='user_email_prefix_idx'),
+]
+
+
+def add_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for index in SEARCH_INDEXES:
+            schema_editor.add_index(apps.get_model('users', 'User'), index)
+
+
+def remove_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for index in SEARCH_INDEXES:
+            schema_editor.remove_index(apps.get_model('users', 'User'), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_user_token_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-date_joined', '-id'], name='user_date_joined_idx'),
+        ),
+        migrations.RunPython(add_search_indexes, remove_search_indexes),
+    ]
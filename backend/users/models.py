@@ -1,9 +1,46 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 
+# Fields copied into access tokens or checked when authenticating. Changing
+# any of them bumps token_version, which revokes the user's issued tokens.
+# QuerySet.update() skips save(), so bulk changes to them must go through
+# users.auth_cache.update_auth_state() instead.
+AUTH_STATE_FIELDS = ('username', 'password', 'is_active', 'is_staff', 'is_superuser')
+
 
 class User(AbstractUser):
     is_email_verified = models.BooleanField(default=False)
+    token_version = models.PositiveIntegerField(default=0)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Backs the admin user list, newest first
+            models.Index(fields=["-date_joined", "-id"], name="user_date_joined_idx"),
+        ]
 
     def __str__(self):
         return self.username
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        user._loaded_auth_state = user._auth_state()
+        return user
+
+    def _auth_state(self):
+        deferred = self.get_deferred_fields()
+        return {
+            field: getattr(self, field)
+            for field in AUTH_STATE_FIELDS
+            if field not in deferred
+        }
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_auth_state', None)
+        if loaded and any(getattr(self, field) != value for field, value in loaded.items()):
+            self.token_version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'token_version'}
+        super().save(*args, **kwargs)
+        self._loaded_auth_state = self._auth_state()
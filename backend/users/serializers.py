@@ -1,5 +1,14 @@
 from users.models import User
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from users.auth_cache import get_auth_state
+
+# Claims that let CookieJWTAuthentication build request.user without a query.
+# They cover the fields permission checks read; the rest load on access.
+USER_CLAIMS = ('username', 'is_staff', 'is_superuser', 'is_active', 'token_version')
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,4 +20,33 @@ class UserSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         user = User.objects.create_user(**validated_data)
-        return user
\ No newline at end of file
+        return user
+
+
+class UserClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Issues token pairs carrying the user claims; access tokens created from
+    the refresh token copy them.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+
+class UserClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuses to refresh tokens issued before the user's token_version changed,
+    since the new access token would carry the outdated claims.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        if 'token_version' in refresh:
+            state = get_auth_state(refresh[api_settings.USER_ID_CLAIM])
+            if state is None or state.token_version != refresh['token_version']:
+                raise InvalidToken('Token has been revoked')
+        return super().validate(attrs)
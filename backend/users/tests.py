@@ -3,7 +3,9 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from users import auth_cache
 
 User = get_user_model()
 
@@ -126,3 +128,88 @@ class UserAPITest(APITestCase):
         response = self.client.post(url, data)
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class StatelessAuthenticationTest(APITestCase):
+    def setUp(self):
+        auth_cache.clear()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.client.post(reverse('token_obtain_pair'), {
+            'username': 'testuser',
+            'password': 'testpass123'
+        })
+
+    def test_login_token_carries_user_claims(self):
+        token = AccessToken(self.client.cookies['access_token'].value)
+        self.assertEqual(token['username'], 'testuser')
+        self.assertFalse(token['is_staff'])
+        self.assertFalse(token['is_superuser'])
+        self.assertTrue(token['is_active'])
+        self.assertEqual(token['token_version'], 0)
+
+    def test_me_skips_user_lookup_once_cached(self):
+        self.client.get(reverse('me'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('me'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user_id'], self.user.id)
+        self.assertEqual(response.data['username'], 'testuser')
+
+    def test_claims_user_loads_other_fields_on_access(self):
+        response = self.client.get(reverse('me'))
+        self.assertEqual(response.wsgi_request.user.email, 'test@example.com')
+
+    def test_claims_user_has_permission_flags_loaded(self):
+        response = self.client.get(reverse('me'))
+        user = response.wsgi_request.user
+        with self.assertNumQueries(0):
+            self.assertEqual((user.is_staff, user.is_superuser, user.is_active), (False, False, True))
+
+    def test_deleted_user_is_unauthorized(self):
+        self.client.get(reverse('me'))
+        self.user.delete()
+
+        response = self.client.get(reverse('me'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_bulk_deactivation_revokes_tokens(self):
+        self.client.get(reverse('me'))
+        auth_cache.update_auth_state(User.objects.filter(pk=self.user.pk), is_active=False)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_revokes_tokens(self):
+        self.client.get(reverse('me'))
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(reverse('me'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_permission_change_revokes_tokens_and_refresh(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.assertEqual(self.user.token_version, 1)
+
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token_refresh'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unrelated_update_keeps_tokens_valid(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.email = 'new@example.com'
+        user.save()
+        self.assertEqual(user.token_version, 0)
+        self.assertEqual(self.client.get(reverse('me')).status_code, status.HTTP_200_OK)
+
+    def test_refresh_keeps_claims(self):
+        response = self.client.post(reverse('token_refresh'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = AccessToken(self.client.cookies['access_token'].value)
+        self.assertEqual(token['username'], 'testuser')
@@ -9,6 +9,7 @@ from django.conf import settings
 import jwt
 from rest_framework.views import APIView
 from accounts.authentication import CookieJWTAuthentication
+from backend.async_views import AsyncAPIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 @extend_schema(
@@ -121,32 +122,30 @@ class LogoutView(generics.GenericAPIView):
     description="Retrieve authenticated user's profile information",
     responses={
         200: OpenApiResponse(description="User profile data"),
-        401: OpenApiResponse(description="Authentication credentials not provided or invalid token"),
-        404: OpenApiResponse(description="User not found")
+        401: OpenApiResponse(description="Authentication credentials not provided, invalid token or user not found")
     }
 )
 class MeView(APIView):
     permission_classes = [AllowAny]
+    authentication_classes = [CookieJWTAuthentication]
 
     def get(self, request):
-        access_token = request.COOKIES.get('access_token')
-        if not access_token:
+        user = request.user
+        if not user.is_authenticated:
             return Response({'detail': 'Authentication credentials were not provided.'}, status=status.HTTP_401_UNAUTHORIZED)
-        try:
-            decoded_token = jwt.decode(access_token, settings.SECRET_KEY, algorithms=['HS256'])
-            user_id = decoded_token.get('user_id')
-            user = User.objects.filter(id=user_id).first()
-            if not user:
-                return Response({'detail': 'User not found.'}, status=status.HTTP_404_NOT_FOUND)
-            return Response({
-                'username': user.username,
-                'user_id': user.id,
-                'is_staff': user.is_staff
-            })
-        except jwt.ExpiredSignatureError:
-            return Response({'detail': 'Token has expired.'}, status=status.HTTP_401_UNAUTHORIZED)
-        except jwt.InvalidTokenError:
-            return Response({'detail': 'Invalid token.'}, status=status.HTTP_401_UNAUTHORIZED)
+        return Response({
+            'username': user.username,
+            'user_id': user.id,
+            'is_staff': user.is_staff
+        })
+
+class AsyncMeView(AsyncAPIView, MeView):
+    """
+    MeView without a sync thread; the claims based user needs no query.
+    """
+
+    async def get(self, request):
+        return MeView.get(self, request)
 
 @extend_schema(
     summary="Manage user profile",
@@ -10,7 +10,8 @@ import {
   Divider,
   Paper,
   CircularProgress,
-  IconButton
+  IconButton,
+  Button
 } from '@mui/material';
 import DeleteIcon from '@mui/icons-material/Delete';
 import ArrowUpwardIcon from '@mui/icons-material/ArrowUpward';
@@ -38,23 +39,29 @@ const TransactionsList = ({ accountId, refreshTrigger, onTransactionDeleted }: T
   const [transactions, setTransactions] = useState<Transaction[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const getAuthHeaders = () => {
+    const accessToken = document.cookie
+      .split('; ')
+      .find(row => row.startsWith('access_token='))
+      ?.split('=')[1];
+    return {
+      'Authorization': accessToken ? `Bearer ${accessToken}` : '',
+    };
+  };
 
   useEffect(() => {
     const fetchTransactions = async () => {
       try {
         setLoading(true);
-        const accessToken = document.cookie
-          .split('; ')
-          .find(row => row.startsWith('access_token='))
-          ?.split('=')[1];
-        
         const response = await api.get(`/api/transactions/by_account/`, {
           params: { account_id: accountId },
-          headers: {
-            'Authorization': accessToken ? `Bearer ${accessToken}` : '',
-          }
+          headers: getAuthHeaders()
         });
-        setTransactions(response.data);
+        setTransactions(response.data.results);
+        setNextPage(response.data.next);
         setError('');
       } catch (err) {
         console.error('Failed to fetch transactions:', err);
@@ -67,6 +74,22 @@ const TransactionsList = ({ accountId, refreshTrigger, onTransactionDeleted }: T
     fetchTransactions();
   }, [accountId, refreshTrigger]);
 
+  const handleLoadMore = async () => {
+    if (!nextPage) return;
+
+    try {
+      setLoadingMore(true);
+      const response = await api.get(nextPage, { headers: getAuthHeaders() });
+      setTransactions(prevTransactions => [...prevTransactions, ...response.data.results]);
+      setNextPage(response.data.next);
+    } catch (err) {
+      console.error('Failed to fetch more transactions:', err);
+      setError('Failed to load transactions. Please try again.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDelete = async (transactionId: number) => {
     if (window.confirm('Are you sure you want to delete this transaction?')) {
       try {
@@ -232,6 +255,13 @@ const TransactionsList = ({ accountId, refreshTrigger, onTransactionDeleted }: T
           );
         })}
       </List>
+      {nextPage && (
+        <Box display="flex" justifyContent="center" p={2}>
+          <Button onClick={handleLoadMore} disabled={loadingMore}>
+            {loadingMore ? <CircularProgress size={20} /> : 'Load more'}
+          </Button>
+        </Box>
+      )}
     </Paper>
   );
 };
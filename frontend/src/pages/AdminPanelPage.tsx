@@ -46,6 +46,9 @@ interface User {
   is_staff: boolean;
   is_active: boolean;
   date_joined: string;
+  account_count?: number;
+  transaction_count?: number;
+  total_balance?: string;
 }
 
 interface UserAccount {
@@ -65,12 +68,33 @@ interface UserAccount {
   };
 }
 
+interface Page<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+const getAuthHeaders = () => {
+  const accessToken = document.cookie
+    .split('; ')
+    .find(row => row.startsWith('access_token='))
+    ?.split('=')[1];
+
+  return {
+    'Authorization': accessToken ? `Bearer ${accessToken}` : '',
+  };
+};
+
 const AdminPanelPage = () => {
   const navigate = useNavigate();
   const { logout, user } = useAuth();
   const [users, setUsers] = useState<User[]>([]);
   const [accounts, setAccounts] = useState<UserAccount[]>([]);
+  const [usersNext, setUsersNext] = useState<string | null>(null);
+  const [accountsNext, setAccountsNext] = useState<string | null>(null);
+  const [search, setSearch] = useState('');
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [selectedTab, setSelectedTab] = useState<'users' | 'accounts'>('users');
   
   const [createUserDialog, setCreateUserDialog] = useState(false);
@@ -101,24 +125,19 @@ const AdminPanelPage = () => {
     const fetchData = async () => {
       if (!user?.is_staff) return;
       
-      setIsLoading(true);
       try {
-        const accessToken = document.cookie
-          .split('; ')
-          .find(row => row.startsWith('access_token='))
-          ?.split('=')[1];
-
-        const headers = {
-          'Authorization': accessToken ? `Bearer ${accessToken}` : '',
-        };
+        const headers = getAuthHeaders();
+        const params = search.trim() ? { search: search.trim() } : {};
 
         const [usersResponse, accountsResponse] = await Promise.all([
-          api.get('/api/accounts/admin/users/', { headers }),
-          api.get('/api/accounts/admin/accounts/', { headers })
+          api.get<Page<User>>('/api/accounts/admin/users/', { headers, params }),
+          api.get<Page<UserAccount>>('/api/accounts/admin/accounts/', { headers, params })
         ]);
 
-        setUsers(usersResponse.data || []);
-        setAccounts(accountsResponse.data || []);
+        setUsers(usersResponse.data.results);
+        setUsersNext(usersResponse.data.next);
+        setAccounts(accountsResponse.data.results);
+        setAccountsNext(accountsResponse.data.next);
       } catch (error) {
         setError('Failed to load admin data');
       } finally {
@@ -126,8 +145,40 @@ const AdminPanelPage = () => {
       }
     };
 
-    fetchData();
-  }, [user]);
+    // Wait for the admin to stop typing before searching
+    const timeout = setTimeout(fetchData, search ? 300 : 0);
+    return () => clearTimeout(timeout);
+  }, [user, search]);
+
+  const loadMoreUsers = async () => {
+    if (!usersNext) return;
+
+    setIsLoadingMore(true);
+    try {
+      const response = await api.get<Page<User>>(usersNext, { headers: getAuthHeaders() });
+      setUsers(prev => [...prev, ...response.data.results]);
+      setUsersNext(response.data.next);
+    } catch (error) {
+      setError('Failed to load users');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
+  const loadMoreAccounts = async () => {
+    if (!accountsNext) return;
+
+    setIsLoadingMore(true);
+    try {
+      const response = await api.get<Page<UserAccount>>(accountsNext, { headers: getAuthHeaders() });
+      setAccounts(prev => [...prev, ...response.data.results]);
+      setAccountsNext(response.data.next);
+    } catch (error) {
+      setError('Failed to load accounts');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
 
   const handleLogout = async () => {
     await logout();
@@ -154,7 +205,7 @@ const AdminPanelPage = () => {
         }
       });
 
-      setUsers(prev => [...prev, response.data]);
+      setUsers(prev => [response.data, ...prev]);
       setCreateUserDialog(false);
       setNewUser({
         username: '',
@@ -219,6 +270,10 @@ const AdminPanelPage = () => {
       });
 
       setAccounts(prev => prev.filter(a => a.id !== selectedAccount.id));
+      setUsers(prev => prev.map(u => u.id === selectedAccount.user.id && u.account_count
+        ? { ...u, account_count: u.account_count - 1 }
+        : u
+      ));
       setDeleteAccountDialog(false);
       setSelectedAccount(null);
       setSuccess('Account deleted successfully');
@@ -335,6 +390,14 @@ const AdminPanelPage = () => {
           </Typography>
         </Box>
 
+        <TextField
+          fullWidth
+          label="Search by username or email"
+          value={search}
+          onChange={(e) => setSearch(e.target.value)}
+          sx={{ mb: 3 }}
+        />
+
         <Box mb={3} sx={{ display: { xs: 'block', md: 'none' } }}>
           <Button
             variant={selectedTab === 'users' ? 'contained' : 'outlined'}
@@ -392,6 +455,9 @@ const AdminPanelPage = () => {
                     <TableCell>Email</TableCell>
                     <TableCell>Role</TableCell>
                     <TableCell>Status</TableCell>
+                    <TableCell align="right">Accounts</TableCell>
+                    <TableCell align="right">Transactions</TableCell>
+                    <TableCell align="right">Total Balance</TableCell>
                     <TableCell>Actions</TableCell>
                   </TableRow>
                 </TableHead>
@@ -414,6 +480,9 @@ const AdminPanelPage = () => {
                           size="small"
                         />
                       </TableCell>
+                      <TableCell align="right">{userRow.account_count ?? 0}</TableCell>
+                      <TableCell align="right">{userRow.transaction_count ?? 0}</TableCell>
+                      <TableCell align="right">{userRow.total_balance ?? '0.00'}</TableCell>
                       <TableCell>
                         <IconButton
                           color="error"
@@ -431,6 +500,13 @@ const AdminPanelPage = () => {
                 </TableBody>
               </Table>
             </TableContainer>
+            {usersNext && (
+              <Box display="flex" justifyContent="center" mt={2}>
+                <Button variant="outlined" onClick={loadMoreUsers} disabled={isLoadingMore}>
+                  {isLoadingMore ? <CircularProgress size={20} /> : 'Load more'}
+                </Button>
+              </Box>
+            )}
           </Paper>
         )}
 
@@ -483,6 +559,13 @@ const AdminPanelPage = () => {
                 </TableBody>
               </Table>
             </TableContainer>
+            {accountsNext && (
+              <Box display="flex" justifyContent="center" mt={2}>
+                <Button variant="outlined" onClick={loadMoreAccounts} disabled={isLoadingMore}>
+                  {isLoadingMore ? <CircularProgress size={20} /> : 'Load more'}
+                </Button>
+              </Box>
+            )}
           </Paper>
         )}
 
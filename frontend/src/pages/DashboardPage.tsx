@@ -33,6 +33,7 @@ interface Account {
   id: number;
   name: string;
   balance: string;
+  opening_balance: string;
   currency: {
     code: string;
     symbol: string;
@@ -52,6 +53,17 @@ interface Transaction {
   frequency: string;
 }
 
+interface SummaryRow {
+  period: string;
+  category: number | null;
+  category_name: string | null;
+  is_income: boolean | null;
+  income: string;
+  expenses: string;
+  net: string;
+  count: number;
+}
+
 interface CategorySpending {
   category: string;
   amount: number;
@@ -154,46 +166,26 @@ const DashboardPage = () => {
           .find(row => row.startsWith('access_token='))
           ?.split('=')[1];
         
-        const response = await api.get(`/api/transactions/by_account/`, {
-          params: { account_id: selectedAccount.id },
+        const response = await api.get(`/api/transactions/summary/`, {
+          params: { account_id: selectedAccount.id, period: 'month' },
           headers: {
             'Authorization': accessToken ? `Bearer ${accessToken}` : '',
           }
         });
         
-        const transactions = response.data;
-        
-        let totalIncome = 0;
-        let totalExpenses = 0;
-        let biggestExpense = null;
-        let biggestIncome = null;
+        const totalIncome = parseFloat(response.data.totals.income);
+        const totalExpenses = Math.abs(parseFloat(response.data.totals.expenses));
         const categoryAmounts: {[key: string]: number} = {};
         const categoryColors: {[key: string]: string} = {};
         
-        transactions.forEach((transaction: Transaction) => {
-          const amount = parseFloat(transaction.amount);
-          
-          if (amount > 0) {
-            totalIncome += amount;
-            if (!biggestIncome || amount > parseFloat(biggestIncome.amount)) {
-              biggestIncome = transaction;
-            }
-          } else {
-            totalExpenses += Math.abs(amount);
-            if (!biggestExpense || Math.abs(amount) > Math.abs(parseFloat(biggestExpense.amount))) {
-              biggestExpense = transaction;
-            }
-          }
-          
-          const category = transaction.category_name || 'Uncategorized';
+        response.data.results.forEach((row: SummaryRow) => {
+          const category = row.category_name || 'Uncategorized';
           if (!categoryAmounts[category]) {
             categoryAmounts[category] = 0;
             const colorIndex = Object.keys(categoryAmounts).length % colors.length;
             categoryColors[category] = colors[colorIndex];
           }
-          if (amount < 0) {
-            categoryAmounts[category] += Math.abs(amount);
-          }
+          categoryAmounts[category] += Math.abs(parseFloat(row.expenses));
         });
         
         const categoryBreakdown: CategorySpending[] = Object.keys(categoryAmounts)
@@ -206,7 +198,9 @@ const DashboardPage = () => {
           .sort((a, b) => b.amount - a.amount);
         
         const currentBalance = totalIncome - totalExpenses;
-        const spendingLimit = parseFloat(selectedAccount.balance);
+        // balance already includes every transaction, so the limit is the
+        // opening balance the account was set up with
+        const spendingLimit = parseFloat(selectedAccount.opening_balance);
         const remainingBudget = spendingLimit - totalExpenses;
         
         setSpendingStats({
@@ -216,8 +210,8 @@ const DashboardPage = () => {
           currentBalance,
           spendingLimit,
           remainingBudget,
-          biggestExpense,
-          biggestIncome,
+          biggestExpense: response.data.largest_expense,
+          biggestIncome: response.data.largest_income,
           categoryBreakdown
         });
         
@@ -427,7 +421,7 @@ const DashboardPage = () => {
               <Box mb={2} textAlign="center">
                 <Typography variant="body2" color="text.secondary">Spending Limit</Typography>
                 <Typography variant="h6" component="div" sx={{ fontWeight: 'bold', fontSize: { xs: '1rem', sm: '1.25rem' } }}>
-                  {selectedAccount.balance}
+                  {selectedAccount.opening_balance}
                   <Box component="span" sx={{ display: { xs: 'none', sm: 'inline' } }}>
                     {selectedAccount.currency?.symbol}
                   </Box>